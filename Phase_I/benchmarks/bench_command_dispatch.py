@@ -0,0 +1,77 @@
+"""
+Micro-benchmark for console command parsing and dispatch.
+
+Measures, per command, the cost of tokenizing, resolving + binding arguments
+through the CommandRegistry, and full execution against TaskService, next to
+the previous uncompiled-regex parser.
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_command_dispatch [--count 200000]
+"""
+import argparse
+import re
+import time
+
+from src.cli.batch import NullWriter
+from src.cli.commands import tokenize
+from src.cli.console import ConsoleInterface
+from src.services.task_service import TaskService
+
+
+def legacy_parse(user_input: str) -> tuple:
+    """ConsoleInterface.parse_command as it was before the command layer."""
+    parts = user_input.strip().split()
+    if not parts:
+        return "", []
+    command = parts[0].lower()
+    args = parts[1:] if len(parts) > 1 else []
+    if command in ["add", "update"]:
+        pattern = r'"([^"]*)"|\'([^\']*)\'|(\S+)'
+        matches = re.findall(pattern, user_input)
+        all_parts = [next(filter(None, match)) for match in matches]
+        command = all_parts[0].lower()
+        args = all_parts[1:] if len(all_parts) > 1 else []
+    return command, args
+
+
+def make_script(count: int):
+    lines = []
+    for i in range(1, count + 1):
+        lines.append(f'add "Task {i}" "Description for task {i}"')
+        if i % 4 == 0:
+            lines.append(f'update {i} "Task {i} renamed"')
+            lines.append(f"complete {i - 1}")
+            lines.append(f"rm {i - 2}")
+    return lines[:count]
+
+
+def ns_per_line(func, lines) -> float:
+    started = time.perf_counter_ns()
+    for line in lines:
+        func(line)
+    return (time.perf_counter_ns() - started) / len(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    lines = make_script(args.count)
+    console = ConsoleInterface(TaskService(), output=NullWriter())
+    parsed = [console.parse_command(line) for line in lines]
+
+    legacy = ns_per_line(legacy_parse, lines)
+    tokens = ns_per_line(tokenize, lines)
+    bind = ns_per_line(lambda item: console.commands.resolve(item[0]).bind(item[1]), parsed)
+    full = ns_per_line(lambda line: console.execute_command(*console.parse_command(line)), lines)
+
+    print(f"Commands: {len(lines)}")
+    print(f"Legacy parse:              {legacy:8.0f} ns/command")
+    print(f"Tokenize:                  {tokens:8.0f} ns/command")
+    print(f"Resolve + bind:            {bind:8.0f} ns/command")
+    print(f"Parse + dispatch + execute:{full:8.0f} ns/command ({1e9 / full:,.0f} commands/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Throughput benchmark for ConcurrentTaskService.
+
+Runs N threads of mixed operations (adds, completes, updates, deletes and
+snapshot reads) and reports total operations per second for each thread
+count. On a GIL build of CPython throughput stays roughly flat as threads
+are added (the goal is correctness without lock convoys); on a free-threaded
+build the lock striping lets it scale.
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_concurrency [--threads 1 2 4 8] [--ops 20000]
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+
+from src.services.concurrent_task_service import ConcurrentTaskService
+
+
+def worker(task_service: ConcurrentTaskService, seed: int, ops: int):
+    rng = random.Random(seed)
+    for i in range(ops):
+        operation = rng.random()
+        if operation < 0.4:
+            task_service.add_task(f"Task {seed}-{i}")
+        else:
+            task_id = rng.randrange(1, task_service.next_id)
+            if operation < 0.6:
+                task_service.mark_task_complete(task_id)
+            elif operation < 0.75:
+                task_service.update_task(task_id, f"Renamed {task_id}")
+            elif operation < 0.9:
+                task_service.delete_task(task_id)
+            else:
+                task_service.get_task_by_id(task_id)
+        if i % 1000 == 0:
+            task_service.get_all_tasks()
+
+
+def run(thread_count: int, ops: int) -> float:
+    task_service = ConcurrentTaskService()
+    for i in range(1000):
+        task_service.add_task(f"Seed {i}")
+    threads = [threading.Thread(target=worker, args=(task_service, n, ops)) for n in range(thread_count)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    store = task_service.store
+    assert store.count(True) + store.count(False) == len(store)
+    return thread_count * ops / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--ops", type=int, default=20_000, help="operations per thread")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    baseline = None
+    for thread_count in args.threads:
+        throughput = run(thread_count, args.ops)
+        baseline = baseline or throughput
+        print(f"{thread_count:>3} threads: {throughput:>10,.0f} ops/s ({throughput / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
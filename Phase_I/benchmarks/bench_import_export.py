@@ -0,0 +1,72 @@
+"""
+Benchmark for streaming task import/export in Phase I.
+
+Exports N tasks to CSV and NDJSON, then imports each file with and without
+per-record validation. Imports into SQLite also report the peak memory
+allocated while importing, which stays flat because records are streamed
+in batches rather than loaded up front.
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_import_export [--count 200000]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.services.task_service import TaskService
+from src.services.task_transfer import read_records, write_records
+from src.storage.sqlite_store import SQLiteTaskStore
+
+
+def import_file(path: str, file_format: str, store=None, trusted: bool = False) -> float:
+    """Import a file into a fresh service and return the elapsed seconds."""
+    target = TaskService(store)
+    started = time.perf_counter()
+    with open(path, encoding="utf-8", newline="") as stream:
+        target.import_tasks(read_records(stream, file_format), keep_ids=True, trusted=trusted)
+    elapsed = time.perf_counter() - started
+    target.store.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    source = TaskService()
+    source.add_tasks((f"Task {i}", f"Description {i}" if i % 2 else None) for i in range(args.count))
+    for task_id in range(1, args.count + 1, 3):
+        source.mark_task_complete(task_id)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        def database(name: str) -> SQLiteTaskStore:
+            return SQLiteTaskStore(os.path.join(data_dir, name))
+
+        print(f"{'step':<32} {'rows/s':>10}")
+        for file_format in ("csv", "ndjson"):
+            path = os.path.join(data_dir, f"tasks.{file_format}")
+            started = time.perf_counter()
+            with open(path, "w", encoding="utf-8", newline="") as stream:
+                write_records(stream, source.export_tasks(), file_format)
+            steps = [("export", time.perf_counter() - started)]
+            for trusted in (False, True):
+                suffix = " trusted" if trusted else ""
+                steps.append(("import -> memory" + suffix, import_file(path, file_format, None, trusted)))
+                steps.append(("import -> sqlite" + suffix,
+                              import_file(path, file_format, database(f"{file_format}-{trusted}.db"), trusted)))
+            for label, elapsed in steps:
+                print(f"{file_format + ' ' + label:<32} {args.count / elapsed:>10,.0f}")
+
+            # Peak allocation while streaming into SQLite is bounded by the batch size
+            tracemalloc.start()
+            import_file(path, file_format, database(f"{file_format}-traced.db"), trusted=True)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{file_format + ' import -> sqlite peak memory':<32} {peak / 1e6:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Rendering benchmark for the Phase I `list` command.
+
+Compares the previous renderer (several print calls and strftime per task,
+after copying the whole list) with the streaming, chunked renderer, for a
+full listing and for the first page of pending tasks.
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_list_render [--count 100000]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from src.cli.batch import NullWriter
+from src.cli.console import ConsoleInterface
+from src.services.task_service import TaskService
+
+
+def legacy_display(task_service: TaskService):
+    """The list renderer as it was before streaming and chunked writes."""
+    tasks = task_service.get_all_tasks()
+    print("\nYour Tasks:")
+    print("-" * 80)
+    for task in tasks:
+        status = "✓" if task.completed else "○"
+        description = task.description if task.description else ""
+        print(f"{status} [{task.id}] {task.title}")
+        if description:
+            print(f"      Description: {description}")
+        print(f"      Created: {task.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        if task.updated_at != task.created_at:
+            print(f"      Updated: {task.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        print()
+    print("-" * 80)
+
+
+def timed_ms(func) -> float:
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    task_service = TaskService()
+    for i in range(args.count):
+        task_service.add_task(f"Task {i}", "Some notes" if i % 2 else None)
+        if i % 3 == 0:
+            task_service.mark_task_complete(i + 1)
+
+    sink = io.StringIO()
+    console = ConsoleInterface(task_service, output=sink)
+    with contextlib.redirect_stdout(sink):
+        legacy_ms = timed_ms(lambda: legacy_display(task_service))
+    sink.seek(0)
+    sink.truncate()
+    full_ms = timed_ms(lambda: console.display_tasks())
+
+    console.output = NullWriter()
+    page_ms = timed_ms(lambda: console.display_tasks(completed=False, limit=20))
+
+    print(f"Tasks: {args.count}")
+    print(f"Legacy full render (print/strftime): {legacy_ms:8.1f} ms")
+    print(f"Streaming full render:               {full_ms:8.1f} ms")
+    print(f"First page of 20 pending tasks:      {page_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
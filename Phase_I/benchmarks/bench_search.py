@@ -0,0 +1,78 @@
+"""
+Benchmark for the Phase I full-text search index.
+
+Builds an index over N generated tasks and reports build time, index memory,
+and query latency (p50/p95) for exact, multi-term and prefix queries next to
+a naive substring scan over every task.
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_search [--count 200000]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from src.services.task_service import TaskService
+
+BASE_WORDS = (
+    "buy call plan book fix clean write review send pay order pick renew cancel schedule "
+    "groceries mom dad dentist car report invoice email garden laundry tickets flight hotel "
+    "meeting budget taxes insurance passport presentation birthday gift dinner doctor gym"
+).split()
+# A few thousand distinct terms, closer to a real vocabulary than the base words alone
+WORDS = [word + suffix for word in BASE_WORDS for suffix in ("",) + tuple(map(str, range(100)))]
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def latency_ms(func, queries):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        func(query)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), percentile(samples, 0.95)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    task_service = TaskService()
+    for i in range(args.count):
+        title = " ".join(rng.choice(WORDS) for _ in range(3))
+        description = " ".join(rng.choice(WORDS) for _ in range(6)) if i % 2 else None
+        task_service.add_task(title, description)
+
+    started = time.perf_counter()
+    stats = task_service.search_stats()
+    build_s = time.perf_counter() - started
+
+    def naive(query):
+        needle = query.lower()
+        return [task for task in task_service.iter_tasks()
+                if needle in task.title.lower() or needle in (task.description or "").lower()]
+
+    exact = [rng.choice(WORDS) for _ in range(args.queries)]
+    multi = [" ".join(rng.sample(WORDS, 3)) for _ in range(args.queries)]
+    prefixes = [rng.choice(BASE_WORDS)[:4] for _ in range(args.queries)]
+
+    print(f"Tasks: {args.count}, index built in {build_s:.2f}s")
+    print(f"Index: {stats['terms']} terms, {stats['postings']} postings, "
+          f"~{stats['memory_bytes'] / 1e6:.1f} MB")
+    for label, queries in (("1 term", exact), ("3 terms", multi), ("4-char prefix", prefixes)):
+        p50, p95 = latency_ms(lambda query: task_service.search_tasks(query, 10), queries)
+        print(f"{label:<16} top-10  p50 {p50:8.2f} ms  p95 {p95:8.2f} ms")
+    p50, p95 = latency_ms(naive, exact[:5])
+    print(f"{'naive scan':<16}         p50 {p50:8.2f} ms  p95 {p95:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Startup benchmark for the memory-mapped snapshot format.
+
+Writes a snapshot of N tasks, then compares:
+- mapping it into a store (rows stay undecoded until touched)
+- decoding every row into Task objects up front
+and times streaming the first page and the whole list from the mapping.
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_snapshot_startup [--count 1000000]
+"""
+import argparse
+import itertools
+import os
+import tempfile
+import time
+
+from src.storage.memory_store import InMemoryTaskStore
+from src.storage.snapshot import MappedSnapshot, row_to_task, write_snapshot
+
+
+def make_rows(count: int):
+    now = time.time()
+    for i in range(1, count + 1):
+        yield (i, f"Task number {i}", "Some notes" if i % 3 else None, i % 4 == 0, now, now)
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, "snapshot-00000001.bin")
+        _, write_ms = timed(lambda: write_snapshot(path, make_rows(args.count), args.count, 1))
+        size_mb = os.path.getsize(path) / 1e6
+
+        def mapped_load():
+            snapshot = MappedSnapshot(path)
+            store = InMemoryTaskStore()
+            store.load_snapshot(snapshot)
+            return snapshot, store
+
+        def full_decode():
+            snapshot = MappedSnapshot(path)
+            try:
+                store = InMemoryTaskStore()
+                for row in snapshot.iter_rows():
+                    store.add(row_to_task(row))
+            finally:
+                snapshot.close()
+            return store
+
+        (snapshot, store), mapped_ms = timed(mapped_load)
+        try:
+            _, page_ms = timed(lambda: [task.title for task in itertools.islice(store.iter_tasks(), 50)])
+            _, stream_ms = timed(lambda: sum(1 for task in store.iter_tasks() if task.completed))
+        finally:
+            snapshot.close()
+        _, decode_ms = timed(full_decode)
+
+    print(f"Snapshot: {args.count} tasks, {size_mb:.1f} MB, written in {write_ms:.0f} ms")
+    print(f"Mapped startup (lazy rows):    {mapped_ms:8.0f} ms")
+    print(f"Full decode into Task objects: {decode_ms:8.0f} ms")
+    print(f"First 50-row page from map:    {page_ms:8.2f} ms")
+    print(f"Stream every row from map:     {stream_ms:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark for sorted listing in Phase I.
+
+Builds N tasks, then compares the first page of `list --sort title --pending`
+served from the sorted index with a full sort of the pending tasks, and
+reports index build time and the cost of keeping the index up to date.
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_sorted_list [--count 1000000]
+"""
+import argparse
+import random
+import time
+
+from src.services.task_service import TaskService
+
+WORDS = "buy call plan book fix clean write review send pay order pick renew cancel schedule".split()
+
+
+def best_ms(func, repeats: int) -> float:
+    """Return the best of `repeats` runs of `func` in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=20, help="page size")
+    parser.add_argument("--ops", type=int, default=10_000, help="updates/completions timed on the index")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    task_service = TaskService()
+    for i in range(args.count):
+        task_service.add_task(f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}")
+        if i % 3 == 0:
+            task_service.mark_task_complete(i + 1)
+
+    started = time.perf_counter()
+    task_service.sorted_index("title")
+    build_s = time.perf_counter() - started
+
+    def indexed():
+        return list(task_service.iter_sorted_tasks("title", False, 0, args.page))
+
+    def full_sort():
+        pending = sorted(task_service.iter_tasks(completed=False), key=lambda task: (task.title.casefold(), task.id))
+        return pending[:args.page]
+
+    assert [task.id for task in indexed()] == [task.id for task in full_sort()]
+    indexed_ms = best_ms(indexed, 20)
+    sort_ms = best_ms(full_sort, 3)
+    deep_ms = best_ms(lambda: list(task_service.iter_sorted_tasks("title", None, args.count // 2, args.page)), 3)
+
+    ids = rng.sample(range(1, args.count + 1), args.ops)
+    started = time.perf_counter()
+    for task_id in ids:
+        task_service.update_task(task_id, f"{rng.choice(WORDS)} renamed {task_id}")
+    update_us = (time.perf_counter() - started) / len(ids) * 1e6
+    started = time.perf_counter()
+    for task_id in ids:
+        task_service.mark_task_incomplete(task_id)
+    toggle_us = (time.perf_counter() - started) / len(ids) * 1e6
+
+    print(f"Tasks: {args.count}, title index built in {build_s:.2f}s")
+    print(f"first page, pending by title:  index {indexed_ms:8.3f} ms   full sort {sort_ms:9.1f} ms "
+          f"({sort_ms / indexed_ms:,.0f}x)")
+    print(f"page at offset {args.count // 2:,} (merged, all tasks): {deep_ms:8.1f} ms")
+    print(f"indexed update {update_us:.1f} us/op, status change {toggle_us:.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Comparative benchmark for the Phase I storage engines.
+
+For each size, bulk-adds N tasks through TaskService, then measures a full
+list, a first-page filtered list, and random updates, completions and
+deletes on the in-memory engine and on an SQLite database file (WAL).
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_storage_engines [--sizes 10000 100000 1000000]
+"""
+import argparse
+import itertools
+import os
+import random
+import tempfile
+import time
+
+from src.services.task_service import TaskService
+from src.storage.memory_store import InMemoryTaskStore
+from src.storage.sqlite_store import SQLiteTaskStore
+
+
+def timed(func) -> float:
+    """Run `func` once and return the elapsed seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_engine(store, size: int, ops: int):
+    """Return (adds/s, list s, first page ms, update us, complete us, delete us)."""
+    task_service = TaskService(store)
+    entries = ((f"Task {i}", f"Description {i}" if i % 2 else None) for i in range(size))
+    add_s = timed(lambda: task_service.add_tasks(entries))
+    list_s = timed(lambda: sum(1 for _ in task_service.iter_tasks()))
+    page_s = timed(lambda: list(itertools.islice(task_service.iter_tasks(completed=False), 20)))
+
+    ids = random.Random(7).sample(range(1, size + 1), min(ops, size))
+    update_s = timed(lambda: [task_service.update_task(task_id, f"Renamed {task_id}") for task_id in ids])
+    complete_s = timed(lambda: [task_service.mark_task_complete(task_id) for task_id in ids])
+    delete_s = timed(lambda: [task_service.delete_task(task_id) for task_id in ids])
+    assert task_service.count_tasks() == size - len(ids)
+    store.close()
+    per_op = 1e6 / len(ids)
+    return size / add_s, list_s, page_s * 1000, update_s * per_op, complete_s * per_op, delete_s * per_op
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=5_000, help="updates/completions/deletes per size")
+    args = parser.parse_args()
+
+    print(f"{'engine':<8} {'tasks':>9} {'adds/s':>10} {'list s':>8} {'page ms':>8} "
+          f"{'update us':>10} {'complete us':>12} {'delete us':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as data_dir:
+            engines = (("memory", InMemoryTaskStore()),
+                       ("sqlite", SQLiteTaskStore(os.path.join(data_dir, "tasks.db"))))
+            for name, store in engines:
+                adds, list_s, page_ms, update_us, complete_us, delete_us = run_engine(store, size, args.ops)
+                print(f"{name:<8} {size:>9} {adds:>10,.0f} {list_s:>8.3f} {page_ms:>8.3f} "
+                      f"{update_us:>10.1f} {complete_us:>12.1f} {delete_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Memory benchmark for the Phase I Task representation.
+
+Uses tracemalloc to compare bytes-per-task of the slotted Task against the
+original __dict__-based dataclass, both as bare objects and when stored
+through TaskService (which adds the store's index overhead).
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_task_memory [--count 200000]
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.models.task import Task
+from src.services.task_service import TaskService
+
+
+@dataclass
+class LegacyTask:
+    """The Task dataclass as it was before __slots__ were introduced."""
+    id: int
+    title: str
+    description: Optional[str] = None
+    completed: bool = False
+    created_at: datetime = None
+    updated_at: datetime = None
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+
+
+def make_title(i: int) -> str:
+    """Build a fresh title string; half of them repeat one of 100 common titles."""
+    return f"Daily chore {i % 100}" if i % 2 else f"Task number {i}"
+
+
+def measure(build, count: int) -> float:
+    """Return traced bytes per task retained by `build(count)`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    retained = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del retained
+    return (after - before) / count
+
+
+def build_legacy(count: int):
+    return [LegacyTask(id=i, title=make_title(i), description="notes") for i in range(count)]
+
+
+def build_slotted(count: int):
+    return [Task(id=i, title=make_title(i), description="notes") for i in range(count)]
+
+
+def build_service(count: int):
+    task_service = TaskService()
+    for i in range(count):
+        task_service.add_task(make_title(i), "notes")
+    return task_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    legacy = measure(build_legacy, args.count)
+    slotted = measure(build_slotted, args.count)
+    service = measure(build_service, args.count)
+
+    print(f"Tasks measured:             {args.count}")
+    print(f"Legacy dataclass list:      {legacy:8.1f} bytes/task")
+    print(f"Slotted Task list:          {slotted:8.1f} bytes/task ({slotted / legacy:.0%} of legacy)")
+    print(f"TaskService (with indexes): {service:8.1f} bytes/task")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark for the indexed Phase I task store.
+
+Shows that lookup and delete cost stays flat as the task count grows,
+compared with the previous list-scan implementation.
+
+Run from the Phase_I directory:
+    python -m benchmarks.bench_task_store [--sizes 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+
+from src.services.task_service import TaskService
+
+
+def build_service(size: int) -> TaskService:
+    """Create a task service holding `size` tasks."""
+    task_service = TaskService()
+    for i in range(size):
+        task_service.add_task(f"Task {i}")
+    return task_service
+
+
+def time_per_op(func, args) -> float:
+    """Return the mean cost of `func(arg)` in nanoseconds."""
+    start = time.perf_counter_ns()
+    for arg in args:
+        func(arg)
+    return (time.perf_counter_ns() - start) / len(args)
+
+
+def list_scan_lookup(tasks, task_id):
+    """Lookup as implemented before the store existed (linear scan)."""
+    for task in tasks:
+        if task.id == task_id:
+            return task
+    return None
+
+
+def run(sizes, ops: int):
+    print(f"{'tasks':>10} {'lookup ns/op':>14} {'delete ns/op':>14} {'list-scan lookup ns/op':>24}")
+    for size in sizes:
+        task_service = build_service(size)
+        ids = random.sample(range(1, size + 1), min(ops, size))
+
+        lookup = time_per_op(task_service.get_task_by_id, ids)
+        tasks = task_service.get_all_tasks()
+        scan = time_per_op(lambda task_id: list_scan_lookup(tasks, task_id), ids[:20])
+        delete = time_per_op(task_service.delete_task, ids)
+
+        assert len(task_service.store) == size - len(ids)
+        print(f"{size:>10} {lookup:>14.0f} {delete:>14.0f} {scan:>24.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=10_000, help="lookups/deletes per size")
+    args = parser.parse_args()
+    run(args.sizes, args.ops)
+
+
+if __name__ == "__main__":
+    main()
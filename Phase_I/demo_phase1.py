@@ -1,16 +1,20 @@
 """
 Demo script showing Phase I Todo Console App in action
+
+    python demo_phase1.py [--storage memory|sqlite] [--db FILE]
 """
+import argparse
 from src.services.task_service import TaskService
 from src.cli.console import ConsoleInterface
+from src.main import add_storage_arguments, open_store
 
 
-def demo():
+def demo(store=None):
     print("🚀 Phase I Todo Console App Demo")
     print("="*40)
 
     # Create a fresh task service for the demo
-    task_service = TaskService()
+    task_service = TaskService(store)
     console = ConsoleInterface(task_service)
 
     # Simulate some user interactions
@@ -41,4 +45,10 @@ def demo():
 
 
 if __name__ == "__main__":
-    demo()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Phase I Todo Console App demo")
+    add_storage_arguments(parser, default_db=":memory:")
+    store = open_store(parser.parse_args())
+    try:
+        demo(store)
+    finally:
+        store.close()
@@ -0,0 +1,65 @@
+import io
+import time
+from dataclasses import dataclass
+from typing import Iterable, TextIO
+from ..services.task_service import TaskService
+from .console import ConsoleInterface
+
+
+@dataclass
+class BatchSummary:
+    """Totals reported after a batch run."""
+    commands: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Commands executed per second."""
+        return self.commands / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class NullWriter(io.TextIOBase):
+    """Text stream that discards everything written to it."""
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+class BatchRunner:
+    """
+    Runs console commands non-interactively from a script or piped stdin:
+    - Lines are consumed lazily, so memory does not grow with script length
+    - No prompts or welcome banner; blank lines and # comments are skipped
+    - Per-command output goes through the (buffered) output stream, or is
+      discarded when echo is off; the summary is always written
+    """
+
+    def __init__(self, task_service: TaskService, output: TextIO, echo: bool = True):
+        """Create a runner that writes to `output`."""
+        self.output = output
+        self.console = ConsoleInterface(task_service, output=output if echo else NullWriter())
+
+    def run(self, lines: Iterable[str]) -> BatchSummary:
+        """Execute every command in `lines` until the input ends or `quit` is read."""
+        console = self.console
+        summary = BatchSummary()
+        started = time.perf_counter()
+
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            summary.commands += 1
+            command, args = console.parse_command(line)
+            if not console.execute_command(command, args):
+                break
+
+        summary.elapsed = time.perf_counter() - started
+        summary.errors = console.error_count
+        self.output.write(
+            f"Processed {summary.commands} commands ({summary.errors} errors) "
+            f"in {summary.elapsed:.2f}s ({summary.rate:,.0f} commands/s)\n"
+        )
+        self.output.flush()
+        return summary
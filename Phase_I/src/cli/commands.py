@@ -0,0 +1,200 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# A token is a double- or single-quoted string (backslash escapes allowed,
+# an unterminated quote runs to the end of the line) or a bare word.
+TOKEN_PATTERN = re.compile(
+    r'"((?:[^"\\]|\\.)*)(?:"|$)'
+    r"|'((?:[^'\\]|\\.)*)(?:'|$)"
+    r"|(\S+)"
+)
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+
+
+def tokenize(line: str) -> List[str]:
+    """Split a command line into tokens, honouring quotes and backslash escapes."""
+    if '"' not in line and "'" not in line:
+        return line.split()
+    tokens = []
+    for double_quoted, single_quoted, bare in TOKEN_PATTERN.findall(line):
+        if bare:
+            tokens.append(bare)
+        else:
+            text = double_quoted or single_quoted
+            tokens.append(ESCAPE_PATTERN.sub(r"\1", text) if "\\" in text else text)
+    return tokens
+
+
+class CommandError(ValueError):
+    """Raised when a command name or its arguments cannot be resolved."""
+
+
+def positive_int(value: str) -> int:
+    """Parse an integer that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise ValueError("must be at least 1")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """Parse an integer that must be at least 0."""
+    number = int(value)
+    if number < 0:
+        raise ValueError("must be at least 0")
+    return number
+
+
+def choice(*values: str) -> Callable[[str], str]:
+    """Build a validator accepting only one of `values`."""
+    def parse(value: str) -> str:
+        if value not in values:
+            raise ValueError(f"must be one of {', '.join(values)}")
+        return value
+    return parse
+
+
+@dataclass(frozen=True)
+class Argument:
+    """
+    A positional argument: converted with `type`, reported with `error` on
+    failure. A variadic argument must come last and collects the remaining
+    tokens into a list.
+    """
+    name: str
+    type: Callable[[str], Any] = str
+    required: bool = True
+    error: Optional[str] = None
+    variadic: bool = False
+
+
+@dataclass(frozen=True)
+class Option:
+    """
+    A --flag. With a `type` it consumes the next token as its value (shown
+    as `metavar` in usage); without one it stores `value` when present.
+    """
+    flag: str
+    dest: str
+    type: Optional[Callable[[str], Any]] = None
+    value: Any = True
+    metavar: str = "N"
+
+    @property
+    def usage(self) -> str:
+        return f"[{self.flag} {self.metavar}]" if self.type else f"[{self.flag}]"
+
+
+@dataclass
+class Command:
+    """A console command: its handler plus the argument schema used to bind tokens."""
+    name: str
+    handler: Callable[..., bool]
+    summary: str
+    arguments: Tuple[Argument, ...] = ()
+    options: Tuple[Option, ...] = ()
+    aliases: Tuple[str, ...] = ()
+    usage: str = ""
+    _options_by_flag: Dict[str, Option] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._options_by_flag = {option.flag: option for option in self.options}
+        if not self.usage:
+            parts = [self.name]
+            parts += [f"<{a.name}>" if a.required else f"[{a.name}]" for a in self.arguments]
+            parts += [option.usage for option in self.options]
+            self.usage = " ".join(parts)
+
+    def bind(self, args: List[str]) -> Dict[str, Any]:
+        """Convert raw tokens into handler keyword arguments, or raise CommandError."""
+        values: Dict[str, Any] = {}
+        positional = []
+        options = self._options_by_flag
+        index = 0
+        while index < len(args):
+            token = args[index]
+            option = options.get(token) if options else None
+            if option is None:
+                positional.append(token)
+            elif option.type is None:
+                values[option.dest] = option.value
+            else:
+                index += 1
+                if index == len(args):
+                    raise CommandError(f"{token} needs a value. Usage: {self.usage}")
+                try:
+                    values[option.dest] = option.type(args[index])
+                except ValueError as e:
+                    raise CommandError(f"Invalid value for {token}: {e}. Usage: {self.usage}")
+            index += 1
+
+        variadic = bool(self.arguments) and self.arguments[-1].variadic
+        if len(positional) > len(self.arguments) and not variadic:
+            raise CommandError(f"Usage: {self.usage}")
+        for position, argument in enumerate(self.arguments):
+            if position >= len(positional):
+                if argument.required:
+                    raise CommandError(f"Usage: {self.usage}")
+                break
+            try:
+                if argument.variadic:
+                    values[argument.name] = [argument.type(token) for token in positional[position:]]
+                else:
+                    values[argument.name] = argument.type(positional[position])
+            except ValueError as e:
+                raise CommandError(argument.error or f"Invalid {argument.name}: {e}")
+        return values
+
+
+class CommandRegistry:
+    """
+    Maps command names, aliases and unique abbreviations to commands.
+    The lookup table is rebuilt on registration, so resolving is one dict hit.
+    """
+
+    def __init__(self):
+        self._commands: Dict[str, Command] = {}
+        self._lookup: Dict[str, Command] = {}
+        self._ambiguous: Dict[str, List[str]] = {}
+
+    def __iter__(self) -> Iterator[Command]:
+        return iter(self._commands.values())
+
+    def register(self, command: Command) -> Command:
+        """Add a command and refresh the name/alias/prefix lookup table."""
+        self._commands[command.name] = command
+        self._rebuild()
+        return command
+
+    def resolve(self, name: str) -> Command:
+        """Find the command for a name, alias or unique prefix."""
+        command = self._lookup.get(name)
+        if command is not None:
+            return command
+        if name in self._ambiguous:
+            raise CommandError(f"Ambiguous command: {name} (could be {', '.join(self._ambiguous[name])})")
+        raise CommandError(f"Unknown command: {name}. Type 'help' for available commands.")
+
+    def _rebuild(self):
+        exact: Dict[str, Command] = {}
+        prefixes: Dict[str, Set[str]] = {}
+        for command in self._commands.values():
+            for name in (command.name,) + command.aliases:
+                exact[name] = command
+                for end in range(1, len(name)):
+                    prefixes.setdefault(name[:end], set()).add(command.name)
+
+        lookup = {}
+        ambiguous = {}
+        for prefix, names in prefixes.items():
+            if len(names) == 1:
+                lookup[prefix] = self._commands[next(iter(names))]
+            else:
+                ambiguous[prefix] = sorted(names)
+        # Full names and aliases always win over abbreviations
+        lookup.update(exact)
+        for name in exact:
+            ambiguous.pop(name, None)
+        self._lookup = lookup
+        self._ambiguous = ambiguous
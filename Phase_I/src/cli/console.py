@@ -1,231 +1,383 @@
-import re
-from typing import List
+import itertools
+import sys
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, List, Optional, TextIO
+from ..services.sorted_index import SORT_FIELDS
 from ..services.task_service import TaskService
+from ..services.task_transfer import FORMATS, detect_format, read_records, with_progress, write_records
+from .commands import (
+    Argument, Command, CommandError, CommandRegistry, Option, choice, non_negative_int, positive_int,
+    tokenize
+)
+
+# Tasks rendered per write when listing
+LIST_CHUNK_ROWS = 200
+# Page size used by `list --page N` when no --limit is given
+DEFAULT_PAGE_SIZE = 20
+# Rows between progress lines during import/export
+PROGRESS_ROWS = 100_000
+
+HELP_EXAMPLES = """
+Examples:
+  add "Buy groceries" "Milk, eggs, bread"
+  list
+  list --pending --page 2
+  list --sort updated_at --desc
+  search grocer milk
+  export tasks.csv
+  import tasks.ndjson --keep-ids
+  update 1 "Buy groceries and fruits" "Milk, eggs, bread, apples"
+  delete 1
+  complete 1
+"""
+
+
+@lru_cache(maxsize=1024)
+def _format_second(value: datetime) -> str:
+    return value.isoformat(" ", "seconds")
+
+
+def format_timestamp(value: datetime) -> str:
+    """
+    Format a timestamp for display. Only whole seconds are shown, so the cache is keyed on the
+    second: tasks written together share an entry even though their microseconds differ.
+    """
+    return _format_second(value.replace(microsecond=0))
 
 
 class ConsoleInterface:
     """
     Handles user input/output:
-    - Command parsing
+    - Command parsing and dispatch (through a CommandRegistry)
     - User prompts
     - Display formatting
     - Error messages
     - Help system
     """
 
-    def __init__(self, task_service: TaskService):
-        """Initialize the console interface with a task service."""
+    def __init__(self, task_service: TaskService, output: TextIO = None):
+        """Initialize the console interface with a task service and output stream."""
         self.task_service = task_service
+        self.output = output if output is not None else sys.stdout
         self.running = True
+        self.error_count = 0
+        self.commands = self.build_commands()
+
+    def echo(self, message: str = ""):
+        """Write a line of output."""
+        self.output.write(message + "\n")
+
+    def report_error(self, message: str):
+        """Write an error message and count it."""
+        self.error_count += 1
+        self.echo(message)
 
     def display_help(self):
         """Display available commands and their usage."""
-        help_text = """
-Available Commands:
-  add "task title" "optional description"    - Add a new task
-  list                                      - Display all tasks
-  update <id> "new title" "new description" - Update a task
-  delete <id>                               - Delete a task
-  complete <id>                             - Mark task as complete
-  incomplete <id>                           - Mark task as incomplete
-  help                                      - Show this help message
-  quit/exit                                 - Exit the application
-
-Examples:
-  add "Buy groceries" "Milk, eggs, bread"
-  list
-  update 1 "Buy groceries and fruits" "Milk, eggs, bread, apples"
-  delete 1
-  complete 1
+        lines = ["", "Available Commands:"]
+        for command in self.commands:
+            lines.append(f"  {command.usage:<42}- {command.summary}")
+            if command.options:
+                lines.append("    " + " ".join(option.usage for option in command.options))
+        aliases = [f"{alias} ({command.name})" for command in self.commands for alias in command.aliases]
+        lines.append("")
+        lines.append(f"Aliases: {', '.join(aliases)}")
+        lines.append("Any unambiguous prefix of a command also works (e.g. 'comp 1').")
+        lines.append(HELP_EXAMPLES)
+        self.echo("\n".join(lines))
+
+    def display_tasks(self, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0,
+                      sort: Optional[str] = None, descending: bool = False):
         """
-        print(help_text)
-
-    def display_tasks(self):
-        """Display all tasks in a formatted way."""
-        tasks = self.task_service.get_all_tasks()
-
-        if not tasks:
-            print("No tasks found.")
-            return
+        Display tasks in a formatted way, streaming them from the store
+        (or from a sorted index when `sort` names a field).
+        Rows are rendered in chunks with one write per chunk.
+        """
+        total = self.task_service.count_tasks(completed)
+        if sort is not None:
+            tasks = self.task_service.iter_sorted_tasks(sort, completed, offset, limit, descending)
+        else:
+            tasks = itertools.islice(self.task_service.iter_tasks(completed), offset,
+                                     None if limit is None else offset + limit)
 
-        print("\nYour Tasks:")
-        print("-" * 80)
+        shown = 0
+        chunk = ["\nYour Tasks:", "-" * 80]
         for task in tasks:
-            status = "✓" if task.completed else "○"
-            description = task.description if task.description else ""
-            print(f"{status} [{task.id}] {task.title}")
-            if description:
-                print(f"      Description: {description}")
-            print(f"      Created: {task.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            if task.updated_at != task.created_at:
-                print(f"      Updated: {task.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            print()
-        print("-" * 80)
+            chunk.append(self.format_task(task))
+            shown += 1
+            if len(chunk) >= LIST_CHUNK_ROWS:
+                self.output.write("\n".join(chunk) + "\n")
+                chunk = []
+
+        if shown == 0:
+            self.echo("No tasks found.")
+            return
+        chunk.append("-" * 80)
+        if shown < total:
+            chunk.append(f"Showing {offset + 1}-{offset + shown} of {total} tasks")
+        self.output.write("\n".join(chunk) + "\n")
+
+    @staticmethod
+    def format_task(task) -> str:
+        """Render one task as a block of lines (including the trailing blank line)."""
+        status = "✓" if task.completed else "○"
+        lines = [f"{status} [{task.id}] {task.title}"]
+        if task.description:
+            lines.append(f"      Description: {task.description}")
+        created_at = task.created_at
+        lines.append(f"      Created: {format_timestamp(created_at)}")
+        updated_at = task.updated_at
+        if updated_at != created_at:
+            lines.append(f"      Updated: {format_timestamp(updated_at)}")
+        lines.append("")
+        return "\n".join(lines)
+
+    def build_commands(self) -> CommandRegistry:
+        """Declare every console command with its argument schema."""
+        task_id = Argument("task_id", int, error="Task ID must be a number")
+        registry = CommandRegistry()
+        registry.register(Command(
+            "add", self.handle_add, "Add a new task",
+            arguments=(Argument("title"), Argument("description", required=False)),
+            usage='add "task title" "optional description"'
+        ))
+        registry.register(Command(
+            "list", self.handle_list, "Display tasks",
+            options=(
+                Option("--pending", "completed", value=False),
+                Option("--done", "completed", value=True),
+                Option("--limit", "limit", positive_int),
+                Option("--offset", "offset", non_negative_int),
+                Option("--page", "page", positive_int),
+                Option("--sort", "sort", choice(*SORT_FIELDS), metavar="FIELD"),
+                Option("--desc", "descending"),
+            ),
+            aliases=("ls",),
+            usage="list"
+        ))
+        registry.register(Command(
+            "update", self.handle_update, "Update a task",
+            arguments=(task_id, Argument("title"), Argument("description", required=False)),
+            usage='update <id> "new title" "new description"'
+        ))
+        registry.register(Command(
+            "delete", self.handle_delete, "Delete a task",
+            arguments=(task_id,), aliases=("rm",), usage="delete <id>"
+        ))
+        registry.register(Command(
+            "complete", self.handle_complete, "Mark task as complete",
+            arguments=(task_id,), aliases=("done",), usage="complete <id>"
+        ))
+        registry.register(Command(
+            "incomplete", self.handle_incomplete, "Mark task as incomplete",
+            arguments=(task_id,), aliases=("undo",), usage="incomplete <id>"
+        ))
+        registry.register(Command(
+            "search", self.handle_search, "Full-text search titles/descriptions",
+            arguments=(Argument("terms", required=False, variadic=True),),
+            options=(
+                Option("--limit", "limit", positive_int),
+                Option("--stats", "stats"),
+            ),
+            aliases=("find",),
+            usage="search <terms>"
+        ))
+        file_format = Option("--format", "file_format", choice(*FORMATS), metavar="FORMAT")
+        registry.register(Command(
+            "import", self.handle_import, "Import tasks from a CSV/NDJSON file",
+            arguments=(Argument("path"),),
+            options=(file_format, Option("--keep-ids", "keep_ids"), Option("--trusted", "trusted")),
+            usage="import <file>"
+        ))
+        registry.register(Command(
+            "export", self.handle_export, "Export tasks to a CSV/NDJSON file",
+            arguments=(Argument("path"),),
+            options=(
+                file_format,
+                Option("--pending", "completed", value=False),
+                Option("--done", "completed", value=True),
+            ),
+            usage="export <file>"
+        ))
+        registry.register(Command(
+            "help", self.handle_help, "Show this help message", aliases=("?",)
+        ))
+        registry.register(Command(
+            "quit", self.handle_exit, "Exit the application", aliases=("exit",), usage="quit/exit"
+        ))
+        return registry
 
     def parse_command(self, user_input: str) -> tuple:
         """Parse user input into command and arguments."""
-        # Remove extra whitespace and split into parts
-        parts = user_input.strip().split()
-        if not parts:
+        tokens = tokenize(user_input)
+        if not tokens:
             return "", []
-
-        command = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
-
-        # Special handling for commands with quoted strings
-        if command in ["add", "update"]:
-            # Use regex to extract quoted strings
-            pattern = r'"([^"]*)"|\'([^\']*)\'|(\S+)'
-            matches = re.findall(pattern, user_input)
-            # Each match is a tuple of (double_quoted, single_quoted, unquoted), get the non-empty one
-            all_parts = [next(filter(None, match)) for match in matches]
-            command = all_parts[0].lower()
-            args = all_parts[1:] if len(all_parts) > 1 else []
-
-        return command, args
+        return tokens[0].lower(), tokens[1:]
 
     def execute_command(self, command: str, args: List[str]) -> bool:
-        """Execute a command with given arguments."""
+        """Resolve a command through the registry, bind its arguments and run it."""
         try:
-            if command == "add":
-                return self.handle_add(args)
-            elif command == "list":
-                self.handle_list()
-                return True
-            elif command == "update":
-                return self.handle_update(args)
-            elif command == "delete":
-                return self.handle_delete(args)
-            elif command == "complete":
-                return self.handle_complete(args)
-            elif command == "incomplete":
-                return self.handle_incomplete(args)
-            elif command == "help":
-                self.display_help()
-                return True
-            elif command in ["quit", "exit"]:
-                return self.handle_exit()
-            else:
-                print(f"Unknown command: {command}. Type 'help' for available commands.")
-                return True
+            spec = self.commands.resolve(command)
+            values = spec.bind(args)
+        except CommandError as e:
+            self.report_error(str(e))
+            return True
+
+        try:
+            return spec.handler(**values)
         except Exception as e:
-            print(f"Error executing command: {str(e)}")
+            self.report_error(f"Error executing command: {str(e)}")
             return True  # Continue running even if there's an error
 
-    def handle_add(self, args: List[str]) -> bool:
+    def handle_add(self, title: str, description: Optional[str] = None) -> bool:
         """Handle the add command."""
-        if len(args) < 1:
-            print("Usage: add \"task title\" \"optional description\"")
-            return True
-
-        title = args[0]
-        description = args[1] if len(args) > 1 else None
-
         try:
             task = self.task_service.add_task(title, description)
-            print(f"Task added successfully! ID: {task.id}, Title: {task.title}")
+            self.echo(f"Task added successfully! ID: {task.id}, Title: {task.title}")
         except ValueError as e:
-            print(f"Error adding task: {str(e)}")
+            self.report_error(f"Error adding task: {str(e)}")
 
         return True
 
-    def handle_list(self):
+    def handle_list(self, completed: Optional[bool] = None, limit: Optional[int] = None,
+                    offset: int = 0, page: Optional[int] = None, sort: Optional[str] = None,
+                    descending: bool = False) -> bool:
         """Handle the list command."""
-        self.display_tasks()
+        if page is not None:
+            if limit is None:
+                limit = DEFAULT_PAGE_SIZE
+            offset += (page - 1) * limit
+        if descending and sort is None:
+            sort = "created_at"
+        self.display_tasks(completed, limit, offset, sort, descending)
+        return True
 
-    def handle_update(self, args: List[str]) -> bool:
+    def handle_update(self, task_id: int, title: str, description: Optional[str] = None) -> bool:
         """Handle the update command."""
-        if len(args) < 2:
-            print("Usage: update <id> \"new title\" \"optional new description\"")
-            return True
-
-        try:
-            task_id = int(args[0])
-        except ValueError:
-            print("Task ID must be a number")
-            return True
-
-        new_title = args[1]
-        new_description = args[2] if len(args) > 2 else None
-
-        task = self.task_service.update_task(task_id, new_title, new_description)
+        task = self.task_service.update_task(task_id, title, description)
         if task:
-            print(f"Task {task_id} updated successfully!")
+            self.echo(f"Task {task_id} updated successfully!")
         else:
-            print(f"Task with ID {task_id} not found")
+            self.report_error(f"Task with ID {task_id} not found")
 
         return True
 
-    def handle_delete(self, args: List[str]) -> bool:
+    def handle_delete(self, task_id: int) -> bool:
         """Handle the delete command."""
-        if len(args) < 1:
-            print("Usage: delete <id>")
-            return True
-
-        try:
-            task_id = int(args[0])
-        except ValueError:
-            print("Task ID must be a number")
-            return True
-
         success = self.task_service.delete_task(task_id)
         if success:
-            print(f"Task {task_id} deleted successfully!")
+            self.echo(f"Task {task_id} deleted successfully!")
         else:
-            print(f"Task with ID {task_id} not found")
+            self.report_error(f"Task with ID {task_id} not found")
 
         return True
 
-    def handle_complete(self, args: List[str]) -> bool:
+    def handle_complete(self, task_id: int) -> bool:
         """Handle the complete command."""
-        if len(args) < 1:
-            print("Usage: complete <id>")
-            return True
-
-        try:
-            task_id = int(args[0])
-        except ValueError:
-            print("Task ID must be a number")
-            return True
-
         task = self.task_service.mark_task_complete(task_id)
         if task:
-            print(f"Task {task_id} marked as complete!")
+            self.echo(f"Task {task_id} marked as complete!")
         else:
-            print(f"Task with ID {task_id} not found")
+            self.report_error(f"Task with ID {task_id} not found")
 
         return True
 
-    def handle_incomplete(self, args: List[str]) -> bool:
+    def handle_incomplete(self, task_id: int) -> bool:
         """Handle the incomplete command."""
-        if len(args) < 1:
-            print("Usage: incomplete <id>")
+        task = self.task_service.mark_task_incomplete(task_id)
+        if task:
+            self.echo(f"Task {task_id} marked as incomplete!")
+        else:
+            self.report_error(f"Task with ID {task_id} not found")
+
+        return True
+
+    def handle_search(self, terms: Optional[List[str]] = None, limit: int = DEFAULT_PAGE_SIZE,
+                      stats: bool = False) -> bool:
+        """Handle the search command: ranked matches plus query latency."""
+        if not terms and not stats:
+            self.report_error(f"Usage: {self.commands.resolve('search').usage}")
             return True
 
+        if terms:
+            started = time.perf_counter()
+            results = self.task_service.search_tasks(" ".join(terms), limit)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            lines = []
+            for task, score in results:
+                status = "✓" if task.completed else "○"
+                lines.append(f"{status} [{task.id}] {task.title}  (score {score:.2f})")
+            lines.append(f"{len(results)} match{'es' if len(results) != 1 else ''} in {elapsed_ms:.2f} ms")
+            self.output.write("\n".join(lines) + "\n")
+
+        if stats:
+            index = self.task_service.search_stats()
+            self.echo(f"Search index: {index['documents']} tasks, {index['terms']} terms, "
+                      f"{index['postings']} postings, ~{index['memory_bytes'] / 1024:.0f} KiB")
+        return True
+
+    def report_progress(self, verb: str, started: float) -> Callable[[int], None]:
+        """Build a progress callback that prints rows done and throughput."""
+        def report(rows: int):
+            elapsed = time.perf_counter() - started
+            self.echo(f"  {verb} {rows:,} rows ({rows / elapsed if elapsed > 0 else 0:,.0f} rows/s)")
+        return report
+
+    def handle_import(self, path: str, file_format: Optional[str] = None, keep_ids: bool = False,
+                      trusted: bool = False) -> bool:
+        """Handle the import command: stream records from a file into the store."""
+        started = time.perf_counter()
         try:
-            task_id = int(args[0])
-        except ValueError:
-            print("Task ID must be a number")
+            file_format = file_format or detect_format(path)
+            with open(path, "r", encoding="utf-8", newline="") as stream:
+                records = with_progress(read_records(stream, file_format),
+                                        self.report_progress("read", started), PROGRESS_ROWS)
+                count = self.task_service.import_tasks(records, keep_ids=keep_ids, trusted=trusted)
+        except (OSError, ValueError) as e:
+            self.report_error(f"Error importing tasks: {e}")
             return True
 
-        task = self.task_service.mark_task_incomplete(task_id)
-        if task:
-            print(f"Task {task_id} marked as incomplete!")
-        else:
-            print(f"Task with ID {task_id} not found")
+        elapsed = time.perf_counter() - started
+        self.echo(f"Imported {count:,} tasks from {path} in {elapsed:.2f}s "
+                  f"({count / elapsed if elapsed > 0 else 0:,.0f} rows/s)")
+        return True
+
+    def handle_export(self, path: str, file_format: Optional[str] = None,
+                      completed: Optional[bool] = None) -> bool:
+        """Handle the export command: stream tasks from the store into a file."""
+        started = time.perf_counter()
+        try:
+            file_format = file_format or detect_format(path)
+            with open(path, "w", encoding="utf-8", newline="") as stream:
+                records = with_progress(self.task_service.export_tasks(completed),
+                                        self.report_progress("wrote", started), PROGRESS_ROWS)
+                count = write_records(stream, records, file_format)
+        except (OSError, ValueError) as e:
+            self.report_error(f"Error exporting tasks: {e}")
+            return True
+
+        elapsed = time.perf_counter() - started
+        self.echo(f"Exported {count:,} tasks to {path} in {elapsed:.2f}s "
+                  f"({count / elapsed if elapsed > 0 else 0:,.0f} rows/s)")
+        return True
 
+    def handle_help(self) -> bool:
+        """Handle the help command."""
+        self.display_help()
         return True
 
     def handle_exit(self) -> bool:
         """Handle the exit command."""
-        print("Goodbye!")
+        self.echo("Goodbye!")
         self.running = False
         return False
 
     def run(self):
         """Start the command loop."""
-        print("Welcome to the Todo Console App!")
-        print("Type 'help' for available commands or 'quit' to exit.")
+        self.echo("Welcome to the Todo Console App!")
+        self.echo("Type 'help' for available commands or 'quit' to exit.")
 
         while self.running:
             try:
@@ -239,8 +391,8 @@ Examples:
                 if not should_continue:
                     break
             except KeyboardInterrupt:
-                print("\nGoodbye!")
+                self.echo("\nGoodbye!")
                 break
             except EOFError:
-                print("\nGoodbye!")
-                break
\ No newline at end of file
+                self.echo("\nGoodbye!")
+                break
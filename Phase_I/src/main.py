@@ -1,18 +1,109 @@
+import argparse
+import sys
 from .services.task_service import TaskService
+from .cli.batch import BatchRunner
 from .cli.console import ConsoleInterface
+from .storage.base import TaskStore
+from .storage.durable_store import DurableTaskStore
+from .storage.memory_store import InMemoryTaskStore
+from .storage.sqlite_store import SQLiteTaskStore
 
+# Output buffer for batch mode; one write syscall per this many bytes
+BATCH_OUTPUT_BUFFER = 1 << 20
 
-def main():
+
+def add_storage_arguments(parser: argparse.ArgumentParser, default_db: str = "tasks.db"):
+    """Add the options that choose and configure the storage engine."""
+    parser.add_argument(
+        "--storage",
+        choices=("memory", "sqlite"),
+        default="memory",
+        help="storage engine: indexed in-memory store (default) or an SQLite database"
+    )
+    parser.add_argument(
+        "--db",
+        default=default_db,
+        help=f"SQLite database file for --storage sqlite (default: {default_db})"
+    )
+    parser.add_argument(
+        "--data-dir",
+        help="with the memory engine, persist tasks in this directory (journal + snapshots)"
+    )
+
+
+def open_store(args: argparse.Namespace) -> TaskStore:
+    """Open the storage engine selected on the command line."""
+    if args.storage == "sqlite":
+        if args.data_dir:
+            raise ValueError("--data-dir applies to the memory engine; use --db with --storage sqlite")
+        return SQLiteTaskStore(args.db)
+    if args.data_dir:
+        return DurableTaskStore(args.data_dir)
+    return InMemoryTaskStore()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(prog="python -m src.main", description="Todo Console App")
+    add_storage_arguments(parser)
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="run commands from FILE ('-' for stdin) without prompts; piped stdin implies --script -"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="in script mode, suppress per-command output and only print the summary"
+    )
+    return parser.parse_args(argv)
+
+
+def run_script(task_service: TaskService, script: str, quiet: bool):
+    """Run a command script through a buffered writer."""
+    output = open(sys.stdout.fileno(), "w", buffering=BATCH_OUTPUT_BUFFER,
+                  encoding=sys.stdout.encoding, closefd=False)
+    runner = BatchRunner(task_service, output, echo=not quiet)
+    try:
+        if script == "-":
+            runner.run(sys.stdin)
+        else:
+            with open(script, "r", encoding="utf-8") as lines:
+                runner.run(lines)
+    finally:
+        output.close()
+
+
+def main(argv=None):
     """Application entry point."""
-    # Initialize the task service
-    task_service = TaskService()
+    args = parse_args(argv)
+    script = args.script
+    if script is None and not sys.stdin.isatty():
+        script = "-"
 
-    # Initialize the console interface
-    console = ConsoleInterface(task_service)
+    # Initialize the task service, recovering persisted tasks if requested
+    try:
+        store = open_store(args)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+    if script is None:
+        if isinstance(store, DurableTaskStore):
+            print(f"Loaded {len(store)} tasks from {args.data_dir} in {store.startup_seconds * 1000:.1f} ms "
+                  f"({store.replayed_records} journal records replayed)")
+        elif isinstance(store, SQLiteTaskStore):
+            print(f"Opened {len(store)} tasks from {args.db}")
+    task_service = TaskService(store)
 
-    # Start the application
-    console.run()
+    try:
+        if script is not None:
+            run_script(task_service, script, args.quiet)
+        else:
+            # Initialize the console interface and start the application
+            console = ConsoleInterface(task_service)
+            console.run()
+    finally:
+        store.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,18 +1,22 @@
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Represents a single todo task with properties:
     - id: integer (auto-generated)
-    - title: string (1-200 characters)
+    - title: string (1-200 characters, interned)
     - description: string (max 1000 characters, optional)
     - completed: boolean (default: false)
     - created_at: datetime
     - updated_at: datetime
+
+    Uses __slots__ instead of a per-instance __dict__ to keep large task
+    lists compact; repeated titles share one interned string.
     """
     id: int
     title: str
@@ -22,22 +26,31 @@ class Task:
     updated_at: datetime = None
 
     def __post_init__(self):
-        """Initialize timestamps if not provided."""
+        """Intern the title and initialize timestamps if not provided."""
+        if self.title is not None:
+            self.title = sys.intern(self.title)
         if self.created_at is None:
             self.created_at = datetime.now()
         if self.updated_at is None:
             self.updated_at = self.created_at
 
-    def validate_title(self):
-        """Validate the title length."""
-        if not (1 <= len(self.title) <= 200):
+    def validate_title(self, title: str = None):
+        """Validate the title length (the current title by default)."""
+        if title is None:
+            title = self.title
+        if not (1 <= len(title) <= 200):
             raise ValueError("Title must be between 1 and 200 characters")
 
     def update(self, title: str = None, description: str = None):
-        """Update task details."""
+        """Update task details; an invalid title leaves the task unchanged."""
         if title is not None:
-            self.title = title
-            self.validate_title()
+            self.validate_title(title)
+            self.title = sys.intern(title)
         if description is not None:
             self.description = description
-        self.updated_at = datetime.now()
\ No newline at end of file
+        self.updated_at = datetime.now()
+
+    def set_completed(self, completed: bool):
+        """Set the completion status."""
+        self.completed = completed
+        self.updated_at = datetime.now()
@@ -0,0 +1,195 @@
+import itertools
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from ..models.task import Task
+from ..storage.memory_store import InMemoryTaskStore
+from .search_index import SearchIndex
+from .sorted_index import SortedTaskIndex
+from .task_transfer import record_to_task
+from .task_service import TaskService
+
+
+class ConcurrentTaskService(TaskService):
+    """
+    Thread-safe TaskService for embedding in multi-threaded hosts:
+    - Atomic id allocation from an itertools.count (one C-level call)
+    - Lock striping: writes to a task serialize on the stripe for its id, so
+      writers of different tasks do not contend
+    - Inserts share a short append lock; the search and sorted indexes share
+      an index lock
+    - Readers take no locks: get_all_tasks returns a published snapshot that
+      is re-copied only after a write has changed the store
+    """
+
+    def __init__(self, store: Optional[InMemoryTaskStore] = None, stripes: int = 64):
+        """Initialize the service with `stripes` per-task write locks."""
+        super().__init__(store)
+        self._ids = itertools.count(self.next_id)
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._append_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        # Every write stores a never-before-seen version, so a reader can
+        # tell its published snapshot is stale even if writes interleave
+        self._versions = itertools.count(1)
+        self._version = 0
+        self._published: Tuple[int, Tuple[Task, ...]] = (0, ())
+
+    def _stripe(self, task_id: int) -> threading.Lock:
+        return self._stripes[task_id % len(self._stripes)]
+
+    def _changed(self):
+        self._version = next(self._versions)
+
+    def add_task(self, title: str, description: Optional[str] = None) -> Task:
+        """Add a new task with an atomically allocated id."""
+        if not (1 <= len(title) <= 200):
+            raise ValueError("Title must be between 1 and 200 characters")
+
+        return self._insert(Task(id=next(self._ids), title=title, description=description))
+
+    def _insert(self, task: Task) -> Task:
+        with self._stripe(task.id):
+            with self._append_lock:
+                self.store.add(task)
+                self.next_id = max(self.next_id, task.id + 1)
+            self._changed()
+            with self._index_lock:
+                self._index_task(task)
+        return task
+
+    def add_tasks(self, entries: Iterable[Tuple[str, Optional[str]]]) -> int:
+        """Add tasks one at a time so every insert takes its locks."""
+        added = 0
+        for title, description in entries:
+            self.add_task(title, description)
+            added += 1
+        return added
+
+    def import_tasks(self, records: Iterable[Dict[str, Any]], keep_ids: bool = False,
+                     trusted: bool = False) -> int:
+        """Import records one at a time with freshly allocated ids, each insert taking its locks."""
+        if keep_ids:
+            raise ValueError("Keeping imported ids is not supported while ids are allocated concurrently")
+        added = 0
+        for number, record in enumerate(records, 1):
+            try:
+                task = record_to_task(record, next(self._ids), trusted)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Record {number}: {e}")
+            self._insert(task)
+            added += 1
+        return added
+
+    def snapshot(self) -> Tuple[Task, ...]:
+        """Return an immutable snapshot of all tasks without blocking writers."""
+        version = self._version
+        published = self._published
+        if published[0] != version:
+            published = (version, tuple(self.store.snapshot()))
+            self._published = published
+        return published[1]
+
+    def get_all_tasks(self) -> List[Task]:
+        """Get all tasks from the latest published snapshot."""
+        return list(self.snapshot())
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """Stream tasks from a snapshot, so concurrent writes cannot break iteration."""
+        tasks = self.snapshot()
+        if completed is None:
+            return iter(tasks)
+        return (task for task in tasks if task.completed == completed)
+
+    def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        """
+        Get a task by its ID. Takes the stripe lock because fetching a lazy
+        snapshot row materializes it, which must not race a writer.
+        """
+        with self._stripe(task_id):
+            return self.store.get(task_id)
+
+    def update_task(self, task_id: int, title: str = None, description: str = None) -> Optional[Task]:
+        """Update an existing task under its stripe lock."""
+        with self._stripe(task_id):
+            task = self.store.update(task_id, title, description)
+            if task is None:
+                return None
+            self._changed()
+            with self._index_lock:
+                self._index_task(task)
+        return task
+
+    def delete_task(self, task_id: int) -> bool:
+        """Delete a task under its stripe lock."""
+        with self._stripe(task_id):
+            if not self.store.delete(task_id):
+                return False
+            self._changed()
+            with self._index_lock:
+                self._unindex_task(task_id)
+        return True
+
+    def mark_task_complete(self, task_id: int) -> Optional[Task]:
+        """Mark a task as complete under its stripe lock."""
+        return self._set_completed(task_id, True)
+
+    def mark_task_incomplete(self, task_id: int) -> Optional[Task]:
+        """Mark a task as incomplete under its stripe lock."""
+        return self._set_completed(task_id, False)
+
+    def _set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        with self._stripe(task_id):
+            task = self.store.set_completed(task_id, completed)
+            if task is None:
+                return None
+            self._changed()
+            with self._index_lock:
+                self._index_task(task, text_changed=False)
+        return task
+
+    def search_index(self) -> SearchIndex:
+        """Return the full-text index, building it from a snapshot on first use."""
+        with self._index_lock:
+            if self._search_index is None:
+                index = SearchIndex()
+                for task in self.snapshot():
+                    index.add(task.id, task.title, task.description)
+                self._search_index = index
+            return self._search_index
+
+    def sorted_index(self, field: str) -> SortedTaskIndex:
+        """Return the sorted index for a field, building it from a snapshot on first use."""
+        with self._index_lock:
+            index = self._sorted_indexes.get(field)
+            if index is None:
+                index = SortedTaskIndex(field)
+                index.build(self.snapshot())
+                self._sorted_indexes[field] = index
+            return index
+
+    def iter_sorted_tasks(self, field: str, completed: Optional[bool] = None, offset: int = 0,
+                          limit: Optional[int] = None, descending: bool = False) -> Iterator[Task]:
+        """Read a page of ids under the index lock, then resolve them to tasks."""
+        index = self.sorted_index(field)
+        with self._index_lock:
+            task_ids = list(index.iter_ids(completed, offset, limit, descending))
+        tasks = (self.get_task_by_id(task_id) for task_id in task_ids)
+        return (task for task in tasks if task is not None)
+
+    def search_tasks(self, query: str, limit: int = 10) -> List[Tuple[Task, float]]:
+        """Search under the index lock, then resolve ids to tasks."""
+        index = self.search_index()
+        with self._index_lock:
+            matches = index.search(query, limit)
+        results = []
+        for task_id, score in matches:
+            task = self.get_task_by_id(task_id)
+            if task is not None:
+                results.append((task, score))
+        return results
+
+    def search_stats(self):
+        """Report size and approximate memory of the full-text index."""
+        index = self.search_index()
+        with self._index_lock:
+            return index.stats()
@@ -0,0 +1,129 @@
+import bisect
+import heapq
+import math
+import re
+import sys
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize_text(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens of a piece of text."""
+    if not text:
+        return []
+    return WORD_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    """
+    Inverted index over task titles and descriptions:
+    - Postings map each term to {task_id: term frequency}
+    - A sorted vocabulary supports prefix matching with bisect (new terms are
+      appended and the list is re-sorted lazily, so bulk builds stay fast)
+    - Queries are ranked with BM25; title terms count twice
+    - Only tasks that share a term with the query are scored
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, max_expansions: int = 64):
+        """Create an empty index with BM25 parameters."""
+        self.k1 = k1
+        self.b = b
+        self.max_expansions = max_expansions
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_sorted = True
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self._doc_lengths: Dict[int, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, task_id: int, title: str, description: Optional[str] = None):
+        """Index a task's title and description (replacing any previous entry)."""
+        if task_id in self._doc_lengths:
+            self.remove(task_id)
+        title_terms = tokenize_text(title)
+        counts = Counter(title_terms)
+        counts.update(title_terms)
+        counts.update(tokenize_text(description))
+
+        postings = self._postings
+        for term, frequency in counts.items():
+            posting = postings.get(term)
+            if posting is None:
+                posting = postings[term] = {}
+                self._vocabulary.append(term)
+                self._vocabulary_sorted = False
+            posting[task_id] = frequency
+        length = sum(counts.values())
+        self._doc_terms[task_id] = tuple(counts)
+        self._doc_lengths[task_id] = length
+        self._total_length += length
+
+    def remove(self, task_id: int):
+        """Drop a task from the index."""
+        terms = self._doc_terms.pop(task_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._doc_lengths.pop(task_id)
+        postings = self._postings
+        for term in terms:
+            posting = postings[term]
+            del posting[task_id]
+            if not posting:
+                del postings[term]
+                vocabulary = self._sorted_vocabulary()
+                del vocabulary[bisect.bisect_left(vocabulary, term)]
+
+    def expand(self, term: str, prefix: bool = True) -> List[str]:
+        """Return the indexed terms matching `term` exactly or, with prefix, as a prefix."""
+        if not prefix:
+            return [term] if term in self._postings else []
+        vocabulary = self._sorted_vocabulary()
+        start = bisect.bisect_left(vocabulary, term)
+        end = bisect.bisect_left(vocabulary, term + "\U0010ffff", start)
+        return vocabulary[start:min(end, start + self.max_expansions)]
+
+    def _sorted_vocabulary(self) -> List[str]:
+        if not self._vocabulary_sorted:
+            self._vocabulary.sort()
+            self._vocabulary_sorted = True
+        return self._vocabulary
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[Tuple[int, float]]:
+        """Return up to `limit` (task_id, score) pairs, best first."""
+        doc_count = len(self._doc_lengths)
+        if doc_count == 0:
+            return []
+        average_length = self._total_length / doc_count
+        k1, b = self.k1, self.b
+        lengths = self._doc_lengths
+
+        scores: Dict[int, float] = {}
+        for query_term in set(tokenize_text(query)):
+            for term in self.expand(query_term, prefix):
+                posting = self._postings[term]
+                idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for task_id, frequency in posting.items():
+                    norm = k1 * (1 - b + b * lengths[task_id] / average_length)
+                    scores[task_id] = scores.get(task_id, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def stats(self) -> Dict[str, int]:
+        """Report document, term and posting counts plus approximate memory use."""
+        postings_bytes = sys.getsizeof(self._postings)
+        posting_count = 0
+        for term, posting in self._postings.items():
+            postings_bytes += sys.getsizeof(term) + sys.getsizeof(posting)
+            posting_count += len(posting)
+        docs_bytes = sys.getsizeof(self._doc_terms) + sys.getsizeof(self._doc_lengths)
+        docs_bytes += sum(sys.getsizeof(terms) for terms in self._doc_terms.values())
+        return {
+            "documents": len(self._doc_lengths),
+            "terms": len(self._postings),
+            "postings": posting_count,
+            "memory_bytes": postings_bytes + docs_bytes + sys.getsizeof(self._vocabulary),
+        }
@@ -0,0 +1,88 @@
+import bisect
+import heapq
+import itertools
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Sortable task fields and the key each one is ordered by
+SORT_KEYS: Dict[str, Callable[[Any], Any]] = {
+    "title": lambda task: task.title.casefold(),
+    "created_at": attrgetter("created_at"),
+    "updated_at": attrgetter("updated_at"),
+}
+SORT_FIELDS = tuple(SORT_KEYS)
+
+
+class SortedTaskIndex:
+    """
+    Secondary index keeping task ids ordered by one field:
+    - One sorted list of (key, task_id) entries per completion status, so a
+      filtered page is read by position in O(k)
+    - The unfiltered order lazily merges both lists with heapq.merge
+    - Entries are moved with bisect on every change; the current entry of
+      each task is remembered so removal needs no store lookup
+    - Ties on the key are broken by task id
+    """
+
+    def __init__(self, field: str):
+        """Create an empty index ordered by `field`."""
+        if field not in SORT_KEYS:
+            raise ValueError(f"Unknown sort field: {field} (choose from {', '.join(SORT_FIELDS)})")
+        self.field = field
+        self._key = SORT_KEYS[field]
+        self._entries: Dict[bool, List[Tuple[Any, int]]] = {False: [], True: []}
+        self._current: Dict[int, Tuple[bool, Tuple[Any, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def build(self, tasks):
+        """Bulk-load tasks into an empty index with one sort per status."""
+        for task in tasks:
+            entry = (self._key(task), task.id)
+            self._entries[task.completed].append(entry)
+            self._current[task.id] = (task.completed, entry)
+        for entries in self._entries.values():
+            entries.sort()
+
+    def add(self, task):
+        """Insert a task, or move it if its key or status changed."""
+        entry = (self._key(task), task.id)
+        previous = self._current.get(task.id)
+        if previous is not None:
+            if previous == (task.completed, entry):
+                return
+            self._discard(*previous)
+        bisect.insort(self._entries[task.completed], entry)
+        self._current[task.id] = (task.completed, entry)
+
+    def remove(self, task_id: int):
+        """Drop a task from the index."""
+        previous = self._current.pop(task_id, None)
+        if previous is not None:
+            self._discard(*previous)
+
+    def _discard(self, completed: bool, entry: Tuple[Any, int]):
+        entries = self._entries[completed]
+        del entries[bisect.bisect_left(entries, entry)]
+
+    def iter_ids(self, completed: Optional[bool] = None, offset: int = 0, limit: Optional[int] = None,
+                 descending: bool = False) -> Iterator[int]:
+        """Yield task ids in key order, skipping `offset` and stopping after `limit`."""
+        if completed is None:
+            lists = self._entries[False], self._entries[True]
+            if descending:
+                merged = heapq.merge(*(reversed(entries) for entries in lists), reverse=True)
+            else:
+                merged = heapq.merge(*lists)
+            stop = None if limit is None else offset + limit
+            return (task_id for _, task_id in itertools.islice(merged, offset, stop))
+
+        entries = self._entries[completed]
+        size = len(entries)
+        count = max(0, size - offset) if limit is None else max(0, min(limit, size - offset))
+        if descending:
+            positions = range(size - 1 - offset, size - 1 - offset - count, -1)
+        else:
+            positions = range(offset, offset + count)
+        return (entries[position][1] for position in positions)
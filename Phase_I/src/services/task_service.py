@@ -1,6 +1,10 @@
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from ..models.task import Task
+from ..storage.base import TaskStore
+from ..storage.memory_store import InMemoryTaskStore
+from .search_index import SearchIndex
+from .sorted_index import SortedTaskIndex
+from .task_transfer import record_to_task, task_to_record
 
 
 class TaskService:
@@ -12,16 +16,23 @@ class TaskService:
     - Update task
     - Delete task
     - Mark task complete/incomplete
+    - Full-text search
+    - Sorted listing by title, created_at or updated_at
+    - Bulk import/export of task records
     - Validation logic
     """
 
-    def __init__(self):
-        """Initialize the task service with an empty in-memory storage."""
-        self.tasks: List[Task] = []
-        self.next_id = 1
+    def __init__(self, store: Optional[TaskStore] = None):
+        """Initialize the task service on a storage engine (in-memory by default)."""
+        self.store = store if store is not None else InMemoryTaskStore()
+        self.next_id = self.store.max_id() + 1
+        # Built on the first search, then maintained on every add/update/delete
+        self._search_index: Optional[SearchIndex] = None
+        # Sorted indexes by field, each built on the first sort by that field
+        self._sorted_indexes: Dict[str, SortedTaskIndex] = {}
 
     def add_task(self, title: str, description: Optional[str] = None) -> Task:
-        """Add a new task to the in-memory storage."""
+        """Add a new task to the task store."""
         # Validate title
         if not (1 <= len(title) <= 200):
             raise ValueError("Title must be between 1 and 200 characters")
@@ -35,56 +46,156 @@ class TaskService:
         task.validate_title()
 
         # Add to storage
-        self.tasks.append(task)
+        self.store.add(task)
         self.next_id += 1
+        self._index_task(task)
 
         return task
 
+    def add_tasks(self, entries: Iterable[Tuple[str, Optional[str]]]) -> int:
+        """Add many (title, description) tasks through the store's batched insert."""
+        def tasks() -> Iterator[Task]:
+            for title, description in entries:
+                if not (1 <= len(title) <= 200):
+                    raise ValueError("Title must be between 1 and 200 characters")
+                task = Task(id=self.next_id, title=title, description=description)
+                self.next_id += 1
+                yield task
+
+        return self._add_many(tasks())
+
+    def import_tasks(self, records: Iterable[Dict[str, Any]], keep_ids: bool = False,
+                     trusted: bool = False) -> int:
+        """
+        Stream task records into the store in one batched insert, keeping
+        their completion state and timestamps. Ids are reassigned unless
+        `keep_ids`; `trusted` skips per-record validation.
+
+        Records are not buffered, so tasks stored before an invalid record
+        stay; the error says how many, so a re-run does not silently
+        duplicate them.
+        """
+        stored_before = self.store.count()
+
+        def tasks() -> Iterator[Task]:
+            for number, record in enumerate(records, 1):
+                try:
+                    task = record_to_task(record, None if keep_ids else self.next_id, trusted)
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Record {number}: {e}")
+                if task.id >= self.next_id:
+                    self.next_id = task.id + 1
+                yield task
+
+        try:
+            return self._add_many(tasks())
+        except ValueError as e:
+            imported = self.store.count() - stored_before
+            raise ValueError(f"{e} (tasks imported before the error: {imported:,})") from e
+
+    def export_tasks(self, completed: Optional[bool] = None) -> Iterator[Dict[str, Any]]:
+        """Stream every task (optionally filtered by status) as a record."""
+        return map(task_to_record, self.store.iter_tasks(completed))
+
+    def _add_many(self, tasks: Iterator[Task]) -> int:
+        try:
+            return self.store.add_many(tasks)
+        finally:
+            # Rebuilt lazily on next use rather than updated row by row
+            self._search_index = None
+            self._sorted_indexes = {}
+
     def get_all_tasks(self) -> List[Task]:
-        """Get all tasks from storage."""
-        return self.tasks
+        """Get all tasks from storage in insertion order."""
+        return list(self.store.iter_tasks())
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """Stream tasks from storage without copying, optionally filtered by status."""
+        return self.store.iter_tasks(completed)
+
+    def count_tasks(self, completed: Optional[bool] = None) -> int:
+        """Count all tasks, or only pending/done tasks."""
+        return self.store.count(completed)
 
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """Get a task by its ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self.store.get(task_id)
 
     def update_task(self, task_id: int, title: str = None, description: str = None) -> Optional[Task]:
         """Update an existing task."""
-        task = self.get_task_by_id(task_id)
-        if task is None:
-            return None
-
-        task.update(title, description)
+        task = self.store.update(task_id, title, description)
+        if task is not None:
+            self._index_task(task)
         return task
 
     def delete_task(self, task_id: int) -> bool:
         """Delete a task by its ID."""
-        task = self.get_task_by_id(task_id)
-        if task is None:
-            return False
-
-        self.tasks.remove(task)
-        return True
+        deleted = self.store.delete(task_id)
+        if deleted:
+            self._unindex_task(task_id)
+        return deleted
 
     def mark_task_complete(self, task_id: int) -> Optional[Task]:
         """Mark a task as complete."""
-        task = self.get_task_by_id(task_id)
-        if task is None:
-            return None
-
-        task.completed = True
-        task.updated_at = datetime.now()
+        task = self.store.set_completed(task_id, True)
+        if task is not None:
+            self._index_task(task, text_changed=False)
         return task
 
     def mark_task_incomplete(self, task_id: int) -> Optional[Task]:
         """Mark a task as incomplete."""
-        task = self.get_task_by_id(task_id)
-        if task is None:
-            return None
+        task = self.store.set_completed(task_id, False)
+        if task is not None:
+            self._index_task(task, text_changed=False)
+        return task
 
-        task.completed = False
-        task.updated_at = datetime.now()
-        return task
\ No newline at end of file
+    def _index_task(self, task: Task, text_changed: bool = True):
+        """Bring every built index up to date with a new or changed task."""
+        if text_changed and self._search_index is not None:
+            self._search_index.add(task.id, task.title, task.description)
+        for index in self._sorted_indexes.values():
+            index.add(task)
+
+    def _unindex_task(self, task_id: int):
+        """Drop a deleted task from every built index."""
+        if self._search_index is not None:
+            self._search_index.remove(task_id)
+        for index in self._sorted_indexes.values():
+            index.remove(task_id)
+
+    def sorted_index(self, field: str) -> SortedTaskIndex:
+        """Return the sorted index for a field, building it from the store on first use."""
+        index = self._sorted_indexes.get(field)
+        if index is None:
+            index = SortedTaskIndex(field)
+            index.build(self.store.iter_tasks())
+            self._sorted_indexes[field] = index
+        return index
+
+    def iter_sorted_tasks(self, field: str, completed: Optional[bool] = None, offset: int = 0,
+                          limit: Optional[int] = None, descending: bool = False) -> Iterator[Task]:
+        """Stream a page of tasks ordered by `field`, optionally filtered by status."""
+        get = self.store.get
+        return map(get, self.sorted_index(field).iter_ids(completed, offset, limit, descending))
+
+    def search_index(self) -> SearchIndex:
+        """Return the full-text index, building it from the store on first use."""
+        if self._search_index is None:
+            index = SearchIndex()
+            for task in self.store.iter_tasks():
+                index.add(task.id, task.title, task.description)
+            self._search_index = index
+        return self._search_index
+
+    def search_tasks(self, query: str, limit: int = 10) -> List[Tuple[Task, float]]:
+        """Return the `limit` best-matching tasks with their BM25 scores."""
+        results = []
+        for task_id, score in self.search_index().search(query, limit):
+            task = self.store.get(task_id)
+            if task is not None:
+                results.append((task, score))
+        return results
+
+    def search_stats(self) -> Dict[str, int]:
+        """Report size and approximate memory of the full-text index."""
+        return self.search_index().stats()
@@ -0,0 +1,116 @@
+import csv
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO, TypeVar
+from ..models.task import Task
+
+FIELDS = ("id", "title", "description", "completed", "created_at", "updated_at")
+FORMATS = ("csv", "ndjson")
+EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+TRUE_VALUES = frozenset((True, "true", "True", "TRUE", "1", "yes", 1))
+FALSE_VALUES = frozenset((False, "false", "False", "FALSE", "0", "no", 0, "", None))
+
+T = TypeVar("T")
+
+
+def detect_format(path: str) -> str:
+    """Pick the file format from a path's extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Cannot tell the format of {path}; use --format {'|'.join(FORMATS)}")
+    return EXTENSIONS[extension]
+
+
+def read_records(stream: TextIO, format: str) -> Iterator[Dict[str, Any]]:
+    """Lazily read task records (dicts keyed by FIELDS) from a CSV or NDJSON stream."""
+    if format == "csv":
+        # csv.reader plus zip is cheaper per row than csv.DictReader
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if header is None:
+            return iter(())
+        return (dict(zip(header, row)) for row in reader)
+    if format == "ndjson":
+        return (json.loads(line) for line in stream if line.strip())
+    raise ValueError(f"Unknown format: {format}")
+
+
+def write_records(stream: TextIO, records: Iterable[Dict[str, Any]], format: str) -> int:
+    """Write task records to a CSV (with header) or NDJSON stream as they are produced."""
+    count = 0
+    if format == "csv":
+        writerow = csv.writer(stream).writerow
+        writerow(FIELDS)
+        for r in records:
+            writerow((r["id"], r["title"], r["description"] or "", "true" if r["completed"] else "false",
+                      r["created_at"], r["updated_at"]))
+            count += 1
+    elif format == "ndjson":
+        dumps, write = json.dumps, stream.write
+        for record in records:
+            write(dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    else:
+        raise ValueError(f"Unknown format: {format}")
+    return count
+
+
+def task_to_record(task) -> Dict[str, Any]:
+    """Convert a task into a record with ISO 8601 timestamps (microseconds kept)."""
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "completed": task.completed,
+        "created_at": task.created_at.isoformat(),
+        "updated_at": task.updated_at.isoformat(),
+    }
+
+
+def record_to_task(record: Dict[str, Any], task_id: Optional[int] = None, trusted: bool = False) -> Task:
+    """
+    Build a task from a record, taking its id from the record unless
+    `task_id` is given. Trusted (pre-validated) records skip the title,
+    status and timestamp checks and are only converted.
+    """
+    if task_id is None:
+        if record.get("id") in (None, ""):
+            raise ValueError("Missing id")
+        task_id = int(record["id"])
+    title = record.get("title")
+    description = record.get("description") or None
+    completed = record.get("completed")
+    created_at = record.get("created_at")
+    updated_at = record.get("updated_at")
+    created_at = datetime.fromisoformat(created_at) if created_at else None
+    updated_at = datetime.fromisoformat(updated_at) if updated_at else None
+
+    if trusted:
+        completed = completed in TRUE_VALUES
+    else:
+        if not isinstance(title, str) or not (1 <= len(title) <= 200):
+            raise ValueError("Title must be between 1 and 200 characters")
+        if description is not None and not isinstance(description, str):
+            raise ValueError("Description must be text")
+        if completed in TRUE_VALUES:
+            completed = True
+        elif completed in FALSE_VALUES:
+            completed = False
+        else:
+            raise ValueError(f"Invalid completed value: {completed!r}")
+        if created_at is not None and updated_at is not None and updated_at < created_at:
+            raise ValueError("updated_at is earlier than created_at")
+
+    return Task(id=task_id, title=title, description=description, completed=completed,
+                created_at=created_at, updated_at=updated_at)
+
+
+def with_progress(items: Iterable[T], report: Callable[[int], None], every: int) -> Iterator[T]:
+    """Pass items through, calling report(count) after every `every` items."""
+    count = 0
+    for item in items:
+        yield item
+        count += 1
+        if count % every == 0:
+            report(count)
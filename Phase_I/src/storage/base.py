@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Optional
+from ..models.task import Task
+
+
+class TaskStore(ABC):
+    """
+    Storage engine interface used by TaskService:
+    - Every mutation goes through the store, which validates and persists it
+    - Iteration is in id (insertion) order and may stream from the engine
+    - Engines that hold resources release them in close()
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+
+    @abstractmethod
+    def __contains__(self, task_id: int) -> bool:
+        """Check whether a task id is stored."""
+
+    @abstractmethod
+    def max_id(self) -> int:
+        """Return the highest task id ever stored."""
+
+    @abstractmethod
+    def add(self, task: Task) -> Task:
+        """Insert a new task."""
+
+    def add_many(self, tasks: Iterable[Task]) -> int:
+        """Insert many new tasks and return how many were added."""
+        added = 0
+        for task in tasks:
+            self.add(task)
+            added += 1
+        return added
+
+    @abstractmethod
+    def get(self, task_id: int) -> Optional[Task]:
+        """Get a task by its ID."""
+
+    @abstractmethod
+    def update(self, task_id: int, title: str = None, description: str = None) -> Optional[Task]:
+        """Update the title and/or description of a task."""
+
+    @abstractmethod
+    def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """Set the completion status of a task."""
+
+    @abstractmethod
+    def delete(self, task_id: int) -> bool:
+        """Remove a task."""
+
+    @abstractmethod
+    def count(self, completed: Optional[bool] = None) -> int:
+        """Count all tasks, or only pending/done tasks."""
+
+    @abstractmethod
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """Iterate tasks in insertion order, optionally filtered by status."""
+
+    def snapshot(self) -> List[Task]:
+        """Copy all tasks in insertion order."""
+        return list(self.iter_tasks())
+
+    def flush(self):
+        """Make every accepted mutation durable (no-op for volatile engines)."""
+
+    def close(self):
+        """Release any resources held by the engine."""
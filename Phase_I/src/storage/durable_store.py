@@ -0,0 +1,239 @@
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from ..models.task import Task
+from .journal import Journal, list_segments, read_segment, segment_path
+from .memory_store import InMemoryTaskStore
+from .snapshot import (
+    MappedSnapshot, TaskRow, list_snapshots, row_to_task, snapshot_path, write_snapshot
+)
+
+
+def open_latest_snapshot(data_dir: str) -> Optional[MappedSnapshot]:
+    """Map the newest snapshot in a data directory, if there is one."""
+    snapshots = list_snapshots(data_dir)
+    if not snapshots:
+        return None
+    return MappedSnapshot(snapshot_path(data_dir, snapshots[-1]))
+
+
+def load_rows(data_dir: str) -> Tuple[Dict[int, TaskRow], int, int]:
+    """Decode the newest snapshot into (id -> row, max_id, last_segment)."""
+    snapshot = open_latest_snapshot(data_dir)
+    if snapshot is None:
+        return {}, 0, 0
+    try:
+        return {row[0]: row for row in snapshot.iter_rows()}, snapshot.max_id, snapshot.last_segment
+    finally:
+        snapshot.close()
+
+
+def apply_record(rows: Dict[int, TaskRow], record: Dict) -> int:
+    """Apply one journal record to an id -> row dict and return its task id."""
+    op = record["op"]
+    task_id = record["id"]
+    if op == "add":
+        rows[task_id] = (task_id, record["title"], record["description"], record["completed"],
+                         record["created_at"], record["updated_at"])
+    elif op == "update":
+        row = rows.get(task_id)
+        if row is not None:
+            rows[task_id] = (task_id, record["title"], record["description"], row[3],
+                             row[4], record["updated_at"])
+    elif op == "complete":
+        row = rows.get(task_id)
+        if row is not None:
+            rows[task_id] = (task_id, row[1], row[2], record["completed"], row[4], record["updated_at"])
+    elif op == "delete":
+        rows.pop(task_id, None)
+    else:
+        raise ValueError(f"Unknown journal operation: {op}")
+    return task_id
+
+
+class Snapshotter:
+    """
+    Background compaction of closed journal segments:
+    - Folds the previous snapshot and every closed segment into a new snapshot
+    - Deletes the folded segments and older snapshots once the new snapshot
+      is durable (a store may still have the old one mapped, which POSIX allows)
+    - Never touches live task objects, so it does not contend with callers
+    """
+
+    def __init__(self, data_dir: str, journal: Journal, interval: float = 30.0):
+        """Create a snapshotter for a data directory and its active journal."""
+        self.data_dir = data_dir
+        self.journal = journal
+        self.interval = interval
+        self.compactions = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start periodic compaction in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="task-snapshotter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread, waiting for a running compaction."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def compact(self) -> bool:
+        """Fold closed segments into the snapshot. Returns True if it wrote one."""
+        with self._lock:
+            active = self.journal.segment
+            closed = [segment for segment in list_segments(self.data_dir) if segment < active]
+            if not closed:
+                return False
+
+            rows, max_id, last_segment = load_rows(self.data_dir)
+            folded = [segment for segment in closed if segment > last_segment]
+            for segment in folded:
+                for record in read_segment(self.data_dir, segment):
+                    max_id = max(max_id, apply_record(rows, record))
+            if folded:
+                last_segment = folded[-1]
+                write_snapshot(snapshot_path(self.data_dir, last_segment), rows.values(),
+                               max_id, last_segment)
+
+            for segment in closed:
+                os.remove(segment_path(self.data_dir, segment))
+            for older in list_snapshots(self.data_dir):
+                if older < last_segment:
+                    try:
+                        os.remove(snapshot_path(self.data_dir, older))
+                    except OSError:
+                        # Still mapped on platforms that forbid it; removed next time
+                        pass
+            self.compactions += 1
+            return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.compact()
+
+
+class DurableTaskStore(InMemoryTaskStore):
+    """
+    Indexed in-memory task store backed by a journal and snapshots:
+    - Startup maps the latest snapshot (rows decode lazily) and replays only
+      the journal tail
+    - Every add/update/complete/delete is appended to the write-ahead journal
+    - Journal writes and compaction happen on background threads
+    """
+
+    def __init__(self, data_dir: str, sync_interval: float = 0.05, sync_batch: int = 512,
+                 segment_size: int = 50_000, snapshot_interval: float = 30.0):
+        """Recover state from `data_dir` and start the journal and snapshotter."""
+        super().__init__()
+        started = time.perf_counter()
+        os.makedirs(data_dir, exist_ok=True)
+        self.data_dir = data_dir
+
+        snapshot = open_latest_snapshot(data_dir)
+        last_segment = 0
+        if snapshot is not None:
+            self.load_snapshot(snapshot)
+            last_segment = snapshot.last_segment
+
+        segments = list_segments(data_dir)
+        self.replayed_records = 0
+        for segment in segments:
+            if segment <= last_segment:
+                continue
+            for record in read_segment(data_dir, segment):
+                self._replay(record)
+                self.replayed_records += 1
+
+        next_segment = max(segments + [last_segment]) + 1
+        self.journal = Journal(data_dir, next_segment, sync_interval=sync_interval,
+                               sync_batch=sync_batch, segment_size=segment_size)
+        self.snapshotter = Snapshotter(data_dir, self.journal, interval=snapshot_interval)
+        self.snapshotter.start()
+        self.startup_seconds = time.perf_counter() - started
+
+    def _replay(self, record: Dict):
+        """Apply a journal record from a previous run without re-journaling it."""
+        op = record["op"]
+        task_id = record["id"]
+        if op == "add":
+            InMemoryTaskStore.add(self, row_to_task((
+                task_id, record["title"], record["description"], record["completed"],
+                record["created_at"], record["updated_at"]
+            )))
+        elif op == "update":
+            task = self.get(task_id)
+            if task is not None:
+                task.title = record["title"]
+                task.description = record["description"]
+                task.updated_at = datetime.fromtimestamp(record["updated_at"])
+        elif op == "complete":
+            task = InMemoryTaskStore.set_completed(self, task_id, record["completed"])
+            if task is not None:
+                task.updated_at = datetime.fromtimestamp(record["updated_at"])
+        elif op == "delete":
+            InMemoryTaskStore.delete(self, task_id)
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
+
+    def add(self, task: Task) -> Task:
+        """Insert a new task and journal it."""
+        super().add(task)
+        self.journal.append({
+            "op": "add",
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "completed": task.completed,
+            "created_at": task.created_at.timestamp(),
+            "updated_at": task.updated_at.timestamp()
+        })
+        return task
+
+    def update(self, task_id: int, title: str = None, description: str = None) -> Optional[Task]:
+        """Update a task and journal its new title and description."""
+        task = super().update(task_id, title, description)
+        if task is not None:
+            self.journal.append({
+                "op": "update",
+                "id": task_id,
+                "title": task.title,
+                "description": task.description,
+                "updated_at": task.updated_at.timestamp()
+            })
+        return task
+
+    def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """Set the completion status of a task and journal it."""
+        task = super().set_completed(task_id, completed)
+        if task is not None:
+            self.journal.append({
+                "op": "complete",
+                "id": task_id,
+                "completed": completed,
+                "updated_at": task.updated_at.timestamp()
+            })
+        return task
+
+    def delete(self, task_id: int) -> bool:
+        """Remove a task and journal the deletion."""
+        deleted = super().delete(task_id)
+        if deleted:
+            self.journal.append({"op": "delete", "id": task_id})
+        return deleted
+
+    def flush(self):
+        """Block until every journaled mutation is on disk."""
+        self.journal.flush()
+
+    def close(self):
+        """Stop background compaction, flush the journal and unmap the snapshot."""
+        self.snapshotter.stop()
+        self.journal.close()
+        if self._snapshot is not None:
+            self._snapshot.close()
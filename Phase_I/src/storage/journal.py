@@ -0,0 +1,161 @@
+import json
+import os
+import queue
+import re
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+SEGMENT_PATTERN = re.compile(r"^journal-(\d{8})\.log$")
+
+
+def segment_path(data_dir: str, segment: int) -> str:
+    """Return the file path of a journal segment."""
+    return os.path.join(data_dir, f"journal-{segment:08d}.log")
+
+
+def list_segments(data_dir: str) -> List[int]:
+    """Return the numbers of all journal segments in the directory, in order."""
+    segments = []
+    for name in os.listdir(data_dir):
+        match = SEGMENT_PATTERN.match(name)
+        if match:
+            segments.append(int(match.group(1)))
+    return sorted(segments)
+
+
+def read_segment(data_dir: str, segment: int) -> Iterator[Dict]:
+    """
+    Yield the records of a journal segment in order.
+    A torn final line (crash mid-write) ends the segment.
+    """
+    with open(segment_path(data_dir, segment), "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                return
+
+
+class Journal:
+    """
+    Append-only write-ahead journal for task mutations:
+    - append() only enqueues, so callers never block on disk I/O
+    - A background writer thread serializes records as JSON lines
+    - fsync is batched (group commit) by record count and time interval
+    - Segments are rotated after a fixed number of records so closed
+      segments can be compacted into a snapshot
+    """
+
+    _STOP = object()
+
+    def __init__(self, data_dir: str, segment: int, sync_interval: float = 0.05,
+                 sync_batch: int = 512, segment_size: int = 50_000):
+        """Open a fresh segment and start the writer thread."""
+        self.data_dir = data_dir
+        self.sync_interval = sync_interval
+        self.sync_batch = sync_batch
+        self.segment_size = segment_size
+        self.segment = segment
+        self.error: Optional[BaseException] = None
+
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._file = open(segment_path(data_dir, segment), "a", encoding="utf-8")
+        self._segment_records = 0
+        self._thread = threading.Thread(target=self._run, name="task-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, record: Dict):
+        """Queue a record for writing without waiting for the disk."""
+        if self.error is not None:
+            raise RuntimeError("Journal writer failed") from self.error
+        self._queue.put(record)
+
+    def flush(self):
+        """Block until every queued record is written and fsynced."""
+        if self.error is not None or not self._thread.is_alive():
+            raise RuntimeError("Journal writer is not running") from self.error
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        if self.error is not None:
+            raise RuntimeError("Journal writer failed") from self.error
+
+    def close(self):
+        """Flush outstanding records and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if self.error is not None:
+            raise RuntimeError("Journal writer failed") from self.error
+
+    def _run(self):
+        """Writer loop: drain the queue, write, and group-commit with fsync."""
+        pending = 0
+        last_sync = time.monotonic()
+        try:
+            while True:
+                timeout = None
+                if pending:
+                    timeout = max(0.0, self.sync_interval - (time.monotonic() - last_sync))
+                try:
+                    items = [self._queue.get(timeout=timeout)]
+                except queue.Empty:
+                    items = []
+                while len(items) < self.sync_batch:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = False
+                waiters = []
+                lines = []
+                for item in items:
+                    if item is self._STOP:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        lines.append(json.dumps(item, separators=(",", ":")))
+                if lines:
+                    self._file.write("\n".join(lines) + "\n")
+                    pending += len(lines)
+                    self._segment_records += len(lines)
+
+                if pending and (stop or waiters or pending >= self.sync_batch
+                                or time.monotonic() - last_sync >= self.sync_interval):
+                    self._sync()
+                    pending = 0
+                    last_sync = time.monotonic()
+                if self._segment_records >= self.segment_size:
+                    self._rotate()
+                for waiter in waiters:
+                    waiter.set()
+                if stop:
+                    self._file.close()
+                    return
+        except BaseException as e:
+            self.error = e
+            # Release anyone waiting on a flush so they can see the error
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _sync(self):
+        """Flush Python buffers and fsync the active segment."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _rotate(self):
+        """Close the active segment and start the next one."""
+        self._sync()
+        self._file.close()
+        self._file = open(segment_path(self.data_dir, self.segment + 1), "a", encoding="utf-8")
+        self._segment_records = 0
+        # Published last: segments below this number are closed and compactable
+        self.segment += 1
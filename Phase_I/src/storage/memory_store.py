@@ -0,0 +1,134 @@
+from typing import Dict, Iterator, List, Optional, Union
+from ..models.task import Task
+from .base import TaskStore
+from .snapshot import FLAG_COMPLETED, MappedSnapshot, row_to_task
+
+
+class InMemoryTaskStore(TaskStore):
+    """
+    Indexed in-memory storage engine for tasks:
+    - Primary hash index: id -> task (O(1) lookup, update and delete)
+    - Insertion-ordered view of all tasks (dicts preserve insertion order)
+    - Secondary index on completed status (pending / done id sets)
+
+    Every mutation goes through the store so all indexes stay consistent.
+    Tasks loaded from a mapped snapshot are kept as row numbers and only
+    decoded into Task objects when they are fetched by id.
+    """
+
+    def __init__(self):
+        """Initialize empty primary and secondary indexes."""
+        # Values are Tasks, or int row numbers into the mapped snapshot
+        self._tasks: Dict[int, Union[Task, int]] = {}
+        # Dicts used as insertion-ordered sets keyed by task id
+        self._by_completed: Dict[bool, Dict[int, None]] = {False: {}, True: {}}
+        self._max_id = 0
+        self._snapshot: Optional[MappedSnapshot] = None
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._tasks
+
+    def max_id(self) -> int:
+        """Return the highest task id ever stored."""
+        return self._max_id
+
+    def load_snapshot(self, snapshot: MappedSnapshot):
+        """Index every row of a mapped snapshot without decoding its strings."""
+        self._snapshot = snapshot
+        tasks = self._tasks
+        pending, done = self._by_completed[False], self._by_completed[True]
+        for index, (task_id, flags, _, _) in enumerate(snapshot.iter_records()):
+            tasks[task_id] = index
+            if flags & FLAG_COMPLETED:
+                done[task_id] = None
+            else:
+                pending[task_id] = None
+        if snapshot.max_id > self._max_id:
+            self._max_id = snapshot.max_id
+
+    def add(self, task: Task) -> Task:
+        """Insert a new task and index it."""
+        if task.id in self._tasks:
+            raise ValueError(f"Task with ID {task.id} already exists")
+        self._tasks[task.id] = task
+        self._by_completed[task.completed][task.id] = None
+        if task.id > self._max_id:
+            self._max_id = task.id
+        return task
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Get a task by its ID, materializing it from the snapshot if needed."""
+        task = self._tasks.get(task_id)
+        if task.__class__ is int:
+            task = row_to_task(self._snapshot.row(task))
+            self._tasks[task_id] = task
+        return task
+
+    def update(self, task_id: int, title: str = None, description: str = None) -> Optional[Task]:
+        """Update the title and/or description of a task."""
+        task = self.get(task_id)
+        if task is None:
+            return None
+        task.update(title, description)
+        return task
+
+    def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """Set the completion status of a task and move it between indexes."""
+        task = self.get(task_id)
+        if task is None:
+            return None
+        if task.completed != completed:
+            del self._by_completed[task.completed][task_id]
+            self._by_completed[completed][task_id] = None
+        task.set_completed(completed)
+        return task
+
+    def delete(self, task_id: int) -> bool:
+        """Remove a task and drop it from every index."""
+        if self._tasks.pop(task_id, None) is None:
+            return False
+        pending = self._by_completed[False]
+        if task_id in pending:
+            del pending[task_id]
+        else:
+            del self._by_completed[True][task_id]
+        return True
+
+    def count(self, completed: Optional[bool] = None) -> int:
+        """Count all tasks, or only pending/done tasks."""
+        if completed is None:
+            return len(self._tasks)
+        return len(self._by_completed[completed])
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """
+        Iterate tasks in insertion order, optionally filtered by status.
+        Filtered views are ordered by when each task entered that status.
+        Snapshot rows that were never fetched are yielded as lazy views.
+        """
+        tasks = self._tasks
+        if self._snapshot is None:
+            if completed is None:
+                return iter(tasks.values())
+            return (tasks[task_id] for task_id in self._by_completed[completed])
+
+        view = self._snapshot.view
+        if completed is None:
+            values = tasks.values()
+        else:
+            values = (tasks[task_id] for task_id in self._by_completed[completed])
+        return (view(task) if task.__class__ is int else task for task in values)
+
+    def snapshot(self) -> List[Task]:
+        """
+        Copy all tasks in insertion order. The copy of the primary index is a
+        single C-level call, so it is consistent even while other threads write.
+        """
+        values = list(self._tasks.values())
+        if self._snapshot is not None:
+            view = self._snapshot.view
+            values = [view(task) if task.__class__ is int else task for task in values]
+        return values
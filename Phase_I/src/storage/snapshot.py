@@ -0,0 +1,257 @@
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+from ..models.task import Task
+
+# Row layout shared by snapshots and journal replay:
+# (id, title, description, completed, created_ts, updated_ts)
+TaskRow = Tuple[int, str, Optional[str], bool, float, float]
+
+SNAPSHOT_PATTERN = re.compile(r"^snapshot-(\d{8})\.bin$")
+MAGIC = b"TSNP"
+VERSION = 2
+
+# File layout (little-endian):
+#   header   magic, version, reserved, record count, max_id, last_segment,
+#            body CRC32, header CRC32 (over the preceding header bytes)
+#   records  fixed-width rows: id, flags, created_ts, updated_ts
+#   offsets  2 * count + 1 uint64 offsets into the heap; string 2i is the
+#            title of record i and string 2i + 1 its description
+#   heap     UTF-8 string data
+HEADER = struct.Struct("<4sHHQqqI")
+HEADER_CRC = struct.Struct("<I")
+HEADER_SIZE = HEADER.size + HEADER_CRC.size
+RECORD = struct.Struct("<qB7xdd")
+OFFSET = struct.Struct("<Q")
+FLAG_COMPLETED = 0x01
+FLAG_HAS_DESCRIPTION = 0x02
+
+
+def task_to_row(task: Task) -> TaskRow:
+    """Convert a task into a snapshot row with epoch timestamps."""
+    return (task.id, task.title, task.description, task.completed,
+            task.created_at.timestamp(), task.updated_at.timestamp())
+
+
+def row_to_task(row: TaskRow) -> Task:
+    """Rebuild a task from a snapshot row."""
+    task_id, title, description, completed, created_ts, updated_ts = row
+    return Task(
+        id=task_id,
+        title=title,
+        description=description,
+        completed=completed,
+        created_at=datetime.fromtimestamp(created_ts),
+        updated_at=datetime.fromtimestamp(updated_ts)
+    )
+
+
+def snapshot_path(data_dir: str, last_segment: int) -> str:
+    """Return the path of the snapshot that covers journal segments up to `last_segment`."""
+    return os.path.join(data_dir, f"snapshot-{last_segment:08d}.bin")
+
+
+def list_snapshots(data_dir: str) -> List[int]:
+    """Return the last_segment numbers of all snapshots in the directory, in order."""
+    snapshots = []
+    for name in os.listdir(data_dir):
+        match = SNAPSHOT_PATTERN.match(name)
+        if match:
+            snapshots.append(int(match.group(1)))
+    return sorted(snapshots)
+
+
+def write_snapshot(path: str, rows: Iterable[TaskRow], max_id: int, last_segment: int):
+    """
+    Atomically write a snapshot. Rows are stored in ascending id order so
+    readers can binary-search them; the file is written to a temporary path,
+    fsynced and then renamed into place.
+    """
+    rows = list(rows)
+    if any(rows[i][0] >= rows[i + 1][0] for i in range(len(rows) - 1)):
+        rows.sort(key=lambda row: row[0])
+
+    records = bytearray(RECORD.size * len(rows))
+    offsets = array("Q", [0])
+    heap = bytearray()
+    for index, (task_id, title, description, completed, created_ts, updated_ts) in enumerate(rows):
+        flags = FLAG_COMPLETED if completed else 0
+        heap += title.encode("utf-8")
+        offsets.append(len(heap))
+        if description is not None:
+            flags |= FLAG_HAS_DESCRIPTION
+            heap += description.encode("utf-8")
+        offsets.append(len(heap))
+        RECORD.pack_into(records, index * RECORD.size, task_id, flags, created_ts, updated_ts)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    offset_bytes = offsets.tobytes()
+
+    body_crc = zlib.crc32(heap, zlib.crc32(offset_bytes, zlib.crc32(records)))
+    header = HEADER.pack(MAGIC, VERSION, 0, len(rows), max_id, last_segment, body_crc)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(HEADER_CRC.pack(zlib.crc32(header)))
+        f.write(records)
+        f.write(offset_bytes)
+        f.write(heap)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class MappedSnapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file:
+    - Opening validates the header, version and checksums without parsing rows
+    - Records are fixed-width, so row i is found by arithmetic
+    - Rows are sorted by id, so lookup by id is a binary search
+    - Strings are decoded from the heap only when a field is touched
+    """
+
+    def __init__(self, path: str, verify: bool = True):
+        """Map `path` and validate it; raises ValueError on a corrupt file."""
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER_SIZE:
+                raise ValueError(f"Snapshot {path} is truncated")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._validate(size, verify)
+        except ValueError:
+            # Probing a corrupt or outdated snapshot must not leak the mapping
+            self._mmap.close()
+            raise
+
+    def _validate(self, size: int, verify: bool):
+        """Check the header, version, length and (optionally) the body checksum."""
+        path = self.path
+        header = self._mmap[:HEADER.size]
+        magic, version, _, count, max_id, last_segment, body_crc = HEADER.unpack(header)
+        (header_crc,) = HEADER_CRC.unpack_from(self._mmap, HEADER.size)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a task snapshot")
+        if zlib.crc32(header) != header_crc:
+            raise ValueError(f"Snapshot {path} has a corrupt header")
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version {version} in {path}")
+
+        self.count = count
+        self.max_id = max_id
+        self.last_segment = last_segment
+        self._records_offset = HEADER_SIZE
+        self._offsets_offset = self._records_offset + count * RECORD.size
+        self._heap_offset = self._offsets_offset + (2 * count + 1) * OFFSET.size
+        if self._heap_offset > size:
+            raise ValueError(f"Snapshot {path} is truncated")
+        if verify:
+            with memoryview(self._mmap) as view:
+                body_ok = zlib.crc32(view[HEADER_SIZE:]) == body_crc
+            if not body_ok:
+                raise ValueError(f"Snapshot {path} failed its checksum")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        """Unmap the file. Views created from this snapshot become invalid."""
+        self._mmap.close()
+
+    def record(self, index: int) -> Tuple[int, int, float, float]:
+        """Return the fixed-width fields (id, flags, created_ts, updated_ts) of a row."""
+        return RECORD.unpack_from(self._mmap, self._records_offset + index * RECORD.size)
+
+    def iter_records(self) -> Iterator[Tuple[int, int, float, float]]:
+        """Iterate the fixed-width fields of every row in id order."""
+        return RECORD.iter_unpack(memoryview(self._mmap)[self._records_offset:self._offsets_offset])
+
+    def string(self, number: int) -> str:
+        """Decode string `number` from the heap."""
+        start, end = struct.unpack_from("<QQ", self._mmap, self._offsets_offset + number * OFFSET.size)
+        return self._mmap[self._heap_offset + start:self._heap_offset + end].decode("utf-8")
+
+    def find(self, task_id: int) -> Optional[int]:
+        """Binary-search the row index of `task_id`."""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            (middle_id,) = struct.unpack_from("<q", self._mmap, self._records_offset + middle * RECORD.size)
+            if middle_id < task_id:
+                low = middle + 1
+            elif middle_id > task_id:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def row(self, index: int) -> TaskRow:
+        """Decode a full row."""
+        task_id, flags, created_ts, updated_ts = self.record(index)
+        description = self.string(2 * index + 1) if flags & FLAG_HAS_DESCRIPTION else None
+        return (task_id, self.string(2 * index), description, bool(flags & FLAG_COMPLETED),
+                created_ts, updated_ts)
+
+    def iter_rows(self) -> Iterator[TaskRow]:
+        """Decode every row in id order."""
+        for index in range(self.count):
+            yield self.row(index)
+
+    def view(self, index: int) -> "SnapshotTaskView":
+        """Return a lazily decoded Task-like view of a row."""
+        return SnapshotTaskView(self, index)
+
+
+class SnapshotTaskView:
+    """
+    Read-only Task-like view of a snapshot row. The fixed-width fields are
+    read on creation; strings and datetimes are decoded on first access.
+    """
+
+    __slots__ = ("_snapshot", "_index", "id", "completed", "_flags", "_created_ts", "_updated_ts",
+                 "_title", "_description", "_decoded")
+
+    def __init__(self, snapshot: MappedSnapshot, index: int):
+        self._snapshot = snapshot
+        self._index = index
+        self.id, self._flags, self._created_ts, self._updated_ts = snapshot.record(index)
+        self.completed = bool(self._flags & FLAG_COMPLETED)
+        self._decoded = False
+
+    def _decode(self):
+        self._title = self._snapshot.string(2 * self._index)
+        self._description = None
+        if self._flags & FLAG_HAS_DESCRIPTION:
+            self._description = self._snapshot.string(2 * self._index + 1)
+        self._decoded = True
+
+    @property
+    def title(self) -> str:
+        if not self._decoded:
+            self._decode()
+        return self._title
+
+    @property
+    def description(self) -> Optional[str]:
+        if not self._decoded:
+            self._decode()
+        return self._description
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self._created_ts)
+
+    @property
+    def updated_at(self) -> datetime:
+        return datetime.fromtimestamp(self._updated_ts)
+
+    def __repr__(self) -> str:
+        return f"SnapshotTaskView(id={self.id}, title={self.title!r}, completed={self.completed})"
@@ -0,0 +1,165 @@
+import itertools
+import sqlite3
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, Tuple
+from ..models.task import Task
+from .base import TaskStore
+from .snapshot import task_to_row
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+"""
+
+# SQL text is kept constant so the connection's statement cache reuses each
+# prepared statement instead of re-parsing it on every call
+COLUMNS = "id, title, description, completed, created_at, updated_at"
+INSERT_TASK = f"INSERT INTO tasks ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+SELECT_TASK = f"SELECT {COLUMNS} FROM tasks WHERE id = ?"
+SELECT_ALL = f"SELECT {COLUMNS} FROM tasks ORDER BY id"
+SELECT_BY_STATUS = f"SELECT {COLUMNS} FROM tasks WHERE completed = ? ORDER BY id"
+UPDATE_TEXT = "UPDATE tasks SET title = ?, description = ?, updated_at = ? WHERE id = ?"
+UPDATE_COMPLETED = "UPDATE tasks SET completed = ?, updated_at = ? WHERE id = ?"
+DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+CONTAINS_TASK = "SELECT 1 FROM tasks WHERE id = ?"
+COUNT_ALL = "SELECT COUNT(*) FROM tasks"
+COUNT_BY_STATUS = "SELECT COUNT(*) FROM tasks WHERE completed = ?"
+SELECT_SEQUENCE = "SELECT seq FROM sqlite_sequence WHERE name = 'tasks'"
+
+
+def _row_to_task(row: Tuple) -> Task:
+    task_id, title, description, completed, created_ts, updated_ts = row
+    return Task(
+        id=task_id,
+        title=title,
+        description=description,
+        completed=bool(completed),
+        created_at=datetime.fromtimestamp(created_ts),
+        updated_at=datetime.fromtimestamp(updated_ts)
+    )
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    Task storage engine backed by an SQLite database:
+    - WAL journal with synchronous=NORMAL, so readers never block the writer
+      and a commit costs one append to the log
+    - An index on completed serves filtered listing and counting
+    - Single mutations autocommit; add_many inserts in batched transactions
+    - Listing streams rows from a cursor instead of loading the table
+
+    Tasks returned by get() are detached copies; change them through the
+    store so the database stays authoritative.
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 10_000):
+        """Open (or create) the database at `path`."""
+        self.path = path
+        self.batch_size = batch_size
+        # isolation_level=None: autocommit, with explicit BEGIN for batches
+        self._connection = sqlite3.connect(path, isolation_level=None, cached_statements=64)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        # AUTOINCREMENT keeps the highest id ever inserted, even after it is deleted
+        row = self._connection.execute(SELECT_SEQUENCE).fetchone()
+        self._max_id = row[0] if row else 0
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __contains__(self, task_id: int) -> bool:
+        return self._connection.execute(CONTAINS_TASK, (task_id,)).fetchone() is not None
+
+    def max_id(self) -> int:
+        """Return the highest task id ever stored."""
+        return self._max_id
+
+    def add(self, task: Task) -> Task:
+        """Insert a new task in its own transaction."""
+        try:
+            self._connection.execute(INSERT_TASK, task_to_row(task))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Task with ID {task.id} already exists")
+        if task.id > self._max_id:
+            self._max_id = task.id
+        return task
+
+    def add_many(self, tasks: Iterable[Task]) -> int:
+        """
+        Insert tasks in transactions of `batch_size` rows and return how many
+        were added. A failing batch is rolled back; earlier batches stay.
+        """
+        connection = self._connection
+        tasks = iter(tasks)
+        added = 0
+        while True:
+            rows = [task_to_row(task) for task in itertools.islice(tasks, self.batch_size)]
+            if not rows:
+                return added
+            connection.execute("BEGIN")
+            try:
+                connection.executemany(INSERT_TASK, rows)
+            except sqlite3.IntegrityError as e:
+                connection.execute("ROLLBACK")
+                raise ValueError(f"Could not add tasks: {e}")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            added += len(rows)
+            self._max_id = max(self._max_id, max(row[0] for row in rows))
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Get a task by its ID."""
+        row = self._connection.execute(SELECT_TASK, (task_id,)).fetchone()
+        return _row_to_task(row) if row is not None else None
+
+    def update(self, task_id: int, title: str = None, description: str = None) -> Optional[Task]:
+        """Update the title and/or description of a task."""
+        task = self.get(task_id)
+        if task is None:
+            return None
+        task.update(title, description)
+        self._connection.execute(
+            UPDATE_TEXT, (task.title, task.description, task.updated_at.timestamp(), task_id)
+        )
+        return task
+
+    def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """Set the completion status of a task."""
+        task = self.get(task_id)
+        if task is None:
+            return None
+        task.set_completed(completed)
+        self._connection.execute(UPDATE_COMPLETED, (completed, task.updated_at.timestamp(), task_id))
+        return task
+
+    def delete(self, task_id: int) -> bool:
+        """Remove a task."""
+        return self._connection.execute(DELETE_TASK, (task_id,)).rowcount > 0
+
+    def count(self, completed: Optional[bool] = None) -> int:
+        """Count all tasks, or only pending/done tasks (served by the completed index)."""
+        if completed is None:
+            return self._connection.execute(COUNT_ALL).fetchone()[0]
+        return self._connection.execute(COUNT_BY_STATUS, (completed,)).fetchone()[0]
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[Task]:
+        """Stream tasks in id order from a cursor, optionally filtered by status."""
+        if completed is None:
+            cursor = self._connection.execute(SELECT_ALL)
+        else:
+            cursor = self._connection.execute(SELECT_BY_STATUS, (completed,))
+        return map(_row_to_task, cursor)
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
@@ -1,8 +1,24 @@
 """
 Test script for Phase I Todo Console App
 """
+import io
+import os
+import random
+import sys
+import tempfile
+import threading
+
+from src.models.task import Task
+from src.services.concurrent_task_service import ConcurrentTaskService
 from src.services.task_service import TaskService
+from src.services.task_transfer import read_records
+from src.cli.batch import BatchRunner
+from src.cli.commands import CommandError, tokenize
 from src.cli.console import ConsoleInterface
+from src.storage.durable_store import DurableTaskStore
+from src.storage.memory_store import InMemoryTaskStore
+from src.storage.snapshot import MappedSnapshot, task_to_row, write_snapshot
+from src.storage.sqlite_store import SQLiteTaskStore
 
 
 def test_task_operations():
@@ -103,7 +119,451 @@ def test_console_commands():
     print("✓ Command parsing tests completed!")
 
 
+def test_task_store_indexes():
+    """Test that the indexed task store stays consistent across mutations."""
+    print("\nTesting indexed task store...")
+
+    task_service = TaskService()
+    for i in range(1, 11):
+        task_service.add_task(f"Task {i}")
+
+    task_service.mark_task_complete(3)
+    task_service.mark_task_complete(7)
+    task_service.delete_task(5)
+    task_service.delete_task(7)
+
+    store = task_service.store
+    assert len(store) == 8
+    assert [task.id for task in task_service.get_all_tasks()] == [1, 2, 3, 4, 6, 8, 9, 10]
+    assert [task.id for task in store.iter_tasks(completed=True)] == [3]
+    assert store.count(completed=False) == 7
+    assert task_service.get_task_by_id(5) is None
+    assert task_service.delete_task(5) is False
+
+    task_service.mark_task_incomplete(3)
+    assert store.count(completed=True) == 0
+    assert task_service.add_task("Task 11").id == 11
+    print("✓ Task store index tests completed!")
+
+
+def test_durable_storage():
+    """Test that journaled tasks survive a restart, with and without compaction."""
+    print("\nTesting durable storage...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = DurableTaskStore(data_dir, segment_size=3)
+        task_service = TaskService(store)
+        task_service.add_task("Buy groceries", "Milk, eggs, bread")
+        task_service.add_task("Complete project")
+        task_service.add_task("Call mom")
+        task_service.update_task(2, "Complete Phase I project", "Finish the console app")
+        task_service.mark_task_complete(1)
+        task_service.delete_task(3)
+        store.close()
+
+        # Restart from the journal alone
+        store = DurableTaskStore(data_dir)
+        task_service = TaskService(store)
+        tasks = task_service.get_all_tasks()
+        assert [(t.id, t.title, t.completed) for t in tasks] == [
+            (1, "Buy groceries", True), (2, "Complete Phase I project", False)]
+        assert tasks[1].description == "Finish the console app"
+        assert task_service.add_task("Next task").id == 4
+        store.flush()
+
+        # Compact everything but the active segment, then restart again
+        assert store.snapshotter.compact()
+        store.close()
+        store = DurableTaskStore(data_dir)
+        assert store.replayed_records == 1
+        assert [t.id for t in store.iter_tasks()] == [1, 2, 4]
+        assert store.get(1).created_at == tasks[0].created_at
+        store.close()
+
+    print("✓ Durable storage tests completed!")
+
+
+def test_mapped_snapshot_round_trip():
+    """Test the binary snapshot format against TaskService state."""
+    print("\nTesting memory-mapped snapshots...")
+
+    task_service = TaskService()
+    task_service.add_task("Buy groceries", "Milk, eggs, bread")
+    task_service.add_task("Ünïcödé title ✓")
+    task_service.add_task("Call mom", "")
+    task_service.mark_task_complete(2)
+    task_service.delete_task(1)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, "snapshot-00000001.bin")
+        write_snapshot(path, (task_to_row(t) for t in task_service.get_all_tasks()), max_id=3, last_segment=1)
+
+        snapshot = MappedSnapshot(path)
+        assert (len(snapshot), snapshot.max_id, snapshot.last_segment) == (2, 3, 1)
+        assert snapshot.find(3) == 1 and snapshot.find(1) is None
+        for task, row in zip(task_service.get_all_tasks(), snapshot.iter_rows()):
+            assert row == task_to_row(task)
+
+        # Stores index the mapping without decoding rows until they are fetched
+        store = InMemoryTaskStore()
+        store.load_snapshot(snapshot)
+        views = list(store.iter_tasks())
+        assert [type(v).__name__ for v in views] == ["SnapshotTaskView"] * 2
+        assert views[0].title == "Ünïcödé title ✓" and views[0].completed
+        assert views[1].description == ""
+        assert store.count(completed=True) == 1 and store.max_id() == 3
+        store.set_completed(3, True)
+        assert isinstance(store.get(3), Task) and store.count(completed=True) == 2
+        snapshot.close()
+
+        # Any flipped byte is caught by the checksums
+        with open(path, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 0xFF]))
+        rejected = MappedSnapshot.__new__(MappedSnapshot)
+        try:
+            rejected.__init__(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("corrupt snapshot was accepted")
+        # ...and the rejected file is unmapped rather than leaked
+        assert rejected._mmap.closed
+
+    print("✓ Mapped snapshot tests completed!")
+
+
+def test_batch_mode():
+    """Test running a command script without prompts."""
+    print("\nTesting batch mode...")
+
+    script = io.StringIO(
+        '# seed data\n'
+        'add "Buy groceries" "Milk, eggs, bread"\n'
+        '\n'
+        'add "Call mom"\n'
+        'complete 1\n'
+        'delete 42\n'
+        'quit\n'
+        'add "Never reached"\n'
+    )
+    task_service = TaskService()
+    output = io.StringIO()
+    summary = BatchRunner(task_service, output).run(script)
+    assert (summary.commands, summary.errors) == (5, 1)
+    assert "Task added successfully! ID: 2, Title: Call mom" in output.getvalue()
+    assert len(task_service.get_all_tasks()) == 2
+
+    quiet_output = io.StringIO()
+    BatchRunner(TaskService(), quiet_output, echo=False).run(['add "Task"', "list"])
+    assert quiet_output.getvalue().startswith("Processed 2 commands (0 errors)")
+    print("✓ Batch mode tests completed!")
+
+
+def test_list_paging_and_filters():
+    """Test list filtering, limit/offset and page options."""
+    print("\nTesting list paging and filters...")
+
+    task_service = TaskService()
+    for i in range(1, 8):
+        task_service.add_task(f"Task {i}")
+    task_service.mark_task_complete(2)
+    task_service.mark_task_complete(4)
+
+    def listed(args):
+        output = io.StringIO()
+        console = ConsoleInterface(task_service, output=output)
+        command, parsed = console.parse_command("list " + args)
+        console.execute_command(command, parsed)
+        return [int(line.split("]")[0].split("[")[1]) for line in output.getvalue().splitlines()
+                if line.startswith(("✓ [", "○ ["))], output.getvalue()
+
+    assert listed("")[0] == [1, 2, 3, 4, 5, 6, 7]
+    assert listed("--done")[0] == [2, 4]
+    assert listed("--pending --limit 2 --offset 1")[0] == [3, 5]
+    ids, text = listed("--page 2 --limit 3")
+    assert ids == [4, 5, 6] and "Showing 4-6 of 7 tasks" in text
+    assert listed("--pending --page 9")[1].strip() == "No tasks found."
+    assert "must be at least 1" in listed("--limit 0")[1]
+    print("✓ List paging tests completed!")
+
+
+def test_command_grammar():
+    """Test the tokenizer, aliases, abbreviations and argument schemas."""
+    print("\nTesting command grammar and dispatch...")
+
+    assert tokenize('add "say \\"hi\\"" \'it\\\'s\' plain') == ['add', 'say "hi"', "it's", "plain"]
+    assert tokenize('add "" "unterminated rest') == ["add", "", "unterminated rest"]
+
+    task_service = TaskService()
+    output = io.StringIO()
+    console = ConsoleInterface(task_service, output=output)
+    assert console.commands.resolve("ls").name == "list"
+    assert console.commands.resolve("comp").name == "complete"
+    assert console.commands.resolve("exit").name == "quit"
+    try:
+        console.commands.resolve("d")
+    except CommandError as e:
+        assert "complete" in str(e) and "delete" in str(e)
+    else:
+        raise AssertionError("ambiguous prefix was resolved")
+
+    for line in ['add "Buy groceries" "Milk"', "done 1", "upd 1", "rm one", 'add a b c']:
+        console.execute_command(*console.parse_command(line))
+    assert task_service.get_task_by_id(1).completed
+    assert console.error_count == 3
+    assert 'Usage: update <id> "new title" "new description"' in output.getvalue()
+    assert "Task ID must be a number" in output.getvalue()
+    assert console.execute_command("quit", []) is False
+    print("✓ Command grammar tests completed!")
+
+
+def test_full_text_search():
+    """Test BM25 search, prefix matching and incremental index maintenance."""
+    print("\nTesting full-text search...")
+
+    task_service = TaskService()
+    task_service.add_task("Buy groceries", "Milk, eggs, bread")
+    task_service.add_task("Call mom")
+    task_service.add_task("Plan trip", "Buy train tickets and groceries for the road")
+
+    results = task_service.search_tasks("groceries")
+    assert [task.id for task, _ in results] == [1, 3]  # title match outranks description
+    assert [task.id for task, _ in task_service.search_tasks("gro")] == [1, 3]
+    assert task_service.search_tasks("nothing") == []
+
+    # Index is maintained incrementally once built
+    task_service.add_task("Groom the dog")
+    task_service.update_task(2, "Call dad")
+    task_service.delete_task(1)
+    assert [task.id for task, _ in task_service.search_tasks("gro")] == [4, 3]
+    assert task_service.search_tasks("mom") == []
+    assert [task.id for task, _ in task_service.search_tasks("dad")] == [2]
+
+    stats = task_service.search_stats()
+    assert stats["documents"] == 3 and stats["memory_bytes"] > 0
+    assert "milk" not in task_service.search_index().expand("milk")
+    print("✓ Full-text search tests completed!")
+
+
+def test_concurrent_task_service():
+    """Stress N threads of mixed operations and check the store invariants."""
+    print("\nTesting concurrent task service...")
+
+    task_service = ConcurrentTaskService(stripes=8)
+    task_service.search_tasks("warm up")  # maintain the search index during the run
+    added_ids = [[] for _ in range(8)]
+    deleted = [0] * 8
+
+    def worker(number):
+        rng = random.Random(number)
+        for i in range(1500):
+            operation = rng.random()
+            if operation < 0.4 or not added_ids[number]:
+                added_ids[number].append(task_service.add_task(f"Task {number}-{i}").id)
+            else:
+                task_id = rng.randrange(1, task_service.next_id)
+                if operation < 0.6:
+                    task_service.mark_task_complete(task_id)
+                elif operation < 0.7:
+                    task_service.update_task(task_id, f"Renamed {task_id}")
+                elif operation < 0.85:
+                    deleted[number] += task_service.delete_task(task_id)
+                else:
+                    assert all(task is not None for task in task_service.get_all_tasks())
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)  # force frequent thread switches
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    all_ids = [task_id for ids in added_ids for task_id in ids]
+    assert len(all_ids) == len(set(all_ids))
+    store = task_service.store
+    tasks = task_service.get_all_tasks()
+    assert len(tasks) == len(store) == len(all_ids) - sum(deleted)
+    assert store.count(True) + store.count(False) == len(store)
+    assert all(task.completed for task in store.iter_tasks(completed=True))
+    assert not any(task.completed for task in store.iter_tasks(completed=False))
+    assert task_service.search_stats()["documents"] == len(store)
+    print("✓ Concurrent task service tests completed!")
+
+
+def test_sqlite_storage_engine():
+    """Test that the SQLite engine behaves like the in-memory engine and persists."""
+    print("\nTesting SQLite storage engine...")
+
+    def exercise(task_service):
+        task_service.add_task("Buy groceries", "Milk, eggs, bread")
+        task_service.add_tasks([("Complete project", None), ("Call mom", "Sunday")])
+        task_service.update_task(2, "Complete Phase I project", "Finish the console app")
+        task_service.mark_task_complete(1)
+        task_service.delete_task(3)
+        return ([(t.id, t.title, t.description, t.completed) for t in task_service.iter_tasks()],
+                [t.id for t in task_service.iter_tasks(completed=True)],
+                task_service.count_tasks(False),
+                [task.id for task, _ in task_service.search_tasks("project")])
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, "tasks.db")
+        store = SQLiteTaskStore(path, batch_size=1)
+        assert exercise(TaskService(store)) == exercise(TaskService())
+        assert store.update(3, "Gone") is None and not store.delete(3)
+        try:
+            store.add(Task(id=1, title="Duplicate"))
+            assert False, "duplicate id should be rejected"
+        except ValueError:
+            pass
+        store.close()
+
+        # Reopen: tasks, timestamps and the id sequence survive (id 3 is not reused)
+        store = SQLiteTaskStore(path)
+        task_service = TaskService(store)
+        assert [t.id for t in task_service.get_all_tasks()] == [1, 2]
+        assert task_service.get_task_by_id(1).completed is True
+        assert task_service.add_task("Next task").id == 4
+
+        output = io.StringIO()
+        console = ConsoleInterface(task_service, output)
+        console.execute_command(*console.parse_command("list --done"))
+        assert "[1] Buy groceries" in output.getvalue() and "[4]" not in output.getvalue()
+        store.close()
+
+    print("✓ SQLite storage engine tests completed!")
+
+
+def test_sorted_indexes():
+    """Test that sorted listing matches a full sort after random mutations."""
+    print("\nTesting sorted indexes...")
+
+    rng = random.Random(11)
+    words = ["apple", "Banana", "cherry", "date", "Elder", "fig"]
+    task_service = TaskService()
+    for i in range(60):
+        task_service.add_task(f"{rng.choice(words)} {i % 7}")
+    for field in ("title", "created_at", "updated_at"):
+        task_service.sorted_index(field)
+
+    for _ in range(200):
+        task_id = rng.randrange(1, task_service.next_id + 5)
+        operation = rng.random()
+        if operation < 0.3:
+            task_service.update_task(task_id, f"{rng.choice(words)} renamed")
+        elif operation < 0.5:
+            task_service.mark_task_complete(task_id)
+        elif operation < 0.6:
+            task_service.mark_task_incomplete(task_id)
+        elif operation < 0.75:
+            task_service.delete_task(task_id)
+        else:
+            task_service.add_task(rng.choice(words))
+
+    keys = {
+        "title": lambda task: (task.title.casefold(), task.id),
+        "created_at": lambda task: (task.created_at, task.id),
+        "updated_at": lambda task: (task.updated_at, task.id),
+    }
+    for field, key in keys.items():
+        for completed in (None, False, True):
+            expected = [task.id for task in sorted(task_service.iter_tasks(completed), key=key)]
+            listed = [task.id for task in task_service.iter_sorted_tasks(field, completed)]
+            assert listed == expected, (field, completed)
+            page = [task.id for task in task_service.iter_sorted_tasks(field, completed, 3, 5, True)]
+            assert page == expected[::-1][3:8], (field, completed)
+
+    output = io.StringIO()
+    console = ConsoleInterface(task_service, output)
+    console.execute_command(*console.parse_command("list --sort title --pending --limit 2"))
+    first = sorted(task_service.iter_tasks(completed=False), key=keys["title"])[0]
+    assert f"[{first.id}] {first.title}" in output.getvalue()
+    console.execute_command(*console.parse_command("list --sort priority"))
+    assert "must be one of title, created_at, updated_at" in output.getvalue()
+    print("✓ Sorted index tests completed!")
+
+
+def test_import_export_round_trip():
+    """Test that CSV and NDJSON export/import keep text, status and timestamps."""
+    print("\nTesting import/export round trip...")
+
+    task_service = TaskService()
+    task_service.add_task('Buy "groceries", fruit', "Milk, eggs\nbread")
+    task_service.add_task("Call mom")
+    task_service.add_task("Plan trip ✈", "Book hotel")
+    task_service.mark_task_complete(2)
+    task_service.update_task(3, "Plan summer trip ✈")
+    task_service.delete_task(1)
+    task_service.add_task("Write report")
+
+    def fields(tasks):
+        return [(t.id, t.title, t.description, t.completed, t.created_at, t.updated_at) for t in tasks]
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        for name in ("tasks.csv", "tasks.ndjson"):
+            path = os.path.join(data_dir, name)
+            output = io.StringIO()
+            console = ConsoleInterface(task_service, output)
+            console.execute_command(*console.parse_command(f'export "{path}"'))
+            assert "Exported 3 tasks" in output.getvalue()
+
+            for trusted in ("", " --trusted"):
+                imported = TaskService()
+                console = ConsoleInterface(imported, output)
+                console.execute_command(*console.parse_command(f'import "{path}" --keep-ids{trusted}'))
+                assert console.error_count == 0, output.getvalue()
+                assert fields(imported.iter_tasks()) == fields(task_service.iter_tasks())
+                assert imported.add_task("Next").id == 5
+
+            # Without --keep-ids the records get fresh ids after the existing tasks
+            renumbered = TaskService()
+            renumbered.add_task("Existing")
+            with open(path, encoding="utf-8", newline="") as stream:
+                fmt = "csv" if name.endswith(".csv") else "ndjson"
+                assert renumbered.import_tasks(read_records(stream, fmt)) == 3
+            assert [t.id for t in renumbered.iter_tasks()] == [1, 2, 3, 4]
+            assert fields(renumbered.iter_tasks())[1][1:] == fields(task_service.iter_tasks())[0][1:]
+
+        # Invalid records are reported with their position
+        bad = os.path.join(data_dir, "bad.ndjson")
+        with open(bad, "w", encoding="utf-8") as stream:
+            stream.write('{"title": "ok"}\n{"title": "", "completed": false}\n')
+        output = io.StringIO()
+        console = ConsoleInterface(TaskService(), output)
+        console.execute_command(*console.parse_command(f'import "{bad}"'))
+        assert "Record 2: Title must be between 1 and 200 characters" in output.getvalue()
+        # ...along with how many tasks were stored before it, on every engine
+        for store in (InMemoryTaskStore(), SQLiteTaskStore(":memory:", batch_size=1)):
+            with open(bad, encoding="utf-8") as stream:
+                try:
+                    TaskService(store).import_tasks(read_records(stream, "ndjson"))
+                except ValueError as e:
+                    assert "(tasks imported before the error: 1)" in str(e), str(e)
+                else:
+                    raise AssertionError("invalid record was accepted")
+            store.close()
+
+    print("✓ Import/export tests completed!")
+
+
 if __name__ == "__main__":
     test_task_operations()
     test_console_commands()
-    print("\n🎉 All Phase I tests completed successfully!")
\ No newline at end of file
+    test_task_store_indexes()
+    test_durable_storage()
+    test_mapped_snapshot_round_trip()
+    test_batch_mode()
+    test_list_paging_and_filters()
+    test_command_grammar()
+    test_full_text_search()
+    test_concurrent_task_service()
+    test_sqlite_storage_engine()
+    test_sorted_indexes()
+    test_import_export_round_trip()
+    print("\n🎉 All Phase I tests completed successfully!")
@@ -1,5 +1,7 @@
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
@@ -7,8 +9,11 @@ from pydantic import BaseModel
 import os
 from dotenv import load_dotenv
 from sqlmodel import Session, select
-from models import User
-from database import get_session
+from models import User, UserRevocation
+from database import engine, get_async_session, get_session
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Load environment variables
 load_dotenv()
@@ -18,12 +23,96 @@ SECRET_KEY = os.getenv("BETTER_AUTH_SECRET", "your-secret-key-change-in-producti
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# Stateless mode (opt-in) trusts the signed token and checks the in-process revocation list
+# instead of loading the user on every request
+AUTH_STATELESS = os.getenv("AUTH_STATELESS", "false").lower() in ("1", "true", "yes")
+REVOCATION_REFRESH_SECONDS = float(os.getenv("REVOCATION_REFRESH_SECONDS", "30"))
+
 # Security schemes
 security = HTTPBearer()
 
 class TokenData(BaseModel):
     user_id: int  # Changed from str to int
     email: Optional[str] = None
+    issued_at: int = 0  # 'iat' claim (0 for tokens issued before it was added)
+
+
+class RevocationList:
+    """
+    In-process copy of the userrevocation table (user id -> revoked_at epoch seconds).
+
+    A token is rejected when its user is listed and it was issued at or before the
+    revocation, so a reused user id does not inherit the block. The copy is reloaded
+    from the database at most every `refresh_seconds`; revocations made by this
+    process apply immediately.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], refresh_seconds: float = REVOCATION_REFRESH_SECONDS):
+        self.session_factory = session_factory
+        self.refresh_seconds = refresh_seconds
+        self._revoked: Dict[int, float] = {}
+        self._loaded_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Reload the revocation table"""
+        with self.session_factory() as session:
+            rows = session.exec(select(UserRevocation)).all()
+        self._load(rows)
+
+    async def refresh_async(self, session: "AsyncSession"):
+        """Reload the revocation table through an async session"""
+        rows = (await session.exec(select(UserRevocation))).all()
+        self._load(rows)
+
+    def _load(self, rows):
+        self._revoked = {row.user_id: row.revoked_at.timestamp() for row in rows}
+        self._loaded_at = time.monotonic()
+
+    def _is_stale(self) -> bool:
+        return time.monotonic() - self._loaded_at >= self.refresh_seconds
+
+    def _refresh_if_stale(self):
+        if not self._is_stale():
+            return
+        # One caller reloads; concurrent callers keep using the current copy
+        if self._lock.acquire(blocking=False):
+            try:
+                if self._is_stale():
+                    self.refresh()
+            finally:
+                self._lock.release()
+
+    async def refresh_if_stale_async(self, session: "AsyncSession"):
+        """Reload through `session` when the copy is stale (a non-blocking acquire, so the event loop never waits)"""
+        if not self._is_stale():
+            return
+        if self._lock.acquire(blocking=False):
+            try:
+                if self._is_stale():
+                    await self.refresh_async(session)
+            finally:
+                self._lock.release()
+
+    def revoke(self, user_id: int, revoked_at: float):
+        """Apply a revocation recorded by this process without waiting for a reload"""
+        revoked = dict(self._revoked)
+        revoked[user_id] = revoked_at
+        self._revoked = revoked
+
+    def invalidate(self):
+        """Force a reload on the next check"""
+        self._loaded_at = float("-inf")
+
+    def is_revoked(self, token_data: TokenData, refresh: bool = True) -> bool:
+        """Check whether a token belongs to a user revoked after it was issued (refresh=False: no reload)"""
+        if refresh:
+            self._refresh_if_stale()
+        revoked_at = self._revoked.get(token_data.user_id)
+        return revoked_at is not None and token_data.issued_at <= revoked_at
+
+
+revocations = RevocationList(lambda: Session(engine))
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create an access token with expiration"""
@@ -33,7 +122,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
 
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": int(time.time())})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -53,34 +142,76 @@ def verify_token(token: str) -> Optional[TokenData]:
         except ValueError:
             return None
 
-        token_data = TokenData(user_id=user_id, email=email)
+        token_data = TokenData(user_id=user_id, email=email, issued_at=payload.get("iat", 0))
         return token_data
     except JWTError:
         return None
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), session: Session = Depends(get_session)):
-    """Get current user from JWT token in Authorization header"""
-    token = credentials.credentials
+def credentials_exception(detail: str = "Could not validate credentials") -> HTTPException:
+    """401 response asking the client to authenticate again"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def authenticate_token(token: str, session: Optional[Session] = None) -> TokenData:
+    """
+    Validate a bearer token. Without a session the signed claims are trusted and only
+    the revocation list is checked; with one the user is also loaded from the database.
+    """
     token_data = verify_token(token)
+    if token_data is None:
+        raise credentials_exception()
+
+    if revocations.is_revoked(token_data):
+        raise credentials_exception("User no longer exists")
+
+    if session is not None:
+        # Get the actual user from the database to verify they exist
+        user = session.exec(select(User).where(User.id == token_data.user_id)).first()
+        if not user:
+            raise credentials_exception("User no longer exists")
+
+    return token_data
 
+async def authenticate_token_async(token: str, session: "AsyncSession", lookup: bool) -> TokenData:
+    """authenticate_token for the async routes: the revocation reload and user lookup go through `session`"""
+    token_data = verify_token(token)
     if token_data is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Get the actual user from the database to verify they exist
-    user = session.exec(select(User).where(User.id == token_data.user_id)).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User no longer exists",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise credentials_exception()
+
+    await revocations.refresh_if_stale_async(session)
+    if revocations.is_revoked(token_data, refresh=False):
+        raise credentials_exception("User no longer exists")
+
+    if lookup:
+        user = (await session.exec(select(User).where(User.id == token_data.user_id))).first()
+        if not user:
+            raise credentials_exception("User no longer exists")
 
     return token_data
 
+# Both dependencies are plain functions so FastAPI runs them in the threadpool: the revocation
+# list reloads (and the lookup queries) through a synchronous session, which must not block the event loop
+def get_current_user_stateless(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Get current user from JWT token claims; the database is read only to refresh the revocation list"""
+    return authenticate_token(credentials.credentials)
+
+def get_current_user_with_lookup(credentials: HTTPAuthorizationCredentials = Depends(security), session: Session = Depends(get_session)):
+    """Get current user from JWT token in Authorization header, confirming the user exists"""
+    return authenticate_token(credentials.credentials, session)
+
+# Dependency used by the routes: a per-request user lookup unless AUTH_STATELESS=true
+get_current_user = get_current_user_stateless if AUTH_STATELESS else get_current_user_with_lookup
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: "AsyncSession" = Depends(get_async_session)
+):
+    """Dependency for the DB_ASYNC routes: same checks as get_current_user, on the request's AsyncSession"""
+    return await authenticate_token_async(credentials.credentials, session, lookup=not AUTH_STATELESS)
+
 def verify_user_id_match(token_user_id: int, url_user_id: str) -> bool:
     """Verify that the user ID in the token matches the user ID in the URL"""
     # Convert URL user_id to int for comparison
@@ -0,0 +1,85 @@
+"""
+Benchmark for Phase II request authentication.
+
+Seeds N users (a fraction of them revoked) in a temporary SQLite database
+and compares the per-request cost of the stateless check (JWT claims plus
+the in-process revocation list) with the user lookup it replaces, and
+reports how long a full revocation refresh takes.
+
+Run from the Phase_II/backend directory:
+    python -m benchmarks.bench_auth [--users 10000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlmodel import Session, SQLModel, create_engine
+
+import auth
+from models import User, UserRevocation
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def measure(func, tokens):
+    """Return (p50 us, p95 us) of calling func on each token."""
+    samples = []
+    for token in tokens:
+        started = time.perf_counter()
+        func(token)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples), percentile(samples, 0.95)
+
+
+def seed(engine, users: int, revoked: int):
+    with Session(engine) as session:
+        # A fixed hash keeps seeding fast; passwords are never checked here
+        session.add_all(User(email=f"user{i}@example.com", name=f"User {i}", password_hash="x")
+                        for i in range(users))
+        session.add_all(UserRevocation(user_id=users + i + 1, revoked_at=datetime.now()) for i in range(revoked))
+        session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--revoked", type=int, default=1_000, help="revoked (deleted) user ids")
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        seed(engine, args.users, args.revoked)
+
+        auth.revocations.session_factory = lambda: Session(engine)
+        started = time.perf_counter()
+        auth.revocations.refresh()
+        refresh_ms = (time.perf_counter() - started) * 1000
+
+        tokens = [auth.create_access_token({"sub": str(rng.randint(1, args.users))})
+                  for _ in range(args.requests)]
+        with Session(engine) as session:
+            cases = [
+                ("stateless (claims + revocation list)", lambda token: auth.authenticate_token(token)),
+                ("lookup (claims + SELECT user)", lambda token: auth.authenticate_token(token, session)),
+            ]
+            print(f"Users: {args.users}, revoked: {args.revoked}, requests: {args.requests}")
+            print(f"{'mode':<40} {'p50 us':>9} {'p95 us':>9}")
+            for label, func in cases:
+                p50, p95 = measure(func, tokens)
+                print(f"{label:<40} {p50:>9.1f} {p95:>9.1f}")
+        print(f"revocation refresh ({args.revoked} rows): {refresh_ms:.2f} ms "
+              f"every {auth.revocations.refresh_seconds:g}s")
+
+
+if __name__ == "__main__":
+    main()
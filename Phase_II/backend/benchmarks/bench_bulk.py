@@ -0,0 +1,110 @@
+"""
+Benchmark for the Phase II bulk task endpoints.
+
+Creates, updates and deletes N tasks through the API (in-process, with
+FastAPI's TestClient on a temporary SQLite database), once with the
+single-item endpoints (one request and one commit per task) and once with
+the tasks:bulk endpoints, and reports items/s and the SQL statements
+issued for each step. The bulk create must not cost a statement per item:
+on SQLite it is one executemany INSERT plus one SELECT for the new ids.
+
+Run from the Phase_II/backend directory:
+    python -m benchmarks.bench_bulk [--count 10000]
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Tuple
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+# Most statements one bulk create request may issue, whatever the item count (auth, INSERT, id lookup)
+BULK_CREATE_STATEMENTS = 5
+
+
+def timed(engine, func) -> Tuple[float, int]:
+    """Run func; returns (seconds taken, SQL statements issued)"""
+    statements = 0
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        started = time.perf_counter()
+        func()
+        return time.perf_counter() - started, statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def login(client: TestClient):
+    """Register and log in a user; returns (user_id, auth headers)"""
+    credentials = {"email": "bulk@example.com", "name": "Bulk", "password": "bulk-test"}
+    client.post("/auth/register", json=credentials)
+    response = client.post("/auth/login", data={"email": credentials["email"], "password": credentials["password"]})
+    body = response.json()
+    return body["user"]["id"], {"Authorization": f"Bearer {body['access_token']}"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        # The app reads its configuration at import time
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(data_dir, 'bench.db')}"
+        os.environ["SQL_PROFILING"] = "false"
+        from database import engine
+        from main import app
+
+        with TestClient(app) as client:
+            user_id, headers = login(client)
+            base = f"/api/{user_id}/tasks"
+            titles = [f"Task {i}" for i in range(args.count)]
+            ids = []
+
+            def single_create():
+                for title in titles:
+                    ids.append(client.post(base, json={"title": title}, headers=headers).json()["id"])
+
+            def single_update():
+                for task_id in ids:
+                    client.put(f"{base}/{task_id}", json={"title": f"Renamed {task_id}"}, headers=headers)
+
+            def single_delete():
+                for task_id in ids:
+                    client.delete(f"{base}/{task_id}", headers=headers)
+
+            def bulk_create():
+                response = client.post(f"{base}:bulk", json=[{"title": title} for title in titles], headers=headers)
+                ids[:] = [item["id"] for item in response.json()["results"]]
+
+            def bulk_update():
+                items = [{"id": task_id, "title": f"Renamed {task_id}", "completed": True} for task_id in ids]
+                assert client.patch(f"{base}:bulk", json=items, headers=headers).json()["failed"] == 0
+
+            def bulk_delete():
+                response = client.request("DELETE", f"{base}:bulk", json={"ids": ids}, headers=headers)
+                assert response.json()["succeeded"] == len(ids)
+
+            print(f"Items: {args.count}")
+            print(f"{'step':<8} {'single items/s':>15} {'bulk items/s':>13} {'speedup':>8} "
+                  f"{'single stmts':>13} {'bulk stmts':>11}")
+            single = [timed(engine, step) for step in (single_create, single_update, single_delete)]
+            ids.clear()
+            bulk = [timed(engine, step) for step in (bulk_create, bulk_update, bulk_delete)]
+            for label, (one, one_statements), (many, many_statements) in zip(("create", "update", "delete"),
+                                                                              single, bulk):
+                print(f"{label:<8} {args.count / one:>15,.0f} {args.count / many:>13,.0f} {one / many:>7.0f}x "
+                      f"{one_statements:>13,} {many_statements:>11,}")
+            assert bulk[0][1] <= BULK_CREATE_STATEMENTS, \
+                f"bulk create issued {bulk[0][1]} statements for {args.count} items"
+
+
+if __name__ == "__main__":
+    main()
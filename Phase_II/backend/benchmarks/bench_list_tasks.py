@@ -0,0 +1,90 @@
+"""
+Benchmark for the Phase II task listing.
+
+Seeds one user with N tasks in a temporary SQLite database and compares
+the old full listing (every task as a TaskResponse) with keyset pages,
+projected pages and deep pages, reporting encoded response size and
+p50/p95 latency (query + JSON encoding, without HTTP).
+
+Run from the Phase_II/backend directory:
+    python -m benchmarks.bench_list_tasks [--count 20000]
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlmodel import Session, SQLModel, create_engine
+
+from models import Task
+from services.task_service import TaskService
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def measure(func, repeats: int):
+    """Return (response bytes, p50 ms, p95 ms) for a listing function."""
+    samples = []
+    body = b""
+    for _ in range(repeats):
+        started = time.perf_counter()
+        body = json.dumps(jsonable_encoder(func())).encode()
+        samples.append((time.perf_counter() - started) * 1000)
+    return len(body), statistics.median(samples), percentile(samples, 0.95)
+
+
+def seed(engine, count: int):
+    now = datetime.now()
+    with Session(engine) as session:
+        session.add_all(
+            Task(user_id=1, title=f"Task {i}", description=f"Description for task {i} " * 3,
+                 completed=i % 3 == 0, due_date=now + timedelta(hours=i % 500) if i % 4 else None,
+                 created_at=now - timedelta(seconds=count - i))
+            for i in range(count)
+        )
+        session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        seed(engine, args.count)
+
+        with Session(engine) as session:
+            service = TaskService(session)
+            # Cursor for the page halfway through the list
+            cursor = None
+            for _ in range(args.count // 200):
+                _, cursor = service.get_tasks_page(1, limit=100, cursor=cursor)
+
+            cases = [
+                ("before: full list", lambda: service.get_tasks_by_user_id(1), 3),
+                ("after: first page (100)", lambda: service.get_tasks_page(1)[0], args.repeats),
+                ("after: page 100, fields=id,title,completed",
+                 lambda: service.get_tasks_page(1, fields="id,title,completed")[0], args.repeats),
+                ("after: middle page via cursor", lambda: service.get_tasks_page(1, cursor=cursor)[0], args.repeats),
+                ("after: first page by due_date",
+                 lambda: service.get_tasks_page(1, sort_by="due_date")[0], args.repeats),
+            ]
+            print(f"Tasks for one user: {args.count}")
+            print(f"{'case':<44} {'bytes':>11} {'p50 ms':>9} {'p95 ms':>9}")
+            for label, func, repeats in cases:
+                size, p50, p95 = measure(func, repeats)
+                print(f"{label:<44} {size:>11,} {p50:>9.2f} {p95:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
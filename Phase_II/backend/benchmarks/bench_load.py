@@ -0,0 +1,136 @@
+"""
+Load test for the Phase II task routes, sync vs async.
+
+Starts the API under uvicorn twice on a temporary SQLite database, once
+with the sync routes (threadpool) and once with DB_ASYNC=true (async
+routes on aiosqlite), and drives each with many concurrent clients doing
+a mix of page listings, single-task reads and creates. Reports requests/s
+and p50/p95/p99 latency per mode.
+
+Run from the Phase_II/backend directory (needs aiosqlite):
+    python -m benchmarks.bench_load [--concurrency 200] [--requests 20000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_path: str, port: int, async_mode: bool) -> subprocess.Popen:
+    env = dict(os.environ,
+               DATABASE_URL=f"sqlite:///{database_path}",
+               DB_ASYNC="true" if async_mode else "false",
+               SQL_PROFILING="false")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+
+
+async def wait_until_up(client: httpx.AsyncClient, timeout: float = 20.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+        await asyncio.sleep(0.1)
+
+
+async def prepare(client: httpx.AsyncClient, seed_tasks: int):
+    """Register and log in a user, then seed tasks; returns (user_id, auth headers, task ids)"""
+    credentials = {"email": "load@example.com", "name": "Load", "password": "load-test"}
+    await client.post("/auth/register", json=credentials)
+    login = (await client.post("/auth/login", data={"email": credentials["email"],
+                                                    "password": credentials["password"]})).json()
+    user_id, headers = login["user"]["id"], {"Authorization": f"Bearer {login['access_token']}"}
+    task_ids = []
+    for i in range(seed_tasks):
+        created = await client.post(f"/api/{user_id}/tasks", json={"title": f"Seed {i}"}, headers=headers)
+        task_ids.append(created.json()["id"])
+    return user_id, headers, task_ids
+
+
+async def run_load(client: httpx.AsyncClient, user_id: int, headers: dict, task_ids: list,
+                   concurrency: int, requests: int):
+    """Fire `requests` mixed requests from `concurrency` workers; returns (elapsed s, latencies ms, errors)"""
+    rng = random.Random(11)
+    plan = rng.choices(["list", "get", "create"], weights=[5, 4, 1], k=requests)
+    queue = iter(plan)
+    latencies, errors = [], 0
+
+    async def worker():
+        nonlocal errors
+        for kind in queue:
+            if kind == "list":
+                call = client.get(f"/api/{user_id}/tasks", params={"limit": 20}, headers=headers)
+            elif kind == "get":
+                call = client.get(f"/api/{user_id}/tasks/{rng.choice(task_ids)}", headers=headers)
+            else:
+                call = client.post(f"/api/{user_id}/tasks", json={"title": "Load task"}, headers=headers)
+            started = time.perf_counter()
+            response = await call
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += response.status_code >= 400
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, errors
+
+
+async def bench_mode(async_mode: bool, args) -> tuple:
+    with tempfile.TemporaryDirectory() as data_dir:
+        port = free_port()
+        server = start_server(os.path.join(data_dir, "load.db"), port, async_mode)
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        try:
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits,
+                                         timeout=60.0) as client:
+                await wait_until_up(client)
+                user_id, headers, task_ids = await prepare(client, args.seed)
+                # Warm up connections and caches before measuring
+                await run_load(client, user_id, headers, task_ids, args.concurrency, args.concurrency * 2)
+                return await run_load(client, user_id, headers, task_ids, args.concurrency, args.requests)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=500, help="tasks created before the run")
+    args = parser.parse_args()
+
+    print(f"Concurrency: {args.concurrency}, requests: {args.requests} (50% list, 40% get, 10% create)")
+    print(f"{'mode':<8} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for label, async_mode in (("sync", False), ("async", True)):
+        elapsed, latencies, errors = asyncio.run(bench_mode(async_mode, args))
+        print(f"{label:<8} {len(latencies) / elapsed:>9,.0f} {statistics.median(latencies):>9.1f} "
+              f"{percentile(latencies, 0.95):>9.1f} {percentile(latencies, 0.99):>9.1f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
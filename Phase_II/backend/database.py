@@ -1,3 +1,5 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import make_url
 from sqlmodel import create_engine, Session, SQLModel
 from models import Task
 from dotenv import load_dotenv
@@ -9,15 +11,58 @@ load_dotenv()
 # Get database URL from environment variable
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./todo_app.db")
 
+# Raw statement logging is noisy and slow; opt in with SQL_ECHO=true
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() in ("1", "true", "yes")
+
 # Create engine
 connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, echo=True, connect_args=connect_args)
+engine = create_engine(DATABASE_URL, echo=SQL_ECHO, connect_args=connect_args)
+
+# Serve the task routes as async endpoints on an async engine instead of sync endpoints in the threadpool
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+
+# Async driver for each sync URL scheme
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+def async_database_url(url: str) -> str:
+    """Turn a sync database URL into its async-driver equivalent (sqlite -> aiosqlite, postgresql -> asyncpg)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend} databases")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+# The async engine is only created when enabled, so aiosqlite/asyncpg stay optional
+async_engine = None
+async_session_factory = None
+if DB_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    async_engine = create_async_engine(async_database_url(DATABASE_URL), echo=SQL_ECHO)
+    # Objects stay readable after commit without another round-trip
+    async_session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
 def create_db_and_tables():
     """Create database tables"""
     SQLModel.metadata.create_all(engine)
+    upgrade_schema()
+
+def upgrade_schema():
+    """Bring tables created by older versions up to date (columns and indexes added since)"""
+    columns = {column["name"] for column in inspect(engine).get_columns(Task.__tablename__)}
+    with engine.begin() as connection:
+        if "due_date" not in columns:
+            connection.execute(text(f"ALTER TABLE {Task.__tablename__} ADD COLUMN due_date TIMESTAMP"))
+        for index in Task.__table__.indexes:
+            index.create(connection, checkfirst=True)
 
 def get_session():
     """Get database session"""
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_async_session():
+    """Get async database session"""
+    async with async_session_factory() as session:
+        yield session
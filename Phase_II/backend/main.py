@@ -1,14 +1,19 @@
-from fastapi import FastAPI
+import time
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from routes import tasks
 from routes.auth import router as auth_router
 import os
 from dotenv import load_dotenv
-from database import create_db_and_tables
+from database import DB_ASYNC, async_engine, create_db_and_tables, engine
+from profiling import profiler, route_key
+from auth import get_current_user
 
 # Load environment variables
 load_dotenv()
 
+# Per-request SQL profiling (Server-Timing headers and /debug/sql-stats); off unless asked for
+SQL_PROFILING = os.getenv("SQL_PROFILING", "false").lower() in ("1", "true", "yes")
+
 # Create FastAPI app instance
 app = FastAPI(
     title="Todo API - Phase II",
@@ -16,11 +21,22 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Task routes: async endpoints on the async engine, or sync endpoints run in the threadpool
+if DB_ASYNC:
+    from routes import tasks_async as tasks
+else:
+    from routes import tasks
+
 # Create database tables on startup
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    if async_engine is not None:
+        await async_engine.dispose()
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -28,8 +44,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the pagination and profiling headers
+    expose_headers=["X-Next-Cursor", "Link", "Server-Timing"],
 )
 
+# Attribute SQL statements to requests and routes
+if SQL_PROFILING:
+    profiler.install(engine)
+    if async_engine is not None:
+        # Cursor events of an async engine fire on its sync facade
+        profiler.install(async_engine.sync_engine)
+
+    @app.middleware("http")
+    async def sql_profiler_middleware(request: Request, call_next):
+        stats = profiler.start_request()
+        started = time.perf_counter()
+        response = await call_next(request)
+        total_ms = (time.perf_counter() - started) * 1000
+        response.headers["Server-Timing"] = stats.server_timing(total_ms)
+        profiler.finish_request(route_key(request.scope), stats, total_ms)
+        return response
+
+    # The aggregated statements describe every user's traffic: only signed-in callers may read or reset them
+    @app.get("/debug/sql-stats", tags=["debug"], dependencies=[Depends(get_current_user)])
+    def sql_stats():
+        """Statement count and DB time aggregated per route"""
+        return {"routes": profiler.snapshot()}
+
+    @app.delete("/debug/sql-stats", tags=["debug"], dependencies=[Depends(get_current_user)])
+    def reset_sql_stats():
+        """Clear the aggregated SQL statistics"""
+        profiler.reset()
+        return {"message": "SQL statistics reset"}
+
 # Include API routes
 app.include_router(tasks.router, prefix="/api/{user_id}", tags=["tasks"])
 app.include_router(auth_router, prefix="/auth", tags=["auth"])
@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel, Field, create_engine, Session
+from sqlalchemy import Index
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, field_validator
 from passlib.context import CryptContext
 
@@ -73,13 +74,24 @@ class User(SQLModel, table=True):
         self.password_hash = pwd_context.hash(password)
 
 
+class UserRevocation(SQLModel, table=True):
+    """SQLModel for revoked users: tokens issued to them up to revoked_at are rejected"""
+    user_id: int = Field(primary_key=True)
+    revoked_at: datetime = Field(default_factory=datetime.now)
+    reason: str = "deleted"  # 'deleted' or 'disabled'
+
+
 class TaskBase(BaseModel):
     """Base model for task validation"""
     title: str
     description: Optional[str] = None
+    due_date: Optional[datetime] = None
 
     @field_validator('title')
     def validate_title_length(cls, v):
+        # Updates declare title Optional; services decide whether null is allowed
+        if v is None:
+            return v
         if not (1 <= len(v) <= 200):
             raise ValueError('Title must be between 1 and 200 characters')
         return v
@@ -101,6 +113,31 @@ class TaskUpdate(TaskBase):
     title: Optional[str] = None
 
 
+class TaskBulkUpdate(TaskUpdate):
+    """Model for one item of a bulk update: the task id plus the fields to change"""
+    id: int
+    completed: Optional[bool] = None
+
+
+class TaskBulkDelete(BaseModel):
+    """Model for a bulk delete"""
+    ids: List[int]
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one item of a bulk request, in request order"""
+    index: int
+    id: Optional[int] = None
+    status: str  # 'created', 'updated', 'deleted' or 'not_found'
+
+
+class BulkResult(BaseModel):
+    """Model for bulk endpoint responses"""
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+
 class TaskResponse(TaskBase):
     """Model for task response with all details"""
     id: int
@@ -112,11 +149,18 @@ class TaskResponse(TaskBase):
 
 class Task(SQLModel, table=True):
     """SQLModel for tasks table"""
+    # Composite indexes serve each user's keyset-paginated listing in sort order
+    __table_args__ = (
+        Index("ix_task_user_created", "user_id", "created_at", "id"),
+        Index("ix_task_user_due_date", "user_id", "due_date", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int  # Changed from str to int to link to user ID
     title: str = Field(min_length=1, max_length=200)
     description: Optional[str] = Field(default=None, max_length=1000)
     completed: bool = Field(default=False)
+    due_date: Optional[datetime] = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
@@ -0,0 +1,144 @@
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Longest statement text kept for the slowest-statement report
+MAX_STATEMENT_LENGTH = 500
+
+
+@dataclass
+class RequestSQLStats:
+    """SQL activity attributed to a single request"""
+    statements: int = 0
+    db_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed_ms: float):
+        """Add one executed statement"""
+        self.statements += 1
+        self.db_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+    def server_timing(self, total_ms: float) -> str:
+        """Render the stats as a Server-Timing header value"""
+        return (
+            f'db;dur={self.db_ms:.2f};desc="{self.statements} queries", '
+            f"db-slowest;dur={self.slowest_ms:.2f}, "
+            f"app;dur={max(total_ms - self.db_ms, 0.0):.2f}, "
+            f"total;dur={total_ms:.2f}"
+        )
+
+
+@dataclass
+class RouteSQLStats:
+    """SQL activity aggregated over every request to one route"""
+    requests: int = 0
+    statements: int = 0
+    db_ms: float = 0.0
+    request_ms: float = 0.0
+    max_request_db_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def add(self, stats: RequestSQLStats, request_ms: float):
+        """Fold one finished request into the aggregate"""
+        self.requests += 1
+        self.statements += stats.statements
+        self.db_ms += stats.db_ms
+        self.request_ms += request_ms
+        self.max_request_db_ms = max(self.max_request_db_ms, stats.db_ms)
+        if stats.slowest_ms > self.slowest_ms:
+            self.slowest_ms = stats.slowest_ms
+            self.slowest_statement = stats.slowest_statement
+
+    def to_dict(self, route: str) -> dict:
+        """Summarize the aggregate for the debug endpoint"""
+        return {
+            "route": route,
+            "requests": self.requests,
+            "statements": self.statements,
+            "statements_per_request": round(self.statements / self.requests, 2),
+            "db_ms_total": round(self.db_ms, 2),
+            "db_ms_avg": round(self.db_ms / self.requests, 3),
+            "db_ms_max": round(self.max_request_db_ms, 3),
+            "request_ms_avg": round(self.request_ms / self.requests, 3),
+            "slowest_statement_ms": round(self.slowest_ms, 3),
+            "slowest_statement": self.slowest_statement,
+        }
+
+
+class SQLProfiler:
+    """
+    Attributes SQL statements to the request that issued them.
+
+    Cursor events time each statement and add it to the RequestSQLStats held
+    in a context variable; the middleware sets that variable per request and
+    folds the result into per-route aggregates. Sync endpoints run in the
+    threadpool with a copy of the request context, so they share the same
+    stats object.
+    """
+
+    def __init__(self):
+        self.current: ContextVar[Optional[RequestSQLStats]] = ContextVar("sql_stats", default=None)
+        self._routes: Dict[str, RouteSQLStats] = {}
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine):
+        """Listen to cursor events on an engine"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        stats = self.current.get()
+        if stats is not None:
+            stats.record(statement[:MAX_STATEMENT_LENGTH], elapsed_ms)
+
+    def start_request(self) -> RequestSQLStats:
+        """Begin attributing statements to a new request"""
+        stats = RequestSQLStats()
+        self.current.set(stats)
+        return stats
+
+    def finish_request(self, route: str, stats: RequestSQLStats, request_ms: float):
+        """Record a finished request against its route"""
+        with self._lock:
+            aggregate = self._routes.get(route)
+            if aggregate is None:
+                aggregate = self._routes[route] = RouteSQLStats()
+            aggregate.add(stats, request_ms)
+
+    def snapshot(self) -> List[dict]:
+        """Per-route aggregates, most total DB time first"""
+        with self._lock:
+            rows = [aggregate.to_dict(route) for route, aggregate in self._routes.items()]
+        return sorted(rows, key=lambda row: row["db_ms_total"], reverse=True)
+
+    def reset(self):
+        """Forget all aggregates"""
+        with self._lock:
+            self._routes.clear()
+
+
+# Key shared by requests that matched no route (404 scans, unknown paths), so they cannot grow the route map
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_key(scope: dict) -> str:
+    """Name a request by method and route template (e.g. GET /api/{user_id}/tasks)"""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or UNMATCHED_ROUTE
+    return f"{scope.get('method', '')} {path}"
+
+
+profiler = SQLProfiler()
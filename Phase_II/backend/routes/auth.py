@@ -51,4 +51,16 @@ def login(email: str = Form(...), password: str = Form(...), session: Session =
 @router.get("/me")
 def get_current_user_info(token_data: dict = Depends(get_current_user)):
     """Get current user info from token"""
-    return {"user_id": token_data.user_id}
\ No newline at end of file
+    return {"user_id": token_data.user_id}
+
+
+@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
+def delete_current_user(token_data: dict = Depends(get_current_user), session: Session = Depends(get_session)):
+    """Delete the current user and their tasks, revoking their tokens"""
+    auth_service = AuthService(session)
+
+    if not auth_service.delete_user(token_data.user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from typing import List, Optional
 from sqlmodel import Session, select
 from datetime import datetime
-from models import Task, TaskCreate, TaskUpdate, TaskResponse
+from models import Task, TaskCreate, TaskUpdate, TaskResponse, TaskBulkUpdate, TaskBulkDelete, BulkResult
 from database import get_session, create_db_and_tables
 from auth import get_current_user, verify_user_id_match, TokenData
-from services.task_service import TaskService
+from services.task_service import TaskService, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 # Create router
 router = APIRouter()
@@ -13,12 +15,17 @@ router = APIRouter()
 @router.get("/tasks", response_model=List[TaskResponse])
 def list_tasks(
     user_id: str,
+    request: Request,
+    response: Response,
     current_user: TokenData = Depends(get_current_user),
     status_filter: Optional[str] = Query(None, description="Filter by status: 'pending', 'completed', or 'all'"),
     sort_by: Optional[str] = Query("created_at", description="Sort by: 'created_at', 'title', 'due_date'"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of tasks to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. 'id,title,completed'"),
     session: Session = Depends(get_session)
 ):
-    """List all tasks for the specified user"""
+    """List one page of tasks for the specified user; the next page's cursor is in the X-Next-Cursor header"""
     # Verify that the user_id in the token matches the user_id in the URL
     if not verify_user_id_match(current_user.user_id, user_id):
         raise HTTPException(
@@ -26,14 +33,37 @@ def list_tasks(
             detail="Not authorized to access this user's tasks"
         )
 
-    # Use the TaskService to get tasks
+    # Use the TaskService to get one page of tasks
     task_service = TaskService(session)
-    tasks = task_service.get_tasks_by_user_id(
-        user_id=user_id,
-        status_filter=status_filter,
-        sort_by=sort_by
-    )
+    try:
+        tasks, next_cursor = task_service.get_tasks_page(
+            user_id=user_id,
+            status_filter=status_filter,
+            sort_by=sort_by,
+            limit=limit,
+            cursor=cursor,
+            fields=fields
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return page_response(request, response, tasks, next_cursor, fields)
+
+
+def page_response(request: Request, response: Response, tasks: list, next_cursor: Optional[str], fields: Optional[str]):
+    """Return a listing page, advertising the next page in X-Next-Cursor and Link headers"""
+    headers = {}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
 
+    # Projected rows are partial tasks, so they bypass the full TaskResponse model
+    if fields:
+        return JSONResponse(jsonable_encoder(tasks), headers=headers)
+    response.headers.update(headers)
     return tasks
 
 
@@ -173,4 +203,82 @@ def toggle_task_completion(
             detail="Task not found"
         )
 
-    return updated_task
\ No newline at end of file
+    return updated_task
+
+
+@router.post("/tasks:bulk", response_model=BulkResult)
+def bulk_create_tasks(
+    user_id: str,
+    items: List[TaskCreate],
+    current_user: TokenData = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """Create many tasks for the specified user in one transaction"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to create tasks for this user"
+        )
+
+    # Every item is validated before anything is written
+    task_service = TaskService(session)
+    try:
+        return task_service.bulk_create_tasks(user_id=current_user.user_id, items=items)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.patch("/tasks:bulk", response_model=BulkResult)
+def bulk_update_tasks(
+    user_id: str,
+    items: List[TaskBulkUpdate],
+    current_user: TokenData = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """Update many tasks by ID for the specified user in one transaction"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this user's tasks"
+        )
+
+    # Every item is validated before anything is written
+    task_service = TaskService(session)
+    try:
+        return task_service.bulk_update_tasks(user_id=current_user.user_id, items=items)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.delete("/tasks:bulk", response_model=BulkResult)
+def bulk_delete_tasks(
+    user_id: str,
+    bulk_delete: TaskBulkDelete,
+    current_user: TokenData = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """Delete many tasks by ID for the specified user in one transaction"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to delete this user's tasks"
+        )
+
+    # Every item is validated before anything is written
+    task_service = TaskService(session)
+    try:
+        return task_service.bulk_delete_tasks(user_id=current_user.user_id, ids=bulk_delete.ids)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -0,0 +1,271 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from typing import List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from models import TaskCreate, TaskUpdate, TaskResponse, TaskBulkUpdate, TaskBulkDelete, BulkResult
+from database import get_async_session
+from auth import get_current_user_async, verify_user_id_match, TokenData
+from services.task_service import AsyncTaskService, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from routes.tasks import page_response
+
+# Async twin of routes.tasks, mounted instead of it when DB_ASYNC is enabled:
+# same paths, parameters and responses, served on the event loop over an AsyncSession
+# Create router
+router = APIRouter()
+
+@router.get("/tasks", response_model=List[TaskResponse])
+async def list_tasks(
+    user_id: str,
+    request: Request,
+    response: Response,
+    current_user: TokenData = Depends(get_current_user_async),
+    status_filter: Optional[str] = Query(None, description="Filter by status: 'pending', 'completed', or 'all'"),
+    sort_by: Optional[str] = Query("created_at", description="Sort by: 'created_at', 'title', 'due_date'"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of tasks to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. 'id,title,completed'"),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """List one page of tasks for the specified user; the next page's cursor is in the X-Next-Cursor header"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this user's tasks"
+        )
+
+    # Use the TaskService to get one page of tasks
+    task_service = AsyncTaskService(session)
+    try:
+        tasks, next_cursor = await task_service.get_tasks_page(
+            user_id=user_id,
+            status_filter=status_filter,
+            sort_by=sort_by,
+            limit=limit,
+            cursor=cursor,
+            fields=fields
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return page_response(request, response, tasks, next_cursor, fields)
+
+
+
+@router.post("/tasks", response_model=TaskResponse)
+async def create_task(
+    user_id: str,
+    task_create: TaskCreate,
+    current_user: TokenData = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Create a new task for the specified user"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to create tasks for this user"
+        )
+
+    # Use the TaskService to create the task
+    task_service = AsyncTaskService(session)
+    task = await task_service.create_task(user_id=user_id, task_create=task_create)
+
+    return task
+
+
+@router.get("/tasks/{task_id}", response_model=TaskResponse)
+async def get_task(
+    user_id: str,
+    task_id: int,
+    current_user: TokenData = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Get a specific task by ID for the specified user"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this user's tasks"
+        )
+
+    # Use the TaskService to get the task
+    task_service = AsyncTaskService(session)
+    task = await task_service.get_task_by_id_and_user(task_id=task_id, user_id=user_id)
+
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return task
+
+
+@router.put("/tasks/{task_id}", response_model=TaskResponse)
+async def update_task(
+    user_id: str,
+    task_id: int,
+    task_update: TaskUpdate,
+    current_user: TokenData = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Update a specific task by ID for the specified user"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this user's tasks"
+        )
+
+    # Use the TaskService to update the task
+    task_service = AsyncTaskService(session)
+    updated_task = await task_service.update_task(
+        task_id=task_id,
+        user_id=user_id,
+        task_update=task_update
+    )
+
+    if not updated_task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return updated_task
+
+
+@router.delete("/tasks/{task_id}")
+async def delete_task(
+    user_id: str,
+    task_id: int,
+    current_user: TokenData = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Delete a specific task by ID for the specified user"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to delete this user's tasks"
+        )
+
+    # Use the TaskService to delete the task
+    task_service = AsyncTaskService(session)
+    success = await task_service.delete_task(task_id=task_id, user_id=user_id)
+
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return {"message": "Task deleted successfully"}
+
+
+@router.patch("/tasks/{task_id}/complete", response_model=TaskResponse)
+async def toggle_task_completion(
+    user_id: str,
+    task_id: int,
+    current_user: TokenData = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Toggle the completion status of a specific task by ID for the specified user"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this user's tasks"
+        )
+
+    # Use the TaskService to toggle task completion
+    task_service = AsyncTaskService(session)
+    updated_task = await task_service.toggle_task_completion(task_id=task_id, user_id=user_id)
+
+    if not updated_task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return updated_task
+
+
+@router.post("/tasks:bulk", response_model=BulkResult)
+async def bulk_create_tasks(
+    user_id: str,
+    items: List[TaskCreate],
+    current_user: TokenData = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Create many tasks for the specified user in one transaction"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to create tasks for this user"
+        )
+
+    # Every item is validated before anything is written
+    task_service = AsyncTaskService(session)
+    try:
+        return await task_service.bulk_create_tasks(user_id=current_user.user_id, items=items)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.patch("/tasks:bulk", response_model=BulkResult)
+async def bulk_update_tasks(
+    user_id: str,
+    items: List[TaskBulkUpdate],
+    current_user: TokenData = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Update many tasks by ID for the specified user in one transaction"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this user's tasks"
+        )
+
+    # Every item is validated before anything is written
+    task_service = AsyncTaskService(session)
+    try:
+        return await task_service.bulk_update_tasks(user_id=current_user.user_id, items=items)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.delete("/tasks:bulk", response_model=BulkResult)
+async def bulk_delete_tasks(
+    user_id: str,
+    bulk_delete: TaskBulkDelete,
+    current_user: TokenData = Depends(get_current_user_async),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Delete many tasks by ID for the specified user in one transaction"""
+    # Verify that the user_id in the token matches the user_id in the URL
+    if not verify_user_id_match(current_user.user_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to delete this user's tasks"
+        )
+
+    # Every item is validated before anything is written
+    task_service = AsyncTaskService(session)
+    try:
+        return await task_service.bulk_delete_tasks(user_id=current_user.user_id, ids=bulk_delete.ids)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -1,8 +1,8 @@
-from sqlmodel import Session, select
-from models import User, UserCreate, UserResponse
-from auth import create_access_token
+from sqlmodel import Session, select, delete
+from models import Task, User, UserCreate, UserResponse, UserRevocation
+from auth import create_access_token, revocations
 from typing import Optional
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 
 class AuthService:
@@ -59,4 +59,25 @@ class AuthService:
         """Create JWT token for user"""
         data = {"sub": str(user_id)}  # Using string as per JWT standard
         token = create_access_token(data=data, expires_delta=timedelta(days=7))
-        return token
\ No newline at end of file
+        return token
+
+    def delete_user(self, user_id: int, reason: str = "deleted") -> bool:
+        """Delete a user and their tasks, revoking every token issued to them so far"""
+        user = self.session.get(User, user_id)
+        if not user:
+            return False
+
+        revoked_at = datetime.now()
+        self.session.exec(delete(Task).where(Task.user_id == user_id))
+        self.session.delete(user)
+        revocation = self.session.get(UserRevocation, user_id)
+        if revocation:
+            revocation.revoked_at = revoked_at
+            revocation.reason = reason
+        else:
+            self.session.add(UserRevocation(user_id=user_id, revoked_at=revoked_at, reason=reason))
+        self.session.commit()
+
+        # Other workers pick this up on their next revocation refresh
+        revocations.revoke(user_id, revoked_at.timestamp())
+        return True
@@ -1,53 +1,327 @@
+import base64
+import json
+from collections import Counter
+from sqlalchemy import and_, delete, insert, or_, update
 from sqlmodel import Session, select
-from models import Task, TaskCreate, TaskUpdate, TaskResponse
-from typing import List, Optional
+from models import (
+    BulkItemResult, BulkResult, Task, TaskBulkUpdate, TaskCreate, TaskUpdate, TaskResponse
+)
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
-class TaskService:
-    def __init__(self, session: Session):
-        self.session = session
+# Page size for list_tasks when no limit is given, and the largest allowed
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
 
-    def get_tasks_by_user_id(
-        self,
-        user_id: int,
-        status_filter: Optional[str] = None,
-        sort_by: Optional[str] = "created_at"
-    ) -> List[TaskResponse]:
-        """Get all tasks for a specific user with optional filtering and sorting"""
+# Sort column and direction for each supported sort_by value
+SORT_COLUMNS = {
+    "created_at": ("created_at", True),  # newest first
+    "title": ("title", False),
+    "due_date": ("due_date", False),     # soonest first, tasks without a due date last
+}
+
+# Most items accepted by one bulk request, and ids per IN (...) list (well under SQLite's parameter limit)
+MAX_BULK_ITEMS = 10_000
+ID_CHUNK_SIZE = 500
+
+# Backends that send a bulk INSERT ... RETURNING as multi-row batches (insertmanyvalues) with the ids in
+# parameter order; SQLAlchemy falls back to one statement per row elsewhere (e.g. SQLite)
+BATCHED_RETURNING_DIALECTS = {"postgresql"}
+
+# Fields a client may request with fields=
+TASK_FIELDS = tuple(TaskResponse.model_fields)
+
+
+def encode_cursor(sort_by: str, value: Any, task_id: int) -> str:
+    """Encode the sort key of the last task on a page as an opaque cursor"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([sort_by, value, task_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Tuple[Any, int]:
+    """Decode a cursor produced by encode_cursor for the same sort order"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, task_id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort_by or not isinstance(task_id, int):
+            raise ValueError
+        if value is not None and sort_by != "title":
+            value = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor for this sort order")
+    return value, task_id
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated fields= projection (id is always included)"""
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in TASK_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(TASK_FIELDS)}")
+    return ["id"] + [field for field in dict.fromkeys(requested) if field != "id"]
+
+
+class TaskQueries:
+    """Statement building and row conversion shared by TaskService and AsyncTaskService"""
+
+    def _list_query(self, user_id: int, status_filter: Optional[str], sort_by: Optional[str]):
+        """SELECT for every task of a user, filtered and sorted"""
         query = select(Task).where(Task.user_id == user_id)
 
-        # Apply status filter if provided
-        if status_filter:
-            if status_filter.lower() == "pending":
-                query = query.where(Task.completed == False)
-            elif status_filter.lower() == "completed":
-                query = query.where(Task.completed == True)
-            # If "all" or any other value, don't filter by status
+        query = self._filter_status(query, status_filter)
 
         # Apply sorting
-        if sort_by:
-            if sort_by == "title":
-                query = query.order_by(Task.title)
-            elif sort_by == "created_at":
-                query = query.order_by(Task.created_at.desc())
-            # Add more sort options as needed
-
-        tasks = self.session.exec(query).all()
-        return [self._to_task_response(task) for task in tasks]
+        if sort_by in SORT_COLUMNS:
+            query = query.order_by(*self._order_by(sort_by))
+        return query
 
-    def create_task(self, user_id: int, task_create: TaskCreate) -> TaskResponse:
-        """Create a new task for a user"""
+    def _page_query(
+        self,
+        user_id: int,
+        status_filter: Optional[str],
+        sort_by: str,
+        limit: int,
+        cursor: Optional[str],
+        projection: Optional[List[str]]
+    ):
+        """SELECT for one keyset page, fetching one extra row to detect a next page"""
+        column_name, _ = SORT_COLUMNS[sort_by]
+
+        if projection is None:
+            query = select(Task)
+        else:
+            # The sort column is loaded even if not requested, to build the next cursor
+            columns = dict.fromkeys(projection + [column_name])
+            query = select(*[getattr(Task, name) for name in columns])
+        query = self._filter_status(query.where(Task.user_id == user_id), status_filter)
+        if cursor:
+            query = query.where(self._after(sort_by, *decode_cursor(cursor, sort_by)))
+        return query.order_by(*self._order_by(sort_by)).limit(limit + 1)
+
+    def _page_result(
+        self,
+        rows: list,
+        sort_by: str,
+        limit: int,
+        projection: Optional[List[str]]
+    ) -> Tuple[List[Union[TaskResponse, Dict[str, Any]]], Optional[str]]:
+        """Trim the extra row of a page query and build the next cursor"""
+        column_name, _ = SORT_COLUMNS[sort_by]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(sort_by, getattr(last, column_name), last.id)
+
+        if projection is None:
+            return [self._to_task_response(task) for task in rows], next_cursor
+        return [{name: getattr(row, name) for name in projection} for row in rows], next_cursor
+
+    def _task_query(self, task_id: int, user_id: int):
+        """SELECT for one task owned by a user"""
+        return select(Task).where(Task.id == task_id, Task.user_id == user_id)
+
+    def _new_task(self, user_id: int, task_create: TaskCreate) -> Task:
+        """Build a validated, not yet persisted task"""
         # Validate the input data using the model
         task_create = TaskCreate(**task_create.model_dump())
 
-        task = Task(
+        return Task(
             user_id=user_id,
             title=task_create.title,
             description=task_create.description,
+            due_date=task_create.due_date,
             completed=False  # Default to not completed
         )
 
+    def _apply_update(self, task: Task, task_update: TaskUpdate):
+        """Copy the fields set on an update onto a task"""
+        # Update only provided fields
+        update_data = task_update.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(task, field, value)
+
+        task.updated_at = datetime.now()
+
+    def _check_bulk_size(self, count: int):
+        """Reject empty and oversized bulk requests"""
+        if count == 0:
+            raise ValueError("No items given")
+        if count > MAX_BULK_ITEMS:
+            raise ValueError(f"At most {MAX_BULK_ITEMS} items per bulk request")
+
+    def _check_unique_ids(self, ids: List[int]):
+        """Reject bulk requests naming the same task twice"""
+        duplicates = sorted(task_id for task_id, count in Counter(ids).items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate task ids: {', '.join(map(str, duplicates[:10]))}")
+
+    def _bulk_create_rows(self, user_id: int, items: List[TaskCreate]) -> List[Dict[str, Any]]:
+        """Insert parameters for a bulk create (items are already validated by TaskCreate)"""
+        self._check_bulk_size(len(items))
+        now = datetime.now()
+        return [
+            {
+                "user_id": user_id,
+                "title": item.title,
+                "description": item.description,
+                "due_date": item.due_date,
+                "completed": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for item in items
+        ]
+
+    def _bulk_insert(self, dialect_name: str):
+        """
+        INSERT for a bulk create: on PostgreSQL, batched multi-row statements returning the new ids in
+        parameter order; elsewhere one executemany without RETURNING, with the ids read back by _bulk_ids_query
+        """
+        if dialect_name in BATCHED_RETURNING_DIALECTS:
+            return insert(Task).returning(Task.id, sort_by_parameter_order=True)
+        return insert(Task)
+
+    def _bulk_ids_query(self, user_id: int, rows: List[Dict[str, Any]]):
+        """
+        SELECT for the ids of the rows a plain bulk INSERT just wrote, newest first: the user's last
+        len(rows) tasks stamped with the batch's created_at. Run it in the inserting transaction, which
+        holds SQLite's write lock, so no other writer's rows can be among them
+        """
+        return (
+            select(Task.id)
+            .where(Task.user_id == user_id, Task.created_at == rows[0]["created_at"])
+            .order_by(Task.id.desc())
+            .limit(len(rows))
+        )
+
+    def _bulk_update_rows(self, items: List[TaskBulkUpdate]) -> List[Dict[str, Any]]:
+        """Update-by-primary-key parameters for a bulk update, validated before anything is written"""
+        self._check_bulk_size(len(items))
+        self._check_unique_ids([item.id for item in items])
+        now = datetime.now()
+        rows = []
+        for index, item in enumerate(items):
+            changes = item.model_dump(exclude_unset=True, exclude={"id"})
+            if not changes:
+                raise ValueError(f"Item {index}: no fields to update")
+            for field in ("title", "completed"):
+                if field in changes and changes[field] is None:
+                    raise ValueError(f"Item {index}: {field} cannot be null")
+            rows.append({"id": item.id, **changes, "updated_at": now})
+        return rows
+
+    def _owned_ids_queries(self, user_id: int, ids: List[int]) -> Iterator:
+        """SELECTs (one per chunk of ids) for the ids that exist and belong to a user"""
+        for start in range(0, len(ids), ID_CHUNK_SIZE):
+            chunk = ids[start:start + ID_CHUNK_SIZE]
+            yield select(Task.id).where(Task.user_id == user_id, Task.id.in_(chunk))
+
+    def _bulk_delete_queries(self, user_id: int, ids: List[int]) -> Iterator:
+        """DELETEs (one per chunk of ids) restricted to a user's tasks"""
+        for start in range(0, len(ids), ID_CHUNK_SIZE):
+            chunk = ids[start:start + ID_CHUNK_SIZE]
+            yield delete(Task).where(Task.user_id == user_id, Task.id.in_(chunk))
+
+    def _bulk_result(self, ids: List[int], found: Set[int], status: str) -> BulkResult:
+        """Per-item results: `status` for found ids, 'not_found' for the rest"""
+        results = [
+            BulkItemResult(index=index, id=task_id, status=status if task_id in found else "not_found")
+            for index, task_id in enumerate(ids)
+        ]
+        succeeded = sum(1 for task_id in ids if task_id in found)
+        return BulkResult(succeeded=succeeded, failed=len(ids) - succeeded, results=results)
+
+    def _filter_status(self, query, status_filter: Optional[str]):
+        """Restrict a query to pending or completed tasks (no filter for 'all' or anything else)"""
+        if status_filter:
+            if status_filter.lower() == "pending":
+                query = query.where(Task.completed == False)
+            elif status_filter.lower() == "completed":
+                query = query.where(Task.completed == True)
+        return query
+
+    def _order_by(self, sort_by: str) -> list:
+        """ORDER BY clauses for a sort, with id as the tie-breaker"""
+        column_name, descending = SORT_COLUMNS[sort_by]
+        column = getattr(Task, column_name)
+        if descending:
+            return [column.desc(), Task.id.desc()]
+        if sort_by == "due_date":
+            return [column.asc().nulls_last(), Task.id]
+        return [column, Task.id]
+
+    def _after(self, sort_by: str, value: Any, task_id: int):
+        """WHERE clause selecting the tasks that sort after (value, task_id)"""
+        column_name, descending = SORT_COLUMNS[sort_by]
+        column = getattr(Task, column_name)
+        if descending:
+            return or_(column < value, and_(column == value, Task.id < task_id))
+        if sort_by == "due_date":
+            if value is None:
+                return and_(column.is_(None), Task.id > task_id)
+            return or_(column > value, and_(column == value, Task.id > task_id), column.is_(None))
+        return or_(column > value, and_(column == value, Task.id > task_id))
+
+    def _to_task_response(self, task: Task) -> TaskResponse:
+        """Convert a Task model to a TaskResponse model"""
+        return TaskResponse(
+            id=task.id,
+            user_id=task.user_id,
+            title=task.title,
+            description=task.description,
+            completed=task.completed,
+            due_date=task.due_date,
+            created_at=task.created_at,
+            updated_at=task.updated_at
+        )
+
+
+class TaskService(TaskQueries):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_tasks_by_user_id(
+        self,
+        user_id: int,
+        status_filter: Optional[str] = None,
+        sort_by: Optional[str] = "created_at"
+    ) -> List[TaskResponse]:
+        """Get all tasks for a specific user with optional filtering and sorting"""
+        tasks = self.session.exec(self._list_query(user_id, status_filter, sort_by)).all()
+        return [self._to_task_response(task) for task in tasks]
+
+    def get_tasks_page(
+        self,
+        user_id: int,
+        status_filter: Optional[str] = None,
+        sort_by: Optional[str] = "created_at",
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> Tuple[List[Union[TaskResponse, Dict[str, Any]]], Optional[str]]:
+        """
+        Get one page of a user's tasks and the cursor for the next page (None on the last page).
+        Pages are keyset-paginated on (sort column, id), so every page costs an index range scan
+        regardless of depth. With fields, only those columns are loaded and plain dicts are returned.
+        """
+        sort_by = sort_by if sort_by in SORT_COLUMNS else "created_at"
+        projection = parse_fields(fields)
+        query = self._page_query(user_id, status_filter, sort_by, limit, cursor, projection)
+        rows = self.session.exec(query).all()
+        return self._page_result(rows, sort_by, limit, projection)
+
+    def create_task(self, user_id: int, task_create: TaskCreate) -> TaskResponse:
+        """Create a new task for a user"""
+        task = self._new_task(user_id, task_create)
+
         self.session.add(task)
         self.session.commit()
         self.session.refresh(task)
@@ -56,9 +330,7 @@ class TaskService:
 
     def get_task_by_id_and_user(self, task_id: int, user_id: int) -> Optional[TaskResponse]:
         """Get a specific task by ID for a specific user"""
-        task = self.session.exec(
-            select(Task).where(Task.id == task_id, Task.user_id == user_id)
-        ).first()
+        task = self.session.exec(self._task_query(task_id, user_id)).first()
 
         if task:
             return self._to_task_response(task)
@@ -66,19 +338,12 @@ class TaskService:
 
     def update_task(self, task_id: int, user_id: int, task_update: TaskUpdate) -> Optional[TaskResponse]:
         """Update a specific task for a specific user"""
-        task = self.session.exec(
-            select(Task).where(Task.id == task_id, Task.user_id == user_id)
-        ).first()
+        task = self.session.exec(self._task_query(task_id, user_id)).first()
 
         if not task:
             return None
 
-        # Update only provided fields
-        update_data = task_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(task, field, value)
-
-        task.updated_at = datetime.now()
+        self._apply_update(task, task_update)
         self.session.add(task)
         self.session.commit()
         self.session.refresh(task)
@@ -87,9 +352,7 @@ class TaskService:
 
     def delete_task(self, task_id: int, user_id: int) -> bool:
         """Delete a specific task for a specific user"""
-        task = self.session.exec(
-            select(Task).where(Task.id == task_id, Task.user_id == user_id)
-        ).first()
+        task = self.session.exec(self._task_query(task_id, user_id)).first()
 
         if not task:
             return False
@@ -100,9 +363,7 @@ class TaskService:
 
     def toggle_task_completion(self, task_id: int, user_id: int) -> Optional[TaskResponse]:
         """Toggle the completion status of a specific task for a specific user"""
-        task = self.session.exec(
-            select(Task).where(Task.id == task_id, Task.user_id == user_id)
-        ).first()
+        task = self.session.exec(self._task_query(task_id, user_id)).first()
 
         if not task:
             return None
@@ -115,14 +376,172 @@ class TaskService:
 
         return self._to_task_response(task)
 
-    def _to_task_response(self, task: Task) -> TaskResponse:
-        """Convert a Task model to a TaskResponse model"""
-        return TaskResponse(
-            id=task.id,
-            user_id=task.user_id,
-            title=task.title,
-            description=task.description,
-            completed=task.completed,
-            created_at=task.created_at,
-            updated_at=task.updated_at
-        )
\ No newline at end of file
+    def bulk_create_tasks(self, user_id: int, items: List[TaskCreate]) -> BulkResult:
+        """Create many tasks for a user with one bulk INSERT (plus an id lookup off PostgreSQL) and one commit"""
+        rows = self._bulk_create_rows(user_id, items)
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name in BATCHED_RETURNING_DIALECTS:
+            ids = self.session.exec(self._bulk_insert(dialect_name), params=rows).scalars().all()
+        else:
+            self.session.exec(self._bulk_insert(dialect_name), params=rows)
+            ids = self.session.exec(self._bulk_ids_query(user_id, rows)).all()[::-1]
+        self.session.commit()
+        return self._bulk_result(ids, set(ids), "created")
+
+    def bulk_update_tasks(self, user_id: int, items: List[TaskBulkUpdate]) -> BulkResult:
+        """Update many of a user's tasks in one transaction; ids the user does not own are reported as not_found"""
+        rows = self._bulk_update_rows(items)
+        ids = [row["id"] for row in rows]
+        owned = set()
+        for query in self._owned_ids_queries(user_id, ids):
+            owned.update(self.session.exec(query).all())
+
+        found_rows = [row for row in rows if row["id"] in owned]
+        if found_rows:
+            # ORM bulk UPDATE by primary key: one executemany per distinct set of changed fields
+            self.session.exec(update(Task), params=found_rows)
+        self.session.commit()
+        return self._bulk_result(ids, owned, "updated")
+
+    def bulk_delete_tasks(self, user_id: int, ids: List[int]) -> BulkResult:
+        """Delete many of a user's tasks in one transaction; ids the user does not own are reported as not_found"""
+        self._check_bulk_size(len(ids))
+        self._check_unique_ids(ids)
+        owned = set()
+        for query in self._owned_ids_queries(user_id, ids):
+            owned.update(self.session.exec(query).all())
+
+        for statement in self._bulk_delete_queries(user_id, [task_id for task_id in ids if task_id in owned]):
+            self.session.exec(statement)
+        self.session.commit()
+        return self._bulk_result(ids, owned, "deleted")
+
+
+class AsyncTaskService(TaskQueries):
+    """TaskService for an AsyncSession: same queries and results, awaited on the event loop"""
+
+    def __init__(self, session: "AsyncSession"):
+        self.session = session
+
+    async def get_tasks_by_user_id(
+        self,
+        user_id: int,
+        status_filter: Optional[str] = None,
+        sort_by: Optional[str] = "created_at"
+    ) -> List[TaskResponse]:
+        """Get all tasks for a specific user with optional filtering and sorting"""
+        tasks = (await self.session.exec(self._list_query(user_id, status_filter, sort_by))).all()
+        return [self._to_task_response(task) for task in tasks]
+
+    async def get_tasks_page(
+        self,
+        user_id: int,
+        status_filter: Optional[str] = None,
+        sort_by: Optional[str] = "created_at",
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> Tuple[List[Union[TaskResponse, Dict[str, Any]]], Optional[str]]:
+        """Get one page of a user's tasks and the cursor for the next page (see TaskService.get_tasks_page)"""
+        sort_by = sort_by if sort_by in SORT_COLUMNS else "created_at"
+        projection = parse_fields(fields)
+        query = self._page_query(user_id, status_filter, sort_by, limit, cursor, projection)
+        rows = (await self.session.exec(query)).all()
+        return self._page_result(rows, sort_by, limit, projection)
+
+    async def create_task(self, user_id: int, task_create: TaskCreate) -> TaskResponse:
+        """Create a new task for a user"""
+        task = self._new_task(user_id, task_create)
+
+        self.session.add(task)
+        await self.session.commit()
+        await self.session.refresh(task)
+
+        return self._to_task_response(task)
+
+    async def get_task_by_id_and_user(self, task_id: int, user_id: int) -> Optional[TaskResponse]:
+        """Get a specific task by ID for a specific user"""
+        task = (await self.session.exec(self._task_query(task_id, user_id))).first()
+
+        if task:
+            return self._to_task_response(task)
+        return None
+
+    async def update_task(self, task_id: int, user_id: int, task_update: TaskUpdate) -> Optional[TaskResponse]:
+        """Update a specific task for a specific user"""
+        task = (await self.session.exec(self._task_query(task_id, user_id))).first()
+
+        if not task:
+            return None
+
+        self._apply_update(task, task_update)
+        self.session.add(task)
+        await self.session.commit()
+        await self.session.refresh(task)
+
+        return self._to_task_response(task)
+
+    async def delete_task(self, task_id: int, user_id: int) -> bool:
+        """Delete a specific task for a specific user"""
+        task = (await self.session.exec(self._task_query(task_id, user_id))).first()
+
+        if not task:
+            return False
+
+        await self.session.delete(task)
+        await self.session.commit()
+        return True
+
+    async def toggle_task_completion(self, task_id: int, user_id: int) -> Optional[TaskResponse]:
+        """Toggle the completion status of a specific task for a specific user"""
+        task = (await self.session.exec(self._task_query(task_id, user_id))).first()
+
+        if not task:
+            return None
+
+        task.completed = not task.completed
+        task.updated_at = datetime.now()
+        self.session.add(task)
+        await self.session.commit()
+        await self.session.refresh(task)
+
+        return self._to_task_response(task)
+
+    async def bulk_create_tasks(self, user_id: int, items: List[TaskCreate]) -> BulkResult:
+        """Create many tasks for a user with one bulk INSERT (plus an id lookup off PostgreSQL) and one commit"""
+        rows = self._bulk_create_rows(user_id, items)
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name in BATCHED_RETURNING_DIALECTS:
+            ids = (await self.session.exec(self._bulk_insert(dialect_name), params=rows)).scalars().all()
+        else:
+            await self.session.exec(self._bulk_insert(dialect_name), params=rows)
+            ids = (await self.session.exec(self._bulk_ids_query(user_id, rows))).all()[::-1]
+        await self.session.commit()
+        return self._bulk_result(ids, set(ids), "created")
+
+    async def bulk_update_tasks(self, user_id: int, items: List[TaskBulkUpdate]) -> BulkResult:
+        """Update many of a user's tasks in one transaction; ids the user does not own are reported as not_found"""
+        rows = self._bulk_update_rows(items)
+        ids = [row["id"] for row in rows]
+        owned = set()
+        for query in self._owned_ids_queries(user_id, ids):
+            owned.update((await self.session.exec(query)).all())
+
+        found_rows = [row for row in rows if row["id"] in owned]
+        if found_rows:
+            await self.session.exec(update(Task), params=found_rows)
+        await self.session.commit()
+        return self._bulk_result(ids, owned, "updated")
+
+    async def bulk_delete_tasks(self, user_id: int, ids: List[int]) -> BulkResult:
+        """Delete many of a user's tasks in one transaction; ids the user does not own are reported as not_found"""
+        self._check_bulk_size(len(ids))
+        self._check_unique_ids(ids)
+        owned = set()
+        for query in self._owned_ids_queries(user_id, ids):
+            owned.update((await self.session.exec(query)).all())
+
+        for statement in self._bulk_delete_queries(user_id, [task_id for task_id in ids if task_id in owned]):
+            await self.session.exec(statement)
+        await self.session.commit()
+        return self._bulk_result(ids, owned, "deleted")
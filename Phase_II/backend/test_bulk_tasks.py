@@ -0,0 +1,55 @@
+"""
+Tests for the Phase II bulk task endpoints.
+
+Runs the app in-process with FastAPI's TestClient on a temporary SQLite
+database.
+
+Run from the Phase_II/backend directory:
+    python test_bulk_tasks.py
+"""
+import os
+import tempfile
+
+# The app reads its configuration at import time
+DATA_DIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(DATA_DIR, 'test.db')}"
+os.environ["SQL_PROFILING"] = "false"
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+def login(client: TestClient, email: str):
+    """Register and log in a user; returns the tasks URL and auth headers"""
+    credentials = {"email": email, "name": "Bulk", "password": "bulk-test"}
+    client.post("/auth/register", json=credentials)
+    response = client.post("/auth/login", data={"email": email, "password": credentials["password"]})
+    body = response.json()
+    return f"/api/{body['user']['id']}/tasks", {"Authorization": f"Bearer {body['access_token']}"}
+
+
+def test_bulk_update_rejects_null_fields():
+    """Null title or completed is a 400 for the whole request, and nothing is written"""
+    with TestClient(app) as client:
+        base, headers = login(client, "bulk-null@example.com")
+        created = client.post(f"{base}:bulk", json=[{"title": "Keep me"}, {"title": "Me too"}], headers=headers)
+        first, second = [item["id"] for item in created.json()["results"]]
+
+        for field in ("title", "completed"):
+            items = [{"id": first, "title": "Renamed"}, {"id": second, field: None}]
+            response = client.patch(f"{base}:bulk", json=items, headers=headers)
+            assert response.status_code == 400, response.text
+            assert response.json()["detail"] == f"Item 1: {field} cannot be null"
+
+        titles = {task["id"]: task["title"] for task in client.get(base, headers=headers).json()}
+        assert titles == {first: "Keep me", second: "Me too"}
+
+        response = client.patch(f"{base}:bulk", json=[{"id": first, "title": "x" * 201}], headers=headers)
+        assert response.status_code == 422
+    print("✓ null fields rejected")
+
+
+if __name__ == "__main__":
+    test_bulk_update_rejects_null_fields()
+    print("\nAll bulk task tests passed!")
@@ -9,6 +9,8 @@ import { api } from '@/lib/api';
 export default function DashboardPage() {
   const [tasks, setTasks] = useState<Task[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [userId, setUserId] = useState<string | null>(null);
 
@@ -57,9 +59,10 @@ export default function DashboardPage() {
   const fetchTasks = async (userId: string) => {
     try {
       setLoading(true);
-      // Call the actual API to fetch tasks
-      const tasks = await api.getTasks(userId);
-      setTasks(tasks);
+      // Fetch the first page; later pages are loaded on demand
+      const page = await api.getTasks(userId);
+      setTasks(page.tasks);
+      setNextCursor(page.nextCursor);
       setError(null);
     } catch (err) {
       setError('Failed to load tasks');
@@ -69,6 +72,22 @@ export default function DashboardPage() {
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!userId || !nextCursor) return;
+
+    try {
+      setLoadingMore(true);
+      const page = await api.getTasks(userId, undefined, undefined, nextCursor);
+      setTasks(current => [...current, ...page.tasks]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      setError('Failed to load more tasks');
+      console.error('Error loading more tasks:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleAddTask = async (title: string, description: string) => {
     if (!userId) {
       throw new Error('User not authenticated');
@@ -184,6 +203,18 @@ export default function DashboardPage() {
                 onDeleteTask={handleDeleteTask}
                 onToggleComplete={handleToggleComplete}
               />
+
+              {nextCursor && (
+                <div className="mt-4 text-center">
+                  <button
+                    className="text-sm text-indigo-600 hover:text-indigo-900 disabled:text-gray-400"
+                    onClick={handleLoadMore}
+                    disabled={loadingMore}
+                  >
+                    {loadingMore ? 'Loading...' : 'Load more tasks'}
+                  </button>
+                </div>
+              )}
             </div>
           </div>
         </div>
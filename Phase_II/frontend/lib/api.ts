@@ -1,4 +1,4 @@
-import { Task, TaskCreateData, TaskUpdateData } from '@/types';
+import { Task, TaskCreateData, TaskPage, TaskUpdateData } from '@/types';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
@@ -11,18 +11,15 @@ class ApiClient {
     };
   }
 
-  async getTasks(userId: string, status?: string, sort?: string): Promise<Task[]> {
-    let url = `${API_BASE_URL}/api/${userId}/tasks`;
+  async getTasks(userId: string, status?: string, sort?: string, cursor?: string | null): Promise<TaskPage> {
     const params = new URLSearchParams();
 
-    if (status) params.append('status', status);
+    if (status) params.append('status_filter', status);
     if (sort) params.append('sort_by', sort);
+    if (cursor) params.append('cursor', cursor);
 
-    if (params.toString()) {
-      url += `?${params.toString()}`;
-    }
-
-    const response = await fetch(url, {
+    // One keyset page per call; pass nextCursor back in to load the following page
+    const response = await fetch(`${API_BASE_URL}/api/${userId}/tasks?${params.toString()}`, {
       headers: this.getAuthHeaders(),
     });
 
@@ -30,7 +27,10 @@ class ApiClient {
       throw new Error(`Failed to fetch tasks: ${response.statusText}`);
     }
 
-    return response.json();
+    return {
+      tasks: await response.json(),
+      nextCursor: response.headers.get('X-Next-Cursor'),
+    };
   }
 
   async createTask(userId: string, taskData: TaskCreateData): Promise<Task> {
@@ -4,16 +4,24 @@ export interface Task {
   title: string;
   description?: string;
   completed: boolean;
+  due_date?: string | null;
   created_at: string;
   updated_at: string;
 }
 
+export interface TaskPage {
+  tasks: Task[];
+  nextCursor: string | null;  // null on the last page
+}
+
 export interface TaskCreateData {
   title: string;
   description?: string;
+  due_date?: string | null;
 }
 
 export interface TaskUpdateData {
   title?: string;
   description?: string;
+  due_date?: string | null;
 }
\ No newline at end of file
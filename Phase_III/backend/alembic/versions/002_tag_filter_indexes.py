@@ -0,0 +1,26 @@
+"""Indexes for SQL-side tag filtering and per-user task listing
+
+Revision ID: 002_tag_filter_indexes
+Revises: 001_initial_phase3
+Create Date: 2026-10-17 09:00:00
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '002_tag_filter_indexes'
+down_revision = '001_initial_phase3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # tag -> tasks lookups for the all-tags / any-tags filters
+    op.create_index('ix_tasktag_tag_task', 'tasktag', ['tag_id', 'task_id'])
+    # A user's tasks in created_at order, with id as the tie-breaker
+    op.create_index('ix_task_user_created', 'task', ['user_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_user_created', table_name='task')
+    op.drop_index('ix_tasktag_tag_task', table_name='tasktag')
@@ -0,0 +1,27 @@
+"""Full-text search index on task title and description
+
+SQLite gets an FTS5 table kept in sync by triggers, PostgreSQL a generated
+tsvector column with a GIN index.
+
+Revision ID: 003_task_full_text_search
+Revises: 002_tag_filter_indexes
+Create Date: 2026-10-17 12:00:00
+
+"""
+from alembic import op
+from search_index import create_search_index, drop_search_index
+
+# revision identifiers
+revision = '003_task_full_text_search'
+down_revision = '002_tag_filter_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The DDL differs per dialect; search_index builds the one matching this database
+    create_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_search_index(op.get_bind())
@@ -0,0 +1,27 @@
+"""Trigram index on task title for typo-tolerant search
+
+PostgreSQL gets pg_trgm and a GIN index on the title; SQLite keeps the
+trigram posting lists in process, so there is nothing to create there.
+
+Revision ID: 004_task_title_trigram_index
+Revises: 003_task_full_text_search
+Create Date: 2026-10-17 14:00:00
+
+"""
+from alembic import op
+from fuzzy_search import create_trigram_index, drop_trigram_index
+
+# revision identifiers
+revision = '004_task_title_trigram_index'
+down_revision = '003_task_full_text_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_trigram_index(op.get_bind())
+
+
+def downgrade() -> None:
+    # The pg_trgm extension is left installed; other objects may use it
+    drop_trigram_index(op.get_bind())
@@ -0,0 +1,126 @@
+"""
+Benchmark for Phase III fuzzy (typo-tolerant) task title search.
+
+Seeds one user with N tasks in a temporary SQLite database with the FTS5
+index, then looks up known titles through misspelled queries and reports
+p50 latency and how often the intended task is the top result:
+
+- before: search_tasks through the full-text index (exact words only)
+- before: list every task and rank titles in Python with difflib, which is
+  what resolving a task by name from the chat agent amounted to
+- after: TaskService.find_tasks_by_title on the in-process trigram index
+  (the first search builds the user's index; its cost is reported apart)
+
+Run from the Phase_III/backend directory:
+    python -m benchmarks.bench_fuzzy [--count 100000]
+"""
+import argparse
+import difflib
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from fuzzy_search import title_index
+from models import PriorityEnum, Task, User
+from search_index import create_search_index
+from services.task_service import TaskService
+
+WORDS = ("buy groceries call dentist renew passport book flights pay invoice fix bike clean garage write report "
+         "review budget send birthday card order printer ink pick up laundry plan vacation update resume").split()
+
+
+def seed(engine, count: int, rng: random.Random):
+    """Insert one user and their tasks; returns (user_id, {task id: title})"""
+    with Session(engine) as session:
+        user = User(email="fuzzy@example.com", name="Fuzzy", password_hash="x")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+
+    now = datetime.now()
+    titles = {i + 1: " ".join(rng.sample(WORDS, 3)) + f" {i}" for i in range(count)}
+    with engine.begin() as connection:
+        connection.execute(Task.__table__.insert(), [
+            {"id": task_id, "user_id": user_id, "title": title, "description": None, "completed": False,
+             "priority": PriorityEnum.medium, "created_at": now, "updated_at": now}
+            for task_id, title in titles.items()
+        ])
+    return user_id, titles
+
+
+def misspell(title: str, rng: random.Random) -> str:
+    """Drop or swap one letter in each word of the title"""
+    words = []
+    for word in title.split():
+        if len(word) > 3 and not word.isdigit():
+            i = rng.randrange(1, len(word) - 1)
+            word = word[:i] + word[i + 1:] if rng.random() < 0.5 else word[:i] + word[i + 1] + word[i] + word[i + 2:]
+        words.append(word)
+    return " ".join(words)
+
+
+def difflib_lookup(session: Session, user_id: int, query: str, limit: int):
+    """Load every title and rank them in Python"""
+    rows = session.exec(select(Task.id, Task.title).where(Task.user_id == user_id)).all()
+    scored = ((difflib.SequenceMatcher(None, query.lower(), title.lower()).ratio(), task_id) for task_id, title in rows)
+    return [task_id for _, task_id in sorted(scored, reverse=True)[:limit]]
+
+
+def measure(engine, lookups, func):
+    """Return (p50 ms, share of lookups whose intended task came first)"""
+    samples, hits = [], 0
+    for task_id, query in lookups:
+        started = time.perf_counter()
+        with Session(engine) as session:
+            found = func(session, query)
+        samples.append((time.perf_counter() - started) * 1000)
+        hits += bool(found) and found[0] == task_id
+    return statistics.median(samples), hits / len(lookups)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(24)
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        with engine.begin() as connection:
+            create_search_index(connection)
+        user_id, titles = seed(engine, args.count, rng)
+        lookups = [(task_id, misspell(titles[task_id], rng)) for task_id in rng.sample(sorted(titles), args.lookups)]
+        print(f"Tasks: {args.count}, lookups: {args.lookups}, e.g. {titles[lookups[0][0]]!r} -> {lookups[0][1]!r}")
+
+        title_index.clear()
+        started = time.perf_counter()
+        with Session(engine) as session:
+            TaskService(session).find_tasks_by_title(user_id, lookups[0][1], args.limit)
+        print(f"Trigram index build (first search): {(time.perf_counter() - started) * 1000:.0f} ms")
+
+        cases = [
+            ("before: full-text search_tasks",
+             lambda session, query: [task.id for task in TaskService(session).search_tasks(user_id, query,
+                                                                                          limit=args.limit)]),
+            ("before: list all + difflib",
+             lambda session, query: difflib_lookup(session, user_id, query, args.limit)),
+            ("after:  find_tasks_by_title",
+             lambda session, query: [match.id for match in TaskService(session).find_tasks_by_title(
+                 user_id, query, args.limit)]),
+        ]
+        print(f"{'case':<32} {'p50 ms':>9} {'top-1 hit':>10}")
+        for label, func in cases:
+            p50, hit_rate = measure(engine, lookups, func)
+            print(f"{label:<32} {p50:>9.2f} {hit_rate:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
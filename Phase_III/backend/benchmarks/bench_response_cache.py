@@ -0,0 +1,131 @@
+"""
+Benchmark for the Phase III task listing/search response cache.
+
+Seeds one user with N tasks (categories and tags attached) in a temporary
+SQLite database, then replays a dashboard workload: a handful of filter
+combinations for GET /tasks and /tasks/search requested over and over,
+with a task update every --write-every reads. Builds bodies exactly as the
+routes do (TaskService + tasks_json) and compares:
+
+- before: query and serialize on every request
+- after: ResponseCache.get_or_build, with each write bumping the user's
+  data version (hit rate, memory and evictions are printed)
+
+Run from the Phase_III/backend directory:
+    python -m benchmarks.bench_response_cache [--count 20000] [--requests 2000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from models import Category, PriorityEnum, Tag, Task, TaskTag, TaskUpdate, User
+from response_cache import ResponseCache
+from search_index import create_search_index
+from serialization import tasks_json
+from services.task_service import TaskService
+
+
+def seed(engine, count: int, rng: random.Random):
+    """Insert one user with categories, tags and tasks; returns (user_id, tag ids, category ids)"""
+    with Session(engine) as session:
+        user = User(email="cache@example.com", name="Cache", password_hash="x")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+        session.add_all(Category(user_id=user_id, name=f"Category {i}") for i in range(5))
+        session.add_all(Tag(user_id=user_id, name=f"tag-{i}") for i in range(20))
+        session.commit()
+        category_ids = list(session.exec(select(Category.id)).all())
+        tag_ids = list(session.exec(select(Tag.id)).all())
+
+    now = datetime.now()
+    priorities = list(PriorityEnum)
+    with engine.begin() as connection:
+        connection.execute(Task.__table__.insert(), [
+            {"id": i + 1, "user_id": user_id, "title": f"Task {i} {rng.choice(['report', 'invoice', 'groceries'])}",
+             "description": None, "completed": i % 3 == 0, "category_id": rng.choice(category_ids),
+             "priority": priorities[i % 3], "created_at": now, "updated_at": now}
+            for i in range(count)
+        ])
+        connection.execute(TaskTag.__table__.insert(), [
+            {"task_id": task_id, "tag_id": tag_id}
+            for task_id in range(1, count + 1)
+            for tag_id in rng.sample(tag_ids, 2)
+        ])
+    return user_id, tag_ids, category_ids
+
+
+def dashboard_requests(tag_ids, category_ids):
+    """The filter combinations a dashboard keeps asking for, as (endpoint, filters)"""
+    return [
+        ("tasks", dict(limit=100)),
+        ("tasks", dict(status_filter="pending", limit=100)),
+        ("tasks", dict(status_filter="completed", limit=50)),
+        ("tasks", dict(category_id=category_ids[0], limit=100)),
+        ("tasks", dict(tag_ids=tag_ids[:2], tag_match="any", limit=100)),
+        ("tasks/search", dict(search_query="invoice", limit=20)),
+        ("tasks/search", dict(search_query="report", priority="high", limit=20)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--write-every", type=int, default=50, help="reads between task updates")
+    parser.add_argument("--max-bytes", type=int, default=64 * 1024 * 1024)
+    args = parser.parse_args()
+
+    rng = random.Random(25)
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        with engine.begin() as connection:
+            create_search_index(connection)
+        user_id, tag_ids, category_ids = seed(engine, args.count, rng)
+        combos = dashboard_requests(tag_ids, category_ids)
+        workload = [rng.choice(combos) for _ in range(args.requests)]
+
+        def build(session, endpoint, filters):
+            service = TaskService(session)
+            if endpoint == "tasks":
+                return tasks_json(service.get_tasks(user_id=user_id, **filters))
+            return tasks_json(service.search_tasks(user_id=user_id, **filters))
+
+        def run(cache):
+            latencies = []
+            for i, (endpoint, filters) in enumerate(workload):
+                with Session(engine) as session:
+                    if i and i % args.write_every == 0:
+                        # TaskService writes bump the module-level cache; mirror that on this instance
+                        TaskService(session).update_task(user_id, rng.randint(1, args.count),
+                                                         TaskUpdate(title=f"Edited {i}"))
+                        if cache:
+                            cache.bump(user_id)
+                    started = time.perf_counter()
+                    if cache:
+                        cache.get_or_build(user_id, endpoint, filters, lambda: build(session, endpoint, filters))
+                    else:
+                        build(session, endpoint, filters)
+                    latencies.append((time.perf_counter() - started) * 1000)
+            return latencies
+
+        print(f"Tasks: {args.count}, requests: {args.requests}, filter combinations: {len(combos)}, "
+              f"one write per {args.write_every} reads")
+        print(f"{'case':<24} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8}")
+        cache = ResponseCache(max_bytes=args.max_bytes)
+        for label, current in (("before: no cache", None), ("after:  response cache", cache)):
+            latencies = sorted(run(current))
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(f"{label:<24} {statistics.median(latencies):>8.2f} {p95:>8.2f} {statistics.mean(latencies):>8.2f}")
+        print("Cache stats:", cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark for Phase III task search.
+
+Seeds one user with N tasks (titles and descriptions drawn from a word list
+with a skewed frequency) in a temporary SQLite database with the FTS5
+index, then compares for queries of different selectivity:
+
+- before: LIKE '%q%' on title and description (full scan, no ranking)
+- after: TaskService.search_tasks through the full-text index, ranked by
+  relevance, alone and combined with status/priority filters
+
+Run from the Phase_III/backend directory:
+    python -m benchmarks.bench_search [--count 1000000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from models import PriorityEnum, Task, User
+from search_index import create_search_index
+from services.task_service import TaskService
+
+COMMON = "buy call plan book fix clean write review send pay order pick".split()
+RARE = "invoice dentist passport renovation quarterly kubernetes".split()
+
+
+def seed(engine, count: int, rng: random.Random) -> int:
+    with Session(engine) as session:
+        user = User(email="search@example.com", name="Search", password_hash="x")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+
+    def words(n):
+        return " ".join(rng.choice(RARE) if rng.random() < 0.01 else rng.choice(COMMON) for _ in range(n))
+
+    now = datetime.now()
+    priorities = list(PriorityEnum)
+    batch = 50_000
+    # The insert trigger fills the FTS index as rows arrive
+    with engine.begin() as connection:
+        for start in range(0, count, batch):
+            connection.execute(Task.__table__.insert(), [
+                {"user_id": user_id, "title": f"{words(3)} {i}", "description": words(12), "completed": i % 3 == 0,
+                 "priority": priorities[i % 3], "created_at": now, "updated_at": now}
+                for i in range(start, min(start + batch, count))
+            ])
+    return user_id
+
+
+def legacy_search(session: Session, user_id: int, search_query: str, limit: int):
+    return session.exec(
+        select(Task)
+        .where(Task.user_id == user_id)
+        .where(Task.title.contains(search_query) | Task.description.contains(search_query))
+        .order_by(Task.created_at.asc())
+        .limit(limit)
+    ).all()
+
+
+def measure(engine, func, repeats: int):
+    """Return (p50 ms, rows)"""
+    samples, rows = [], []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        with Session(engine) as session:
+            rows = func(session)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(23)
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        with engine.begin() as connection:
+            create_search_index(connection)
+        started = time.perf_counter()
+        user_id = seed(engine, args.count, rng)
+        print(f"Seeded {args.count} tasks (with FTS index) in {time.perf_counter() - started:.1f}s")
+
+        print(f"{'query':<34} {'LIKE ms':>9} {'FTS ms':>9} {'FTS+filters ms':>15} {'rows':>5}")
+        for search_query in ("kubernetes", "passport renovation", "invoi", "review"):
+            like_ms, _ = measure(engine, lambda session: legacy_search(session, user_id, search_query, args.limit),
+                                 args.repeats)
+            fts_ms, rows = measure(
+                engine,
+                lambda session: TaskService(session).search_tasks(user_id, search_query, limit=args.limit),
+                args.repeats)
+            filtered_ms, _ = measure(
+                engine,
+                lambda session: TaskService(session).search_tasks(user_id, search_query, status_filter="pending",
+                                                                  priority="high", limit=args.limit),
+                args.repeats)
+            print(f"{search_query!r:<34} {like_ms:>9.1f} {fts_ms:>9.1f} {filtered_ms:>15.1f} {rows:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark for Phase III task response serialization.
+
+Builds N tasks (with a category and three tags each, as loaded from the
+database) and times turning them into a JSON response body:
+
+- before: nested dicts -> TaskResponse(...) validation -> FastAPI's
+  response_model validation and jsonable serialization -> json.dumps
+- after: model_construct responses -> precompiled TypeAdapter dump_json
+
+Run from the Phase_III/backend directory:
+    python -m benchmarks.bench_serialization [--count 1000]
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+
+from models import Category, Tag, Task, TaskResponse, TaskTag
+from serialization import task_to_response, tasks_json
+
+
+def legacy_task_to_response(task: Task) -> TaskResponse:
+    """The dict-building, fully validating conversion TaskService used before"""
+    category_response = None
+    if task.category:
+        category_response = {
+            "id": task.category.id,
+            "user_id": task.category.user_id,
+            "name": task.category.name,
+            "color": task.category.color,
+            "created_at": task.category.created_at,
+            "updated_at": task.category.updated_at
+        }
+    tag_responses = [
+        {
+            "id": task_tag.tag.id,
+            "user_id": task_tag.tag.user_id,
+            "name": task_tag.tag.name,
+            "created_at": task_tag.tag.created_at,
+            "updated_at": task_tag.tag.updated_at
+        }
+        for task_tag in task.task_tags
+    ]
+    return TaskResponse(
+        id=task.id, user_id=task.user_id, title=task.title, description=task.description,
+        completed=task.completed, category_id=task.category_id, due_date=task.due_date,
+        priority=task.priority, created_at=task.created_at, updated_at=task.updated_at,
+        category=category_response, tags=tag_responses
+    )
+
+
+def build_tasks(count: int) -> List[Task]:
+    now = datetime.now()
+    categories = [Category(id=i, user_id=1, name=f"Category {i}", color="#336699") for i in range(1, 6)]
+    tags = [Tag(id=i, user_id=1, name=f"tag-{i}") for i in range(1, 21)]
+    tasks = []
+    for i in range(count):
+        task = Task(id=i + 1, user_id=1, title=f"Task {i}", description=f"Description for task {i}",
+                    completed=i % 3 == 0, due_date=now + timedelta(days=i % 30),
+                    category_id=categories[i % 5].id)
+        task.category = categories[i % 5]
+        task.task_tags = [TaskTag(task_id=task.id, tag_id=tag.id, tag=tag)
+                          for tag in (tags[i % 20], tags[(i + 7) % 20], tags[(i + 13) % 20])]
+        tasks.append(task)
+    return tasks
+
+
+def measure(func, repeats: int):
+    """Return (p50 ms, best ms, body bytes)"""
+    samples, body = [], b""
+    for _ in range(repeats):
+        started = time.perf_counter()
+        body = func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), min(samples), len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=30)
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.count)
+    response_adapter = TypeAdapter(List[TaskResponse])
+
+    def before() -> bytes:
+        responses = [legacy_task_to_response(task) for task in tasks]
+        # What FastAPI does with a response_model: validate, serialize, then json.dumps
+        validated = response_adapter.validate_python(responses)
+        content = response_adapter.dump_python(validated, mode="json")
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+    def after() -> bytes:
+        return tasks_json([task_to_response(task) for task in tasks])
+
+    assert json.loads(before()) == json.loads(after())
+    print(f"Serializing {args.count} tasks (category + 3 tags each)")
+    print(f"{'path':<8} {'p50 ms':>9} {'best ms':>9} {'bytes':>10}")
+    results = {label: measure(func, args.repeats) for label, func in (("before", before), ("after", after))}
+    for label, (p50, best, size) in results.items():
+        print(f"{label:<8} {p50:>9.2f} {best:>9.2f} {size:>10,}")
+    print(f"speedup (p50): {results['before'][0] / results['after'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
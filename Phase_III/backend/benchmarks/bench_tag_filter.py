@@ -0,0 +1,114 @@
+"""
+Benchmark for Phase III tag filtering.
+
+Seeds one user with N tasks and 50 tags (1-5 random tags per task) in a
+temporary SQLite database, then compares a page of tasks filtered by tags:
+
+- before: LIMIT/OFFSET first, then lazy-load each task's tags and filter
+  in Python (pages come back short or empty)
+- after: the all-tags / any-tags filter in SQL via TaskService.get_tasks
+
+Run from the Phase_III/backend directory:
+    python -m benchmarks.bench_tag_filter [--count 100000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from models import PriorityEnum, Tag, Task, TaskTag, User
+from services.task_service import TaskService
+
+
+def seed(engine, count: int, tag_count: int, rng: random.Random):
+    """Insert one user, their tags and tasks; returns (user_id, tag ids)"""
+    with Session(engine) as session:
+        user = User(email="tags@example.com", name="Tags", password_hash="x")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+        session.add_all(Tag(user_id=user_id, name=f"tag-{i}") for i in range(tag_count))
+        session.commit()
+        tag_ids = list(session.exec(select(Tag.id).where(Tag.user_id == user_id)).all())
+
+    now = datetime.now()
+    with engine.begin() as connection:
+        connection.execute(Task.__table__.insert(), [
+            {"id": i + 1, "user_id": user_id, "title": f"Task {i}", "description": None, "completed": i % 4 == 0,
+             "priority": PriorityEnum.medium, "created_at": now - timedelta(seconds=count - i), "updated_at": now}
+            for i in range(count)
+        ])
+        connection.execute(TaskTag.__table__.insert(), [
+            {"task_id": task_id, "tag_id": tag_id}
+            for task_id in range(1, count + 1)
+            for tag_id in rng.sample(tag_ids, rng.randint(1, 5))
+        ])
+    return user_id, tag_ids
+
+
+def legacy_page(session: Session, user_id: int, tag_ids, limit: int, offset: int):
+    """The old behaviour: paginate, then lazy-load tags and drop non-matching tasks"""
+    tasks = session.exec(
+        select(Task).where(Task.user_id == user_id).order_by(Task.created_at.desc()).limit(limit).offset(offset)
+    ).all()
+    return [task for task in tasks if all(tag_id in [tt.tag_id for tt in task.task_tags] for tag_id in tag_ids)]
+
+
+def measure(func, repeats: int):
+    """Return (p50 ms, rows returned)"""
+    samples, rows = [], []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        rows = func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(20)
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        user_id, tag_ids = seed(engine, args.count, args.tags, rng)
+        two_tags = tag_ids[:2]
+
+        cases = [
+            ("before: all of 2 tags, page 1",
+             lambda session: legacy_page(session, user_id, two_tags, args.limit, 0)),
+            ("after:  all of 2 tags, page 1",
+             lambda session: TaskService(session).get_tasks(user_id, tag_ids=two_tags, limit=args.limit)),
+            ("after:  all of 2 tags, page 10",
+             lambda session: TaskService(session).get_tasks(user_id, tag_ids=two_tags, limit=args.limit,
+                                                            offset=9 * args.limit)),
+            ("after:  any of 2 tags, page 1",
+             lambda session: TaskService(session).get_tasks(user_id, tag_ids=two_tags, tag_match="any",
+                                                            limit=args.limit)),
+            ("after:  1 tag + pending, page 1",
+             lambda session: TaskService(session).get_tasks(user_id, tag_ids=two_tags[:1], status_filter="pending",
+                                                            limit=args.limit)),
+        ]
+        print(f"Tasks: {args.count}, tags: {args.tags}, page size: {args.limit}")
+        print(f"{'case':<34} {'p50 ms':>9} {'rows':>6}")
+        for label, func in cases:
+            # A fresh session per run so nothing is served from the identity map
+            def run():
+                with Session(engine) as session:
+                    return func(session)
+            p50, rows = measure(run, args.repeats)
+            print(f"{label:<34} {p50:>9.2f} {rows:>6}")
+
+
+if __name__ == "__main__":
+    main()
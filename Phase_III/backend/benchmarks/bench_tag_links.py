@@ -0,0 +1,113 @@
+"""
+Benchmark for attaching and detaching tags in Phase III.
+
+Tags M tasks with K tags (and then removes them) in a temporary SQLite
+database, comparing:
+
+- before: the per-tag loop (an existence SELECT per tag, a SELECT and a
+  DELETE per removed tag), one call per task
+- after, per task: add_tags_to_task / remove_tags_from_task with one
+  INSERT ... ON CONFLICT DO NOTHING / one DELETE
+- after, bulk: a single bulk_update_task_tags call for all tasks
+
+Run from the Phase_III/backend directory:
+    python -m benchmarks.bench_tag_links [--tasks 500] [--tags 5]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import delete
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from models import Tag, Task, TaskTag, User
+from services.task_service import TaskService
+
+
+def legacy_add(session: Session, task_id: int, tag_ids):
+    for tag_id in tag_ids:
+        existing = session.exec(
+            select(TaskTag).where(TaskTag.task_id == task_id).where(TaskTag.tag_id == tag_id)
+        ).first()
+        if not existing:
+            session.add(TaskTag(task_id=task_id, tag_id=tag_id))
+    session.commit()
+
+
+def legacy_remove(session: Session, task_id: int, tag_ids):
+    for tag_id in tag_ids:
+        task_tag = session.exec(
+            select(TaskTag).where(TaskTag.task_id == task_id).where(TaskTag.tag_id == tag_id)
+        ).first()
+        if task_tag:
+            session.delete(task_tag)
+    session.commit()
+
+
+def seed(engine, task_count: int, tag_count: int):
+    with Session(engine) as session:
+        user = User(email="links@example.com", name="Links", password_hash="x")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+        session.add_all(Tag(user_id=user_id, name=f"tag-{i}") for i in range(tag_count))
+        session.add_all(Task(user_id=user_id, title=f"Task {i}") for i in range(task_count))
+        session.commit()
+        task_ids = list(session.exec(select(Task.id).order_by(Task.id)).all())
+        tag_ids = list(session.exec(select(Tag.id).order_by(Tag.id)).all())
+    return user_id, task_ids, tag_ids
+
+
+def timed(engine, func) -> float:
+    started = time.perf_counter()
+    with Session(engine) as session:
+        func(session)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--tags", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        user_id, task_ids, tag_ids = seed(engine, args.tasks, args.tags)
+        links = len(task_ids) * len(tag_ids)
+
+        def per_task(action):
+            def run(session):
+                for task_id in task_ids:
+                    action(session, task_id)
+            return run
+
+        service_add = per_task(lambda session, task_id: TaskService(session).add_tags_to_task(user_id, task_id, tag_ids))
+        service_remove = per_task(
+            lambda session, task_id: TaskService(session).remove_tags_from_task(user_id, task_id, tag_ids))
+        cases = [
+            ("before: per-tag loop", per_task(lambda session, task_id: legacy_add(session, task_id, tag_ids)),
+             per_task(lambda session, task_id: legacy_remove(session, task_id, tag_ids))),
+            ("after:  per task", service_add, service_remove),
+            ("after:  bulk", lambda session: TaskService(session).bulk_update_task_tags(user_id, task_ids, tag_ids),
+             lambda session: TaskService(session).bulk_update_task_tags(user_id, task_ids, remove_tag_ids=tag_ids)),
+        ]
+        print(f"Tagging {len(task_ids)} tasks with {len(tag_ids)} tags ({links} links)")
+        print(f"{'case':<22} {'attach links/s':>15} {'detach links/s':>15}")
+        for label, attach, detach in cases:
+            attach_s = timed(engine, attach)
+            # Re-tagging is idempotent: a second attach must not add links
+            timed(engine, attach)
+            with Session(engine) as session:
+                assert len(session.exec(select(TaskTag)).all()) == links
+            detach_s = timed(engine, detach)
+            with Session(engine) as session:
+                session.exec(delete(TaskTag))
+                session.commit()
+            print(f"{label:<22} {links / attach_s:>15,.0f} {links / detach_s:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
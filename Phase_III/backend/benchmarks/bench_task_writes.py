@@ -0,0 +1,122 @@
+"""
+Benchmark for Phase III task writes with tags.
+
+Creates (and then updates) tasks carrying 20 tags in a temporary SQLite
+database and reports statements per request and p50/p95 latency for:
+
+- before: session.get per tag/category/user, a commit for the task and
+  another for its tags
+- after: TaskService with one ownership query per entity type and one commit
+
+Run from the Phase_III/backend directory:
+    python -m benchmarks.bench_task_writes [--requests 500] [--tags 20]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from models import Category, Tag, Task, TaskCreate, TaskTag, TaskUpdate, User
+from services.task_service import TaskService
+
+
+def legacy_create(session: Session, user_id: int, task_data: TaskCreate, tag_ids):
+    """TaskService.create_task as it was before: per-id lookups and two commits"""
+    assert session.get(User, user_id)
+    if task_data.category_id:
+        category = session.get(Category, task_data.category_id)
+        assert category and category.user_id == user_id
+    for tag_id in tag_ids:
+        tag = session.get(Tag, tag_id)
+        assert tag and tag.user_id == user_id
+    task = Task(user_id=user_id, title=task_data.title, description=task_data.description,
+                completed=False, category_id=task_data.category_id, priority=task_data.priority)
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+    for tag_id in tag_ids:
+        session.add(TaskTag(task_id=task.id, tag_id=tag_id))
+    session.commit()
+    TaskService(session).get_task(user_id, task.id)
+
+
+def seed(engine, tag_count: int):
+    with Session(engine) as session:
+        user = User(email="writes@example.com", name="Writes", password_hash="x")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+        session.add(Category(user_id=user_id, name="Work"))
+        session.add_all(Tag(user_id=user_id, name=f"tag-{i}") for i in range(tag_count * 2))
+        session.commit()
+        category_id = session.exec(select(Category.id)).first()
+        tag_ids = list(session.exec(select(Tag.id).order_by(Tag.id)).all())
+    return user_id, category_id, tag_ids
+
+
+def run(engine, requests: int, func):
+    """Call func(session, i) once per request on a fresh session; returns (statements per request, latencies ms)"""
+    statements = 0
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += 1
+
+    latencies = []
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        for i in range(requests):
+            started = time.perf_counter()
+            with Session(engine) as session:
+                func(session, i)
+            latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return statements / requests, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--tags", type=int, default=20, help="tags attached per task")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(data_dir, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        user_id, category_id, tag_ids = seed(engine, args.tags)
+        first_tags, other_tags = tag_ids[:args.tags], tag_ids[args.tags:]
+
+        def task_data(i):
+            return TaskCreate(title=f"Task {i}", description="with tags", category_id=category_id)
+
+        created = []
+
+        def create(session, i):
+            created.append(TaskService(session).create_task(user_id, task_data(i), tag_ids=first_tags).id)
+
+        def update(session, i):
+            # Swap the whole tag set, which deletes and inserts every link
+            TaskService(session).update_task(user_id, created[i], TaskUpdate(title=f"Updated {i}"),
+                                             tag_ids=other_tags)
+
+        cases = [
+            ("before: create", lambda session, i: legacy_create(session, user_id, task_data(i), first_tags)),
+            ("after:  create", create),
+            ("after:  update (replace tags)", update),
+        ]
+        print(f"Requests: {args.requests}, tags per task: {args.tags}")
+        print(f"{'case':<30} {'stmts/req':>10} {'p50 ms':>8} {'p95 ms':>8}")
+        for label, func in cases:
+            per_request, latencies = run(engine, args.requests, func)
+            ordered = sorted(latencies)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            print(f"{label:<30} {per_request:>10.1f} {statistics.median(latencies):>8.2f} {p95:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
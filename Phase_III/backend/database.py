@@ -1,5 +1,7 @@
 from sqlmodel import create_engine, Session
 from models import SQLModel
+from search_index import create_search_index
+from fuzzy_search import create_trigram_index
 from typing import Generator
 import os
 
@@ -17,6 +19,10 @@ engine = create_engine(
 def create_db_and_tables():
     """Create database tables based on models"""
     SQLModel.metadata.create_all(engine)
+    # Full-text and title trigram indexes for task search (also created by the 003 and 004 migrations)
+    with engine.begin() as connection:
+        create_search_index(connection)
+        create_trigram_index(connection)
 
 def get_session() -> Generator[Session, None, None]:
     """Get database session for dependency injection"""
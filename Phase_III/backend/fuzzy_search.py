@@ -0,0 +1,220 @@
+import heapq
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import func, literal, select, text
+from sqlalchemy.engine import Connection
+from sqlmodel import Session
+from models import Task
+
+# Smallest share of the query's trigrams a title must contain to be a match (pg_trgm's default is 0.6,
+# which misses one-letter typos in short words)
+MIN_SCORE = float(os.getenv("FUZZY_MIN_SCORE", "0.4"))
+# Time the in-process index may spend counting candidates before ranking what it has
+SEARCH_BUDGET_MS = float(os.getenv("FUZZY_SEARCH_BUDGET_MS", "50"))
+# Rebuild a user's in-process index after this long, to pick up writes made by other workers
+INDEX_TTL_SECONDS = float(os.getenv("FUZZY_INDEX_TTL_SECONDS", "60"))
+# Users whose index is kept in memory; the least recently searched are dropped first
+MAX_INDEXED_USERS = int(os.getenv("FUZZY_MAX_INDEXED_USERS", "1024"))
+
+# PostgreSQL: pg_trgm GIN index on the title, used by the <% (word similarity) operator
+POSTGRES_CREATE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_task_title_trgm ON task USING GIN (title gin_trgm_ops)",
+]
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS ix_task_title_trgm",
+]
+
+
+def create_trigram_index(connection: Connection):
+    """Create the title trigram index on PostgreSQL (other databases use the in-process index)"""
+    if connection.dialect.name == "postgresql":
+        for statement in POSTGRES_CREATE:
+            connection.execute(text(statement))
+
+
+def drop_trigram_index(connection: Connection):
+    """Remove the title trigram index"""
+    if connection.dialect.name == "postgresql":
+        for statement in POSTGRES_DROP:
+            connection.execute(text(statement))
+
+
+def trigrams(value: str) -> Set[str]:
+    """Trigrams of each word padded the way pg_trgm does ("  w", " wo", "wor", "ord", "rd ")"""
+    grams = set()
+    for word in re.findall(r"\w+", value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class UserTitleIndex:
+    """Trigram posting lists over one user's task titles; callers hold `lock` while using it"""
+
+    def __init__(self, rows: Iterable[Tuple[int, str]]):
+        self.built_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.postings: Dict[str, Set[int]] = defaultdict(set)
+        self.grams: Dict[int, Set[str]] = {}
+        for task_id, title in rows:
+            self.put(task_id, title)
+
+    def put(self, task_id: int, title: str):
+        self.discard(task_id)
+        grams = trigrams(title)
+        for gram in grams:
+            self.postings[gram].add(task_id)
+        self.grams[task_id] = grams
+
+    def discard(self, task_id: int):
+        for gram in self.grams.pop(task_id, ()):
+            self.postings[gram].discard(task_id)
+            if not self.postings[gram]:
+                del self.postings[gram]
+
+    def search(self, query: str, limit: int, min_score: float, deadline: float) -> List[Tuple[int, float]]:
+        """
+        Top `limit` (task id, score) pairs, where the score is the share of the query's trigrams found in
+        the title; ties go to the title closest in length. Rarest trigrams are counted first, so when the
+        deadline passes the ranking is built from the most selective ones.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in sorted(grams, key=lambda gram: len(self.postings.get(gram, ()))):
+            if shared and time.perf_counter() > deadline:
+                break
+            for task_id in self.postings.get(gram, ()):
+                shared[task_id] += 1
+
+        def ranked():
+            for task_id, count in shared.items():
+                score = count / len(grams)
+                if score >= min_score:
+                    similarity = count / (len(grams) + len(self.grams[task_id]) - count)
+                    yield score, similarity, -task_id
+
+        return [(-task_id, score) for score, _, task_id in heapq.nlargest(limit, ranked())]
+
+
+class TitleIndex:
+    """
+    Per-user in-process title indexes, built on first search and kept current by TaskService writes.
+    The registry lock only guards the user map; each index has its own lock, so a search or rebuild
+    for one user never waits on another's. Writes that arrive while a user's index is being rebuilt
+    are journaled and replayed onto the new index before it replaces the old one.
+    """
+
+    def __init__(self, ttl_seconds: float = INDEX_TTL_SECONDS, max_users: int = MAX_INDEXED_USERS):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._users: "OrderedDict[int, UserTitleIndex]" = OrderedDict()
+        # Writes seen during each in-flight rebuild, per user: (task id, title or None for a removal)
+        self._journals: Dict[int, List[List[Tuple[int, Optional[str]]]]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def search(self, user_id: int, load: Callable[[], Iterable[Tuple[int, str]]], query: str, limit: int,
+               min_score: float, budget_ms: float) -> List[Tuple[int, float]]:
+        """Search the user's index, (re)built from `load()` when missing or older than the TTL"""
+        deadline = time.perf_counter() + budget_ms / 1000
+        with self._lock:
+            index = self._users.get(user_id)
+            if index and time.monotonic() - index.built_at < self.ttl_seconds:
+                self._users.move_to_end(user_id)
+            else:
+                index = None
+                journal: List[Tuple[int, Optional[str]]] = []
+                self._journals[user_id].append(journal)
+        if index is None:
+            index = self._rebuild(user_id, load, journal)
+        with index.lock:
+            return index.search(query, limit, min_score, deadline)
+
+    def _rebuild(self, user_id: int, load: Callable[[], Iterable[Tuple[int, str]]],
+                 journal: List[Tuple[int, Optional[str]]]) -> UserTitleIndex:
+        """Build outside the registry lock, then replay the writes journaled meanwhile and install"""
+        try:
+            index = UserTitleIndex(load())
+        except BaseException:
+            with self._lock:
+                self._drop_journal(user_id, journal)
+            raise
+        with self._lock:
+            self._drop_journal(user_id, journal)
+            for task_id, title in journal:
+                if title is None:
+                    index.discard(task_id)
+                else:
+                    index.put(task_id, title)
+            self._users[user_id] = index
+            self._users.move_to_end(user_id)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        return index
+
+    def _drop_journal(self, user_id: int, journal: List[Tuple[int, Optional[str]]]):
+        journals = self._journals[user_id]
+        journals.remove(journal)
+        if not journals:
+            del self._journals[user_id]
+
+    def _record(self, user_id: int, task_id: int, title: Optional[str]):
+        with self._lock:
+            index = self._users.get(user_id)
+            for journal in self._journals.get(user_id, ()):
+                journal.append((task_id, title))
+        if index is not None:
+            with index.lock:
+                if title is None:
+                    index.discard(task_id)
+                else:
+                    index.put(task_id, title)
+
+    def put(self, user_id: int, task_id: int, title: str):
+        """Record a created or renamed task (no-op for users without an index or a rebuild in flight)"""
+        self._record(user_id, task_id, title)
+
+    def discard(self, user_id: int, task_id: int):
+        self._record(user_id, task_id, None)
+
+    def invalidate(self, user_id: int):
+        """Drop a user's index so the next search rebuilds it"""
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+
+
+title_index = TitleIndex()
+
+
+def fuzzy_title_search(session: Session, user_id: int, query: str, limit: int = 5,
+                       min_score: float = MIN_SCORE) -> List[Tuple[int, float]]:
+    """
+    Ids of the user's tasks whose title best matches `query` despite typos, with their score (0-1),
+    best first. PostgreSQL answers from the pg_trgm index; other databases from the in-process index.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        score = func.word_similarity(query, Task.title)
+        # <% only uses the GIN index with the threshold as a setting, not as a bound parameter
+        session.execute(select(func.set_config("pg_trgm.word_similarity_threshold", str(min_score), True)))
+        rows = session.execute(
+            select(Task.id, score)
+            .where(Task.user_id == user_id, literal(query).op("<%")(Task.title))
+            .order_by(score.desc(), func.similarity(query, Task.title).desc(), Task.id)
+            .limit(limit)
+        ).all()
+        return [(task_id, float(value)) for task_id, value in rows]
+
+    return title_index.search(
+        user_id, lambda: session.execute(select(Task.id, Task.title).where(Task.user_id == user_id)).all(),
+        query, limit, min_score, SEARCH_BUDGET_MS
+    )
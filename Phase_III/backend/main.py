@@ -6,6 +6,7 @@ from sqlmodel import Session
 import models
 from routes import auth, tasks, categories, tags, search, reminders, recurring, ai
 from websocket import websocket_app
+from response_cache import response_cache
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -32,6 +33,9 @@ app.add_middleware(
 # Include authentication routes
 app.include_router(auth.router, prefix="/auth", tags=["authentication"])
 
+# Include search routes (before the task routes, so /tasks/search and /tasks/fuzzy are not taken for /tasks/{task_id})
+app.include_router(search.router, prefix="/api/{user_id}", tags=["search"])
+
 # Include task routes
 app.include_router(tasks.router, prefix="/api/{user_id}", tags=["tasks"])
 
@@ -41,9 +45,6 @@ app.include_router(categories.router, prefix="/api/{user_id}", tags=["categories
 # Include tag routes
 app.include_router(tags.router, prefix="/api/{user_id}", tags=["tags"])
 
-# Include search routes
-app.include_router(search.router, prefix="/api/{user_id}", tags=["search"])
-
 # Include reminder routes
 app.include_router(reminders.router, prefix="/api/{user_id}", tags=["reminders"])
 
@@ -64,6 +65,11 @@ def read_root():
 def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics/response-cache", tags=["metrics"])
+def response_cache_stats():
+    """Hit rate, memory use and evictions of the task listing/search response cache"""
+    return response_cache.stats()
+
 # Dependency to get database session
 def get_db_session():
     with get_session() as session:
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, create_engine, Session, Relationship
+from sqlalchemy import Index
 from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, field_validator
@@ -145,6 +146,9 @@ class TaskResponse(TaskBase):
 
 class Task(SQLModel, table=True):
     """SQLModel for tasks table"""
+    # Serves each user's listing in created_at order (and the id tie-breaker)
+    __table_args__ = (Index("ix_task_user_created", "user_id", "created_at", "id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")  # Foreign key to link to user
     title: str = Field(min_length=1, max_length=200)
@@ -294,8 +298,33 @@ class TaskTagResponse(TaskTagBase):
     pass
 
 
+class TaskTagsBulkUpdate(BaseModel):
+    """Model for adding and/or removing tags on many tasks at once"""
+    task_ids: List[int]
+    add_tag_ids: List[int] = []
+    remove_tag_ids: List[int] = []
+
+
+class TaskTagsBulkResult(BaseModel):
+    """Model for the outcome of a bulk tag change"""
+    tasks: int
+    added: int
+    removed: int
+
+
+class TaskMatch(BaseModel):
+    """Model for a task found by approximate title"""
+    id: int
+    title: str
+    completed: bool
+    score: float
+
+
 class TaskTag(SQLModel, table=True):
     """SQLModel for task_tags junction table"""
+    # The primary key covers task -> tags; this covers tag -> tasks for tag filters
+    __table_args__ = (Index("ix_tasktag_tag_task", "tag_id", "task_id"),)
+
     task_id: int = Field(foreign_key="task.id", primary_key=True)
     tag_id: int = Field(foreign_key="tag.id", primary_key=True)
 
@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Set, Tuple
+
+# Memory for cached response bodies; 0 disables the cache
+MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Entries older than this are dropped; 0 keeps them until evicted or invalidated. Versions live in
+# this process only, so set it when several workers share one database
+TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "0"))
+# Rough per-entry bookkeeping cost (key tuple, dict slots) added to the body size
+ENTRY_OVERHEAD_BYTES = 200
+
+CacheKey = Tuple[int, int, str, Tuple[Tuple[str, Hashable], ...]]
+
+
+def normalize_params(params: Dict[str, Any]) -> Tuple[Tuple[str, Hashable], ...]:
+    """Hashable form of a filter set: unset filters dropped, id lists sorted and deduplicated"""
+    normalized = []
+    for name, value in sorted(params.items()):
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            value = tuple(sorted(set(value)))
+        elif isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+class ResponseCache:
+    """
+    LRU of serialized responses keyed by user, endpoint, normalized filters and the user's data version.
+    Services call bump() after every committed write, which moves the user to a new version and drops
+    their entries; a body built while a write was committing is never stored.
+    """
+
+    def __init__(self, max_bytes: int = MAX_BYTES, ttl_seconds: float = TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[bytes, float]]" = OrderedDict()
+        self._user_keys: Dict[int, Set[CacheKey]] = defaultdict(set)
+        self._versions: Dict[int, int] = defaultdict(int)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = self.expirations = 0
+
+    def get_or_build(self, user_id: int, endpoint: str, params: Dict[str, Any], build: Callable[[], bytes]) -> bytes:
+        """Return the cached body for this request, or build, store and return it"""
+        if self.max_bytes <= 0:
+            return build()
+        with self._lock:
+            version = self._versions[user_id]
+            key = (user_id, version, endpoint, normalize_params(params))
+            entry = self._entries.get(key)
+            if entry and self.ttl_seconds and time.monotonic() - entry[1] >= self.ttl_seconds:
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        body = build()
+
+        with self._lock:
+            # A write committed while the body was built: it may predate the write, so don't keep it
+            if self._versions[user_id] == version and key not in self._entries:
+                size = len(body) + ENTRY_OVERHEAD_BYTES
+                if size <= self.max_bytes:
+                    self._entries[key] = (body, time.monotonic())
+                    self._user_keys[user_id].add(key)
+                    self._bytes += size
+                    while self._bytes > self.max_bytes:
+                        self._remove(next(iter(self._entries)))
+                        self.evictions += 1
+        return body
+
+    def bump(self, user_id: int):
+        """Record a write to the user's data: cached responses for them are never served again"""
+        with self._lock:
+            self._versions[user_id] += 1
+            keys = self._user_keys.pop(user_id, set())
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+
+    def _remove(self, key: CacheKey):
+        body, _ = self._entries.pop(key)
+        self._bytes -= len(body) + ENTRY_OVERHEAD_BYTES
+        user_keys = self._user_keys.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._user_keys[key[0]]
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate, memory use and eviction counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.max_bytes > 0,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "users": len(self._user_keys),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "expirations": self.expirations,
+            }
+
+    def clear(self):
+        """Drop every entry and reset the counters (versions are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._user_keys.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.invalidations = self.expirations = 0
+
+
+response_cache = ResponseCache()
@@ -3,9 +3,11 @@ from sqlmodel import Session
 from typing import List, Optional
 from datetime import datetime
 from database import get_session
-from models import TaskResponse
+from models import TaskResponse, TaskMatch
 from services.task_service import TaskService
 from auth import get_current_user
+from serialization import PrebuiltJSONResponse, tasks_json
+from response_cache import response_cache
 
 router = APIRouter()
 
@@ -17,22 +19,23 @@ def search_tasks(
     status: Optional[str] = Query(None, description="Filter by status (pending, completed)"),
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     tag_ids: Optional[List[int]] = Query(None, description="Filter by tag IDs"),
+    tag_match: str = Query("all", description="Match tasks with all or any of the tag IDs (all, any)"),
     due_date_start: Optional[datetime] = Query(None, description="Filter by due date start"),
     due_date_end: Optional[datetime] = Query(None, description="Filter by due date end"),
     priority: Optional[str] = Query(None, description="Filter by priority (low, medium, high)"),
-    sort_by: Optional[str] = Query(None, description="Sort by field (title, due_date, priority, created_at)"),
+    sort_by: Optional[str] = Query(None, description="Sort by field (relevance, title, due_date, priority, created_at); defaults to relevance when searching"),
     sort_order: Optional[str] = Query("asc", description="Sort order (asc, desc)"),
     limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination")
 ):
     """Search and filter tasks with advanced options"""
     service = TaskService(session)
-    return service.search_tasks(
-        user_id=current_user.id,
+    filters = dict(
         search_query=query,
         status_filter=status,
         category_id=category_id,
         tag_ids=tag_ids,
+        tag_match=tag_match,
         due_date_start=due_date_start,
         due_date_end=due_date_end,
         priority=priority,
@@ -41,6 +44,23 @@ def search_tasks(
         limit=limit,
         offset=offset
     )
+    body = response_cache.get_or_build(
+        current_user.id, "tasks/search", filters,
+        lambda: tasks_json(service.search_tasks(user_id=current_user.id, **filters))
+    )
+    return PrebuiltJSONResponse(body)
+
+
+@router.get("/tasks/fuzzy", response_model=List[TaskMatch])
+def find_tasks_by_title(
+    current_user = Depends(get_current_user),
+    session: Session = Depends(get_session),
+    q: str = Query(..., min_length=1, max_length=200, description="Approximate task title (typos allowed)"),
+    limit: int = Query(5, ge=1, le=20, description="Number of matches to return")
+):
+    """Find tasks by approximate title, ranked by trigram similarity"""
+    service = TaskService(session)
+    return service.find_tasks_by_title(current_user.id, q, limit)
 
 
 @router.get("/tasks/suggestions", response_model=List[TaskResponse])
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from sqlmodel import Session
 from typing import List, Optional
 from datetime import datetime
 from database import get_session
-from models import Task, TaskCreate, TaskUpdate, TaskResponse
+from models import Task, TaskCreate, TaskUpdate, TaskResponse, TaskTagsBulkUpdate, TaskTagsBulkResult
 from services.task_service import TaskService
 from auth import get_current_user
 from websocket import manager
+from serialization import PrebuiltJSONResponse, task_json, tasks_json
+from response_cache import response_cache
 
 router = APIRouter()
 
@@ -17,6 +19,7 @@ def get_tasks(
     status: Optional[str] = Query(None, description="Filter by status (pending, completed)"),
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     tag_ids: Optional[List[int]] = Query(None, description="Filter by tag IDs"),
+    tag_match: str = Query("all", description="Match tasks with all or any of the tag IDs (all, any)"),
     due_date_start: Optional[datetime] = Query(None, description="Filter by due date start"),
     due_date_end: Optional[datetime] = Query(None, description="Filter by due date end"),
     priority: Optional[str] = Query(None, description="Filter by priority (low, medium, high)"),
@@ -25,17 +28,24 @@ def get_tasks(
 ):
     """Get all tasks for the current user with optional filters"""
     service = TaskService(session)
-    return service.get_tasks(
-        user_id=current_user.id,
+    filters = dict(
         status_filter=status,
         category_id=category_id,
         tag_ids=tag_ids,
+        tag_match=tag_match,
         due_date_start=due_date_start,
         due_date_end=due_date_end,
         priority=priority,
         limit=limit,
         offset=offset
     )
+    # Encoded straight from the trusted responses; response_model only documents the shape.
+    # Repeated filter combinations are served from the cache until the user's data changes
+    body = response_cache.get_or_build(
+        current_user.id, "tasks", filters,
+        lambda: tasks_json(service.get_tasks(user_id=current_user.id, **filters))
+    )
+    return PrebuiltJSONResponse(body)
 
 
 @router.post("/tasks", response_model=TaskResponse)
@@ -58,7 +68,7 @@ def create_task(
     }
     manager.broadcast_to_user(str(message), current_user.id)
 
-    return created_task
+    return PrebuiltJSONResponse(task_json(created_task))
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
@@ -69,7 +79,7 @@ def get_task(
 ):
     """Get a specific task for the current user"""
     service = TaskService(session)
-    return service.get_task(current_user.id, task_id)
+    return PrebuiltJSONResponse(task_json(service.get_task(current_user.id, task_id)))
 
 
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
@@ -92,7 +102,7 @@ def update_task(
     }
     manager.broadcast_to_user(str(message), current_user.id)
 
-    return updated_task
+    return PrebuiltJSONResponse(task_json(updated_task))
 
 
 @router.delete("/tasks/{task_id}")
@@ -137,7 +147,7 @@ def toggle_task_completion(
     }
     manager.broadcast_to_user(str(message), current_user.id)
 
-    return toggled_task
+    return PrebuiltJSONResponse(task_json(toggled_task))
 
 
 @router.post("/tasks/{task_id}/tags", response_model=TaskResponse)
@@ -159,7 +169,7 @@ def add_tags_to_task(
     }
     manager.broadcast_to_user(str(message), current_user.id)
 
-    return updated_task
+    return PrebuiltJSONResponse(task_json(updated_task))
 
 
 @router.delete("/tasks/{task_id}/tags", response_model=TaskResponse)
@@ -181,4 +191,31 @@ def remove_tags_from_task(
     }
     manager.broadcast_to_user(str(message), current_user.id)
 
-    return updated_task
\ No newline at end of file
+    return PrebuiltJSONResponse(task_json(updated_task))
+
+
+@router.post("/tasks/tags/bulk", response_model=TaskTagsBulkResult)
+def bulk_update_task_tags(
+    changes: TaskTagsBulkUpdate,
+    background_tasks: BackgroundTasks,
+    current_user = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """Add and/or remove tags on many tasks at once (e.g. tag every selected task)"""
+    service = TaskService(session)
+    result = service.bulk_update_task_tags(
+        current_user.id,
+        changes.task_ids,
+        add_tag_ids=changes.add_tag_ids,
+        remove_tag_ids=changes.remove_tag_ids
+    )
+
+    # Broadcast the change once for all affected tasks; the coroutine is awaited after the response is sent
+    message = {
+        "type": "tasks_tags_updated",
+        "task_ids": changes.task_ids,
+        "timestamp": datetime.now().isoformat()
+    }
+    background_tasks.add_task(manager.broadcast_to_user, str(message), current_user.id)
+
+    return result
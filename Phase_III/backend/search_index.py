@@ -0,0 +1,103 @@
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import column, false, func, inspect, literal_column, table, text
+from sqlalchemy.engine import Connection
+from models import Task
+
+# SQLite: external-content FTS5 table over task(title, description), kept in sync by triggers
+SQLITE_FTS_TABLE = "task_fts"
+SQLITE_CREATE = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        title, description, content='task', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS task_fts_ai AFTER INSERT ON task BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS task_fts_ad AFTER DELETE ON task BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS task_fts_au AFTER UPDATE OF title, description ON task BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+SQLITE_REBUILD = f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS task_fts_au",
+    "DROP TRIGGER IF EXISTS task_fts_ad",
+    "DROP TRIGGER IF EXISTS task_fts_ai",
+    f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}",
+]
+
+# PostgreSQL: generated tsvector column (title weighted above description) with a GIN index
+POSTGRES_CREATE = [
+    """ALTER TABLE task ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_task_search_vector ON task USING GIN (search_vector)",
+]
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS ix_task_search_vector",
+    "ALTER TABLE task DROP COLUMN IF EXISTS search_vector",
+]
+
+task_fts = table(SQLITE_FTS_TABLE, column("rowid"), column("rank"))
+
+
+def create_search_index(connection: Connection):
+    """Create the full-text index for the connection's dialect (no-op if it already exists)"""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        exists = inspect(connection).has_table(SQLITE_FTS_TABLE)
+        for statement in SQLITE_CREATE:
+            connection.execute(text(statement))
+        if not exists:
+            # Index the tasks written before the index existed
+            connection.execute(text(SQLITE_REBUILD))
+    elif dialect == "postgresql":
+        for statement in POSTGRES_CREATE:
+            connection.execute(text(statement))
+
+
+def drop_search_index(connection: Connection):
+    """Remove the full-text index for the connection's dialect"""
+    statements = {"sqlite": SQLITE_DROP, "postgresql": POSTGRES_DROP}.get(connection.dialect.name, [])
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def search_terms(search_query: str) -> List[str]:
+    """Split a user's query into words; punctuation and search operators are dropped"""
+    return re.findall(r"\w+", search_query.lower())
+
+
+def apply_text_search(query, dialect: str, search_query: str) -> Tuple[object, Optional[object]]:
+    """
+    Restrict a task query to tasks matching every word of `search_query` (the last word as a prefix,
+    so results follow typing). Returns the query and an ORDER BY clause ranking by relevance, or
+    None when the dialect has no full-text index and a substring match is used instead. A query
+    without any word matches no task.
+    """
+    terms = search_terms(search_query)
+    if not terms:
+        # Only punctuation/operators: no word can match, so nothing does (rather than every task)
+        return query.where(false()), None
+
+    if dialect == "sqlite":
+        match = " ".join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+        query = query.join(task_fts, task_fts.c.rowid == Task.id).where(
+            literal_column(SQLITE_FTS_TABLE).op("MATCH")(match.strip())
+        )
+        # FTS5's rank is bm25(): lower is more relevant
+        return query, task_fts.c.rank.asc()
+
+    if dialect == "postgresql":
+        vector = literal_column("task.search_vector")
+        ts_query = func.to_tsquery("simple", " & ".join(terms[:-1] + [f"{terms[-1]}:*"]))
+        query = query.where(vector.op("@@")(ts_query))
+        return query, func.ts_rank_cd(vector, ts_query).desc()
+
+    return query.where(Task.title.contains(search_query) | Task.description.contains(search_query)), None
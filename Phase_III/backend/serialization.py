@@ -0,0 +1,69 @@
+from typing import List, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+from models import Task, Category, Tag, TaskResponse, CategoryResponse, TagResponse
+
+# Serializers compiled once at import; dumping never re-validates
+TASK_ADAPTER = TypeAdapter(TaskResponse)
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+
+
+class PrebuiltJSONResponse(Response):
+    """JSON response whose body is already encoded, so FastAPI skips response_model validation"""
+    media_type = "application/json"
+
+
+def category_to_response(category: Optional[Category]) -> Optional[CategoryResponse]:
+    """Build a CategoryResponse from a database row without re-validating it"""
+    if category is None:
+        return None
+    return CategoryResponse.model_construct(
+        id=category.id,
+        user_id=category.user_id,
+        name=category.name,
+        color=category.color,
+        created_at=category.created_at,
+        updated_at=category.updated_at
+    )
+
+
+def tag_to_response(tag: Tag) -> TagResponse:
+    """Build a TagResponse from a database row without re-validating it"""
+    return TagResponse.model_construct(
+        id=tag.id,
+        user_id=tag.user_id,
+        name=tag.name,
+        created_at=tag.created_at,
+        updated_at=tag.updated_at
+    )
+
+
+def task_to_response(task: Task) -> TaskResponse:
+    """
+    Build a TaskResponse (with category and tags) from a database row.
+    The row already satisfied the validators when it was written, so they are not run again.
+    """
+    return TaskResponse.model_construct(
+        id=task.id,
+        user_id=task.user_id,
+        title=task.title,
+        description=task.description,
+        completed=task.completed,
+        category_id=task.category_id,
+        due_date=task.due_date,
+        priority=task.priority,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        category=category_to_response(task.category),
+        tags=[tag_to_response(task_tag.tag) for task_tag in task.task_tags]
+    )
+
+
+def task_json(task: TaskResponse) -> bytes:
+    """Encode one task as JSON bytes"""
+    return TASK_ADAPTER.dump_json(task)
+
+
+def tasks_json(tasks: List[TaskResponse]) -> bytes:
+    """Encode a list of tasks as JSON bytes"""
+    return TASK_LIST_ADAPTER.dump_json(tasks)
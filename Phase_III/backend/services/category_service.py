@@ -2,6 +2,7 @@ from sqlmodel import Session, select
 from typing import List
 from models import Category, CategoryCreate, CategoryUpdate, CategoryResponse, User, Task
 from fastapi import HTTPException, status
+from response_cache import response_cache
 
 class CategoryService:
     def __init__(self, session: Session):
@@ -39,6 +40,7 @@ class CategoryService:
 
         self.session.add(category)
         self.session.commit()
+        response_cache.bump(user_id)
         self.session.refresh(category)
 
         return self._category_to_response(category)
@@ -80,6 +82,7 @@ class CategoryService:
 
         self.session.add(category)
         self.session.commit()
+        response_cache.bump(user_id)
         self.session.refresh(category)
 
         return self._category_to_response(category)
@@ -105,6 +108,7 @@ class CategoryService:
         # Now delete the category
         self.session.delete(category)
         self.session.commit()
+        response_cache.bump(user_id)
         return True
 
     def _category_to_response(self, category: Category) -> CategoryResponse:
@@ -3,6 +3,8 @@ from typing import List
 from datetime import datetime, timedelta
 from models import RecurringTask, RecurringTaskCreate, RecurringTaskUpdate, RecurringTaskResponse, Task, TaskTag
 from fastapi import HTTPException, status
+from fuzzy_search import title_index
+from response_cache import response_cache
 
 class RecurringTaskService:
     def __init__(self, session: Session):
@@ -26,8 +28,10 @@ class RecurringTaskService:
             end_date=recurring_data.end_date
         )
 
+        user_id = original_task.user_id
         self.session.add(recurring_task)
         self.session.commit()
+        response_cache.bump(user_id)
         self.session.refresh(recurring_task)
 
         return self._recurring_task_to_response(recurring_task)
@@ -88,6 +92,7 @@ class RecurringTaskService:
 
         self.session.add(recurring_task)
         self.session.commit()
+        response_cache.bump(user_id)
         self.session.refresh(recurring_task)
 
         return self._recurring_task_to_response(recurring_task)
@@ -111,6 +116,7 @@ class RecurringTaskService:
 
         self.session.delete(recurring_task)
         self.session.commit()
+        response_cache.bump(user_id)
         return True
 
     def generate_future_instances(self, recurring_task_id: int, count: int = 10) -> List[Task]:
@@ -176,6 +182,8 @@ class RecurringTaskService:
             self.session.commit()
             self.session.refresh(new_task)
 
+            title_index.put(new_task.user_id, new_task.id, new_task.title)
+            response_cache.bump(new_task.user_id)
             future_instances.append(new_task)
             current_date = new_task_date
 
@@ -2,6 +2,7 @@ from sqlmodel import Session, select
 from typing import List
 from models import Tag, TagCreate, TagUpdate, TagResponse, User, TaskTag
 from fastapi import HTTPException, status
+from response_cache import response_cache
 
 class TagService:
     def __init__(self, session: Session):
@@ -38,6 +39,7 @@ class TagService:
 
         self.session.add(tag)
         self.session.commit()
+        response_cache.bump(user_id)
         self.session.refresh(tag)
 
         return self._tag_to_response(tag)
@@ -91,6 +93,7 @@ class TagService:
 
         self.session.add(tag)
         self.session.commit()
+        response_cache.bump(user_id)
         self.session.refresh(tag)
 
         return self._tag_to_response(tag)
@@ -116,6 +119,7 @@ class TagService:
         # Now delete the tag
         self.session.delete(tag)
         self.session.commit()
+        response_cache.bump(user_id)
         return True
 
     def _tag_to_response(self, tag: Tag) -> TagResponse:
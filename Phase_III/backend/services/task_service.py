@@ -1,13 +1,70 @@
 from sqlmodel import Session, select, and_
+from sqlalchemy import delete, exists, func, insert
+from sqlalchemy.orm import joinedload, selectinload
 from typing import List, Optional
 from datetime import datetime
-from models import Task, TaskCreate, TaskUpdate, User, Category, Tag, TaskTag, TaskResponse
+from models import Task, TaskCreate, TaskUpdate, User, Category, Tag, TaskTag, TaskResponse, TaskMatch
 from fastapi import HTTPException, status
+from response_cache import response_cache
+from serialization import task_to_response
+from search_index import apply_text_search
+from fuzzy_search import fuzzy_title_search, title_index
+
+# Most tasks one bulk tag change may touch
+MAX_BULK_TASKS = 1000
+
+# Loader options for everything _task_to_response reads: the category is joined into the task query,
+# tag links and their tags come from one IN query each, however many tasks are returned
+TASK_RELATIONS = (
+    joinedload(Task.category),
+    selectinload(Task.task_tags).selectinload(TaskTag.tag),
+)
+
 
 class TaskService:
     def __init__(self, session: Session):
         self.session = session
 
+    def _load_task(self, user_id: int, task_id: int) -> Task:
+        """Load a user's task with its category and tags, refreshing any copy already in the session"""
+        task = self.session.exec(
+            select(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .options(*TASK_RELATIONS)
+            .execution_options(populate_existing=True)
+        ).first()
+        if not task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found or doesn't belong to user"
+            )
+        return task
+
+    def _verify_category(self, user_id: int, category_id: Optional[int]):
+        """Check that a category (if given) exists and belongs to the user"""
+        if category_id and not self.session.exec(
+            select(Category.id).where(Category.id == category_id, Category.user_id == user_id)
+        ).first():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found or doesn't belong to user"
+            )
+
+    def _verify_tags(self, user_id: int, tag_ids: List[int]) -> List[int]:
+        """Check with one query that every tag exists and belongs to the user; returns the ids without duplicates"""
+        tag_ids = list(dict.fromkeys(tag_ids))
+        if tag_ids:
+            owned = set(self.session.exec(
+                select(Tag.id).where(Tag.id.in_(tag_ids), Tag.user_id == user_id)
+            ).all())
+            missing = [tag_id for tag_id in tag_ids if tag_id not in owned]
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Tag with ID {missing[0]} not found or doesn't belong to user"
+                )
+        return tag_ids
+
     def create_task(self, user_id: int, task_data: TaskCreate, tag_ids: Optional[List[int]] = None) -> TaskResponse:
         """Create a new task for a user"""
         # Verify user exists
@@ -18,24 +75,9 @@ class TaskService:
                 detail="User not found"
             )
 
-        # Verify category exists and belongs to user (if provided)
-        if task_data.category_id:
-            category = self.session.get(Category, task_data.category_id)
-            if not category or category.user_id != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Category not found or doesn't belong to user"
-                )
-
-        # Verify tag IDs belong to user (if provided)
-        if tag_ids:
-            for tag_id in tag_ids:
-                tag = self.session.get(Tag, tag_id)
-                if not tag or tag.user_id != user_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Tag with ID {tag_id} not found or doesn't belong to user"
-                    )
+        # Verify category and tags belong to user: one query per entity type
+        self._verify_category(user_id, task_data.category_id)
+        tag_ids = self._verify_tags(user_id, tag_ids or [])
 
         # Create the task
         task = Task(
@@ -47,19 +89,17 @@ class TaskService:
             due_date=task_data.due_date,
             priority=task_data.priority
         )
+        # Tag links go out in the same flush as the task, which fills in their task_id
+        task.task_tags = [TaskTag(tag_id=tag_id) for tag_id in tag_ids]
 
         self.session.add(task)
+        self.session.flush()
+        task_id = task.id  # read before commit expires it
         self.session.commit()
-        self.session.refresh(task)
+        response_cache.bump(user_id)
+        title_index.put(user_id, task_id, task_data.title)
 
-        # Add tags to the task if provided
-        if tag_ids:
-            for tag_id in tag_ids:
-                task_tag = TaskTag(task_id=task.id, tag_id=tag_id)
-                self.session.add(task_tag)
-            self.session.commit()
-
-        return self._task_to_response(task)
+        return self._task_to_response(self._load_task(user_id, task_id))
 
     def get_tasks(
         self,
@@ -67,6 +107,7 @@ class TaskService:
         status_filter: Optional[str] = None,
         category_id: Optional[int] = None,
         tag_ids: Optional[List[int]] = None,
+        tag_match: str = "all",
         due_date_start: Optional[datetime] = None,
         due_date_end: Optional[datetime] = None,
         priority: Optional[str] = None,
@@ -74,28 +115,15 @@ class TaskService:
         offset: Optional[int] = None
     ) -> List[TaskResponse]:
         """Get tasks for a user with optional filters"""
-        query = select(Task).where(Task.user_id == user_id)
+        query = select(Task).where(Task.user_id == user_id).options(*TASK_RELATIONS)
 
-        # Apply filters
-        if status_filter:
-            if status_filter == "pending":
-                query = query.where(Task.completed == False)
-            elif status_filter == "completed":
-                query = query.where(Task.completed == True)
-
-        if category_id:
-            query = query.where(Task.category_id == category_id)
-
-        if due_date_start:
-            query = query.where(Task.due_date >= due_date_start)
-        if due_date_end:
-            query = query.where(Task.due_date <= due_date_end)
-
-        if priority:
-            query = query.where(Task.priority == priority)
+        # Apply filters (tags included, so LIMIT/OFFSET count only matching tasks)
+        query = self._apply_filters(
+            query, status_filter, category_id, tag_ids, tag_match, due_date_start, due_date_end, priority
+        )
 
-        # Apply sorting (default to created_at descending)
-        query = query.order_by(Task.created_at.desc())
+        # Apply sorting (default to created_at descending, id breaks ties so pages never overlap)
+        query = query.order_by(Task.created_at.desc(), Task.id.desc())
 
         # Apply limit and offset for pagination
         if limit:
@@ -105,27 +133,11 @@ class TaskService:
 
         tasks = self.session.exec(query).all()
 
-        # Filter by tags if specified (requires additional processing)
-        if tag_ids:
-            filtered_tasks = []
-            for task in tasks:
-                task_tag_ids = [tt.tag_id for tt in task.task_tags]
-                if all(tag_id in task_tag_ids for tag_id in tag_ids):
-                    filtered_tasks.append(task)
-            tasks = filtered_tasks
-
         return [self._task_to_response(task) for task in tasks]
 
     def get_task(self, user_id: int, task_id: int) -> TaskResponse:
         """Get a specific task for a user"""
-        task = self.session.get(Task, task_id)
-        if not task or task.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found or doesn't belong to user"
-            )
-
-        return self._task_to_response(task)
+        return self._task_to_response(self._load_task(user_id, task_id))
 
     def update_task(self, user_id: int, task_id: int, task_data: TaskUpdate, tag_ids: Optional[List[int]] = None) -> TaskResponse:
         """Update a specific task for a user"""
@@ -136,26 +148,16 @@ class TaskService:
                 detail="Task not found or doesn't belong to user"
             )
 
-        # Verify category exists and belongs to user (if provided)
+        # Verify category and tags belong to user (if provided): one query per entity type
         if task_data.category_id is not None:
-            if task_data.category_id:
-                category = self.session.get(Category, task_data.category_id)
-                if not category or category.user_id != user_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail="Category not found or doesn't belong to user"
-                    )
+            self._verify_category(user_id, task_data.category_id)
             task.category_id = task_data.category_id
 
-        # Verify tag IDs belong to user (if provided)
-        if tag_ids:
-            for tag_id in tag_ids:
-                tag = self.session.get(Tag, tag_id)
-                if not tag or tag.user_id != user_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Tag with ID {tag_id} not found or doesn't belong to user"
-                    )
+        if tag_ids is not None:
+            tag_ids = self._verify_tags(user_id, tag_ids)
+            # Replace the tag links: one DELETE now, the new links are inserted with the task update
+            self.session.exec(delete(TaskTag).where(TaskTag.task_id == task_id))
+            self.session.add_all(TaskTag(task_id=task_id, tag_id=tag_id) for tag_id in tag_ids)
 
         # Update other fields if provided
         if task_data.title is not None:
@@ -169,28 +171,14 @@ class TaskService:
         if task_data.priority is not None:
             task.priority = task_data.priority
 
+        # Task changes and tag links are written in one flush and one commit
         self.session.add(task)
         self.session.commit()
+        response_cache.bump(user_id)
+        if task_data.title is not None:
+            title_index.put(user_id, task_id, task_data.title)
 
-        # Update tags if provided
-        if tag_ids is not None:
-            # Remove existing tags
-            existing_task_tags = self.session.exec(
-                select(TaskTag).where(TaskTag.task_id == task_id)
-            ).all()
-            for task_tag in existing_task_tags:
-                self.session.delete(task_tag)
-
-            # Add new tags
-            for tag_id in tag_ids:
-                task_tag = TaskTag(task_id=task.id, tag_id=tag_id)
-                self.session.add(task_tag)
-
-            self.session.commit()
-
-        self.session.refresh(task)
-
-        return self._task_to_response(task)
+        return self._task_to_response(self._load_task(user_id, task_id))
 
     def delete_task(self, user_id: int, task_id: int) -> bool:
         """Delete a specific task for a user"""
@@ -203,6 +191,8 @@ class TaskService:
 
         self.session.delete(task)
         self.session.commit()
+        response_cache.bump(user_id)
+        title_index.discard(user_id, task_id)
         return True
 
     def toggle_task_completion(self, user_id: int, task_id: int) -> TaskResponse:
@@ -217,111 +207,188 @@ class TaskService:
         task.completed = not task.completed
         self.session.add(task)
         self.session.commit()
-        self.session.refresh(task)
-
-        return self._task_to_response(task)
+        response_cache.bump(user_id)
+        return self._task_to_response(self._load_task(user_id, task_id))
+
+    def find_tasks_by_title(self, user_id: int, query: str, limit: int = 5) -> List[TaskMatch]:
+        """Find a user's tasks by approximate title (typos allowed), best match first"""
+        matches = fuzzy_title_search(self.session, user_id, query, limit)
+        if not matches:
+            return []
+        # The trigram index only ranks ids; titles and status come fresh from the database,
+        # which also drops tasks deleted since the in-process index was built
+        rows = {
+            row.id: row for row in self.session.exec(
+                select(Task.id, Task.title, Task.completed)
+                .where(Task.user_id == user_id, Task.id.in_([task_id for task_id, _ in matches]))
+            ).all()
+        }
+        return [
+            TaskMatch(id=task_id, title=rows[task_id].title, completed=rows[task_id].completed, score=round(score, 3))
+            for task_id, score in matches if task_id in rows
+        ]
 
     def _task_to_response(self, task: Task) -> TaskResponse:
         """Convert Task model to TaskResponse with related data"""
-        # Get the category if it exists
-        category_response = None
-        if task.category:
-            category_response = {
-                "id": task.category.id,
-                "user_id": task.category.user_id,
-                "name": task.category.name,
-                "color": task.category.color,
-                "created_at": task.category.created_at,
-                "updated_at": task.category.updated_at
-            }
-
-        # Get the tags if they exist
-        tag_responses = []
-        for task_tag in task.task_tags:
-            tag_responses.append({
-                "id": task_tag.tag.id,
-                "user_id": task_tag.tag.user_id,
-                "name": task_tag.tag.name,
-                "created_at": task_tag.tag.created_at,
-                "updated_at": task_tag.tag.updated_at
-            })
-
-        return TaskResponse(
-            id=task.id,
-            user_id=task.user_id,
-            title=task.title,
-            description=task.description,
-            completed=task.completed,
-            category_id=task.category_id,
-            due_date=task.due_date,
-            priority=task.priority,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            category=category_response,
-            tags=tag_responses
-        )
+        return task_to_response(task)
 
     def add_tags_to_task(self, user_id: int, task_id: int, tag_ids: List[int]) -> TaskResponse:
-        """Add tags to a specific task"""
-        # Verify task exists and belongs to user
-        task = self.session.get(Task, task_id)
-        if not task or task.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found or doesn't belong to user"
-            )
+        """Add tags to a specific task (tags it already has are left as they are)"""
+        self._verify_tasks(user_id, [task_id])
+        tag_ids = self._verify_tags(user_id, tag_ids)
 
-        # Verify all tag IDs belong to user
-        for tag_id in tag_ids:
-            tag = self.session.get(Tag, tag_id)
-            if not tag or tag.user_id != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Tag with ID {tag_id} not found or doesn't belong to user"
-                )
-
-        # Add tags that aren't already associated with the task
-        for tag_id in tag_ids:
-            existing_task_tag = self.session.exec(
-                select(TaskTag)
-                .where(TaskTag.task_id == task_id)
-                .where(TaskTag.tag_id == tag_id)
-            ).first()
+        self._insert_links([task_id], tag_ids)
+        self.session.commit()
+        response_cache.bump(user_id)
+        return self._task_to_response(self._load_task(user_id, task_id))
 
-            if not existing_task_tag:
-                task_tag = TaskTag(task_id=task_id, tag_id=tag_id)
-                self.session.add(task_tag)
+    def remove_tags_from_task(self, user_id: int, task_id: int, tag_ids: List[int]) -> TaskResponse:
+        """Remove tags from a specific task"""
+        self._verify_tasks(user_id, [task_id])
 
+        self._delete_links([task_id], tag_ids)
         self.session.commit()
-        self.session.refresh(task)
+        response_cache.bump(user_id)
+        return self._task_to_response(self._load_task(user_id, task_id))
 
-        return self._task_to_response(task)
+    def bulk_update_task_tags(
+        self,
+        user_id: int,
+        task_ids: List[int],
+        add_tag_ids: Optional[List[int]] = None,
+        remove_tag_ids: Optional[List[int]] = None
+    ) -> dict:
+        """Add and/or remove tags on many tasks in one transaction"""
+        task_ids = list(dict.fromkeys(task_ids))
+        add_tag_ids = list(dict.fromkeys(add_tag_ids or []))
+        remove_tag_ids = list(dict.fromkeys(remove_tag_ids or []))
+        if not task_ids or not (add_tag_ids or remove_tag_ids):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Give task IDs and at least one tag ID to add or remove"
+            )
+        if len(task_ids) > MAX_BULK_TASKS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_BULK_TASKS} tasks per request"
+            )
+        if set(add_tag_ids) & set(remove_tag_ids):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A tag cannot be both added and removed"
+            )
 
-    def remove_tags_from_task(self, user_id: int, task_id: int, tag_ids: List[int]) -> TaskResponse:
-        """Remove tags from a specific task"""
-        # Verify task exists and belongs to user
-        task = self.session.get(Task, task_id)
-        if not task or task.user_id != user_id:
+        self._verify_tasks(user_id, task_ids)
+        self._verify_tags(user_id, add_tag_ids)
+
+        removed = self._delete_links(task_ids, remove_tag_ids)
+        added = self._insert_links(task_ids, add_tag_ids)
+        self.session.commit()
+        response_cache.bump(user_id)
+        return {"tasks": len(task_ids), "added": added, "removed": removed}
+
+    def _verify_tasks(self, user_id: int, task_ids: List[int]):
+        """Check with one query that every task exists and belongs to the user"""
+        owned = set(self.session.exec(
+            select(Task.id).where(Task.id.in_(task_ids), Task.user_id == user_id)
+        ).all())
+        if len(owned) < len(set(task_ids)):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Task not found or doesn't belong to user"
             )
 
-        # Remove specified tags
-        for tag_id in tag_ids:
-            task_tag = self.session.exec(
-                select(TaskTag)
-                .where(TaskTag.task_id == task_id)
-                .where(TaskTag.tag_id == tag_id)
-            ).first()
+    def _insert_links(self, task_ids: List[int], tag_ids: List[int]) -> int:
+        """Link every task to every tag, skipping links that already exist; returns the count of new links"""
+        if not tag_ids:
+            return 0
+        links = [{"task_id": task_id, "tag_id": tag_id} for task_id in task_ids for tag_id in tag_ids]
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            # No ON CONFLICT: read the existing links with one query and insert the rest
+            existing = {
+                (task_id, tag_id) for task_id, tag_id in self.session.exec(
+                    select(TaskTag.task_id, TaskTag.tag_id)
+                    .where(TaskTag.task_id.in_(task_ids), TaskTag.tag_id.in_(tag_ids))
+                ).all()
+            }
+            links = [link for link in links if (link["task_id"], link["tag_id"]) not in existing]
+            if links:
+                self.session.exec(insert(TaskTag.__table__), params=links)
+            return len(links)
+        statement = dialect_insert(TaskTag.__table__).on_conflict_do_nothing(index_elements=["task_id", "tag_id"])
+        # executemany of one prepared statement; existing links are skipped by the database
+        return self.session.exec(statement, params=links).rowcount
+
+    def _delete_links(self, task_ids: List[int], tag_ids: List[int]) -> int:
+        """Unlink tags from tasks with one DELETE; returns the number of removed links"""
+        if not tag_ids:
+            return 0
+        return self.session.exec(
+            delete(TaskTag)
+            .where(TaskTag.task_id.in_(task_ids), TaskTag.tag_id.in_(tag_ids))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    def _apply_filters(
+        self,
+        query,
+        status_filter: Optional[str],
+        category_id: Optional[int],
+        tag_ids: Optional[List[int]],
+        tag_match: str,
+        due_date_start: Optional[datetime],
+        due_date_end: Optional[datetime],
+        priority: Optional[str]
+    ):
+        """Apply the listing/search filters to a task query"""
+        if status_filter:
+            if status_filter == "pending":
+                query = query.where(Task.completed == False)
+            elif status_filter == "completed":
+                query = query.where(Task.completed == True)
+
+        if category_id:
+            query = query.where(Task.category_id == category_id)
 
-            if task_tag:
-                self.session.delete(task_tag)
+        if tag_ids:
+            query = query.where(self._tag_filter(tag_ids, tag_match))
 
-        self.session.commit()
-        self.session.refresh(task)
+        if due_date_start:
+            query = query.where(Task.due_date >= due_date_start)
+        if due_date_end:
+            query = query.where(Task.due_date <= due_date_end)
 
-        return self._task_to_response(task)
+        if priority:
+            query = query.where(Task.priority == priority)
+        return query
+
+    def _tag_filter(self, tag_ids: List[int], tag_match: str = "all"):
+        """
+        WHERE clause for tasks carrying all (default) or any of the given tags.
+        Both are answered from the tasktag (tag_id, task_id) index without loading any tags.
+        """
+        tag_ids = sorted(set(tag_ids))
+        if tag_match == "any":
+            return exists().where(TaskTag.task_id == Task.id, TaskTag.tag_id.in_(tag_ids))
+        if tag_match != "all":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="tag_match must be 'all' or 'any'"
+            )
+        if len(tag_ids) == 1:
+            return exists().where(TaskTag.task_id == Task.id, TaskTag.tag_id == tag_ids[0])
+        matching = (
+            select(TaskTag.task_id)
+            .where(TaskTag.tag_id.in_(tag_ids))
+            .group_by(TaskTag.task_id)
+            .having(func.count() == len(tag_ids))
+        )
+        return Task.id.in_(matching)
 
     def search_tasks(
         self,
@@ -330,6 +397,7 @@ class TaskService:
         status_filter: Optional[str] = None,
         category_id: Optional[int] = None,
         tag_ids: Optional[List[int]] = None,
+        tag_match: str = "all",
         due_date_start: Optional[datetime] = None,
         due_date_end: Optional[datetime] = None,
         priority: Optional[str] = None,
@@ -340,35 +408,22 @@ class TaskService:
     ) -> List[TaskResponse]:
         """Search and filter tasks with advanced options"""
         # Start with base query that joins with TaskTag for tag filtering
-        query = select(Task).where(Task.user_id == user_id)
+        query = select(Task).where(Task.user_id == user_id).options(*TASK_RELATIONS)
 
-        # Apply text search if query provided
+        # Apply text search through the full-text index if query provided
+        relevance = None
         if search_query:
-            query = query.where(
-                Task.title.contains(search_query) |
-                Task.description.contains(search_query)
-            )
+            query, relevance = apply_text_search(query, self.session.get_bind().dialect.name, search_query)
 
-        # Apply filters
-        if status_filter:
-            if status_filter == "pending":
-                query = query.where(Task.completed == False)
-            elif status_filter == "completed":
-                query = query.where(Task.completed == True)
-
-        if category_id:
-            query = query.where(Task.category_id == category_id)
-
-        if due_date_start:
-            query = query.where(Task.due_date >= due_date_start)
-        if due_date_end:
-            query = query.where(Task.due_date <= due_date_end)
-
-        if priority:
-            query = query.where(Task.priority == priority)
+        # Apply filters (tags included, so LIMIT/OFFSET count only matching tasks)
+        query = self._apply_filters(
+            query, status_filter, category_id, tag_ids, tag_match, due_date_start, due_date_end, priority
+        )
 
-        # Apply sorting
-        if sort_by == "title":
+        # Apply sorting (by relevance when searching, unless another field is requested)
+        if relevance is not None and sort_by in (None, "relevance"):
+            query = query.order_by(relevance)
+        elif sort_by == "title":
             if sort_order == "desc":
                 query = query.order_by(Task.title.desc())
             else:
@@ -389,19 +444,13 @@ class TaskService:
             else:
                 query = query.order_by(Task.created_at.asc())
 
+        # Tie-breaker so pages never overlap or skip tasks with equal sort keys
+        query = query.order_by(Task.id)
+
         # Apply limit and offset for pagination
         query = query.limit(limit).offset(offset)
 
         # Execute the query
         tasks = self.session.exec(query).all()
 
-        # Filter by tags if specified (requires additional processing)
-        if tag_ids:
-            filtered_tasks = []
-            for task in tasks:
-                task_tag_ids = [tt.tag_id for tt in task.task_tags]
-                if all(tag_id in task_tag_ids for tag_id in tag_ids):
-                    filtered_tasks.append(task)
-            tasks = filtered_tasks
-
         return [self._task_to_response(task) for task in tasks]
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Unit tests for the in-process trigram title index (no database needed).
+
+Run from the Phase_III/backend directory:
+    python test_fuzzy_search.py
+"""
+import threading
+import time
+
+from fuzzy_search import TitleIndex, UserTitleIndex, trigrams
+
+ROWS = [(1, "Buy groceries"), (2, "Call the dentist"), (3, "Grocery list for party"), (4, "Fix the car")]
+NO_DEADLINE = float("inf")
+
+
+def search(index: UserTitleIndex, query: str, limit: int = 5, min_score: float = 0.4):
+    return [task_id for task_id, _ in index.search(query, limit, min_score, NO_DEADLINE)]
+
+
+def test_trigrams_match_pg_trgm():
+    """Words are lowercased and padded with two spaces before and one after"""
+    assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+    assert trigrams("a-b") == {"  a", " a ", "  b", " b "}
+    assert trigrams("?!") == set()
+    print("✓ trigrams")
+
+
+def test_search_ranks_typos():
+    """Misspelled queries find the intended titles, best match first, within the limit"""
+    index = UserTitleIndex(ROWS)
+    assert search(index, "grocry") == [3, 1]
+    assert search(index, "grocry", limit=1) == [3]
+    assert search(index, "dentsit") == [2]
+    assert search(index, "zebra") == []
+    assert search(index, "*(") == []
+    scores = dict(index.search("fix the car", 5, 0.4, NO_DEADLINE))
+    assert scores[4] == 1.0
+    print("✓ typo ranking")
+
+
+def test_search_after_deadline_still_ranks():
+    """A spent budget stops counting after the rarest trigram instead of returning nothing"""
+    index = UserTitleIndex(ROWS)
+    assert search(index, "dentist") == [2]
+    assert [task_id for task_id, _ in index.search("dentist", 5, 0.1, deadline=0)] == [2]
+    print("✓ search budget")
+
+
+def test_put_and_discard():
+    """Renames replace a task's trigrams and removals leave no empty posting lists"""
+    index = UserTitleIndex(ROWS)
+    index.put(1, "Renew passport")
+    assert search(index, "grocry") == [3]
+    assert search(index, "pasport") == [1]
+    index.discard(1)
+    index.discard(1)
+    assert search(index, "pasport") == []
+    assert 1 not in index.grams and all(index.postings.values())
+    print("✓ put/discard")
+
+
+def test_writes_during_rebuild_are_replayed():
+    """A put or discard landing while the index is rebuilt is applied to the new index"""
+    titles = TitleIndex()
+
+    def load():
+        # Another request writes while this rebuild is reading the user's tasks
+        titles.put(7, 5, "Walk the dog")
+        titles.discard(7, 2)
+        return list(ROWS)
+
+    assert titles.search(7, load, "dog walk", 5, 0.4, 50) and titles.search(7, load, "dog", 5, 0.4, 50)[0][0] == 5
+    assert titles.search(7, load, "dentist", 5, 0.4, 50) == []
+    assert not titles._journals
+    print("✓ rebuild journal")
+
+
+def test_writes_without_index_are_ignored():
+    """Users without an index are built from the database on their first search"""
+    titles = TitleIndex()
+    titles.put(8, 9, "Unseen task")
+    assert titles.search(8, lambda: ROWS, "unseen", 5, 0.4, 50) == []
+    titles.put(8, 9, "Unseen task")
+    assert titles.search(8, lambda: ROWS, "unseen", 5, 0.4, 50)[0][0] == 9
+    print("✓ writes before first search")
+
+
+def test_ttl_and_user_eviction():
+    """Indexes are rebuilt after the TTL and the least recently searched users are dropped"""
+    loads = []
+
+    def load():
+        loads.append(1)
+        return ROWS
+
+    titles = TitleIndex(ttl_seconds=60, max_users=2)
+    for user_id in (1, 2, 1, 3):
+        titles.search(user_id, load, "grocry", 5, 0.4, 50)
+    assert len(loads) == 3 and list(titles._users) == [1, 3]
+
+    expiring = TitleIndex(ttl_seconds=0)
+    expiring.search(1, load, "grocry", 5, 0.4, 50)
+    expiring.search(1, load, "grocry", 5, 0.4, 50)
+    assert len(loads) == 5
+    print("✓ TTL and eviction")
+
+
+def test_users_do_not_wait_on_each_other():
+    """A search for one user proceeds while another user's index is locked"""
+    titles = TitleIndex()
+    titles.search(1, lambda: ROWS, "grocry", 5, 0.4, 50)
+    titles.search(2, lambda: ROWS, "grocry", 5, 0.4, 50)
+    results = []
+    with titles._users[1].lock:
+        worker = threading.Thread(target=lambda: results.append(titles.search(2, lambda: ROWS, "grocry", 5, 0.4, 50)))
+        started = time.perf_counter()
+        worker.start()
+        worker.join(timeout=2)
+        assert results and time.perf_counter() - started < 2, "user 2 waited on user 1's index"
+    print("✓ per-user locking")
+
+
+if __name__ == "__main__":
+    test_trigrams_match_pg_trgm()
+    test_search_ranks_typos()
+    test_search_after_deadline_still_ranks()
+    test_put_and_discard()
+    test_writes_during_rebuild_are_replayed()
+    test_writes_without_index_are_ignored()
+    test_ttl_and_user_eviction()
+    test_users_do_not_wait_on_each_other()
+    print("\nAll fuzzy search tests passed!")
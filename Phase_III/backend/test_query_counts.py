@@ -0,0 +1,110 @@
+"""
+Query-count regression tests for the Phase III TaskService.
+
+Listing, search, single-task reads and tag mutations must load categories
+and tags in a fixed number of statements, whatever the number of tasks
+(or tags per task) in the result.
+
+Run from the Phase_III/backend directory:
+    python test_query_counts.py
+"""
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from models import Category, Tag, Task, TaskTag, User
+from search_index import create_search_index
+from services.task_service import TaskService
+
+# Most statements one call may issue
+QUERY_BUDGETS = {
+    "get_tasks": 3,          # tasks joined with categories, tag links, tags
+    "search_tasks": 3,
+    "get_task": 3,
+    "add_tags_to_task": 6,      # task check, tag check, INSERT ... ON CONFLICT, reload (3)
+    "remove_tags_from_task": 5, # task check, DELETE, reload (3)
+}
+
+
+def make_database(task_count: int, tags_per_task: int = 3):
+    """In-memory database with one user owning `task_count` tasks, each with a category and tags"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        create_search_index(connection)
+    with Session(engine) as session:
+        user = User(email="counts@example.com", name="Counts", password_hash="x")
+        session.add(user)
+        session.commit()
+        categories = [Category(user_id=user.id, name=f"Category {i}") for i in range(3)]
+        tags = [Tag(user_id=user.id, name=f"tag-{i}") for i in range(max(tags_per_task, 1) + 1)]
+        session.add_all(categories + tags)
+        session.commit()
+        for i in range(task_count):
+            task = Task(user_id=user.id, title=f"Task {i}", description="searchable",
+                        category_id=categories[i % 3].id)
+            session.add(task)
+            session.flush()
+            session.add_all(TaskTag(task_id=task.id, tag_id=tag.id) for tag in tags[:tags_per_task])
+        session.commit()
+        user_id, spare_tag_id = user.id, tags[-1].id
+    return engine, user_id, spare_tag_id
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect the statements sent to the database inside the block"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def queries_for(name: str, task_count: int, tags_per_task: int = 3) -> int:
+    """Statements issued by one TaskService call on a fresh session"""
+    engine, user_id, spare_tag_id = make_database(task_count, tags_per_task)
+    with Session(engine) as session:
+        service = TaskService(session)
+        calls = {
+            "get_tasks": lambda: service.get_tasks(user_id, limit=1000),
+            "search_tasks": lambda: service.search_tasks(user_id, search_query="searchable", limit=1000),
+            "get_task": lambda: service.get_task(user_id, 1),
+            "add_tags_to_task": lambda: service.add_tags_to_task(user_id, 1, [spare_tag_id]),
+            "remove_tags_from_task": lambda: service.remove_tags_from_task(user_id, 1, [spare_tag_id - 1]),
+        }
+        with count_queries(engine) as statements:
+            result = calls[name]()
+    if isinstance(result, list):
+        assert len(result) == task_count, f"{name} returned {len(result)} of {task_count} tasks"
+    return len(statements)
+
+
+def assert_constant(name: str, small: int, large: int):
+    assert small == large, f"{name}: {small} queries for the small case but {large} for the large one (N+1)"
+    assert large <= QUERY_BUDGETS[name], f"{name}: {large} queries, budget is {QUERY_BUDGETS[name]}"
+    print(f"✓ {name}: {large} queries")
+
+
+def test_listing_query_counts():
+    """get_tasks and search_tasks cost the same number of queries for 5 or 300 tasks"""
+    for name in ("get_tasks", "search_tasks"):
+        assert_constant(name, queries_for(name, 5), queries_for(name, 300))
+
+
+def test_single_task_query_counts():
+    """get_task and the tag mutations do not load tags one by one"""
+    for name in ("get_task", "add_tags_to_task", "remove_tags_from_task"):
+        assert_constant(name, queries_for(name, 3, tags_per_task=2), queries_for(name, 3, tags_per_task=25))
+
+
+if __name__ == "__main__":
+    test_listing_query_counts()
+    test_single_task_query_counts()
+    print("\nAll query-count tests passed!")
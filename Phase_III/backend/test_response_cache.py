@@ -0,0 +1,175 @@
+"""
+Unit tests for the Phase III task listing/search response cache.
+
+The cache itself is pure Python; the last test runs every service write
+against an in-memory database to check each one moves the user's data
+version.
+
+Run from the Phase_III/backend directory:
+    python test_response_cache.py
+"""
+import time
+from datetime import datetime
+
+from sqlmodel import Session
+
+from models import (CategoryCreate, CategoryUpdate, PriorityEnum, RecurrencePatternEnum, RecurringTaskCreate,
+                    RecurringTaskUpdate, TagCreate, TagUpdate, TaskCreate, TaskUpdate)
+from response_cache import ENTRY_OVERHEAD_BYTES, ResponseCache, normalize_params, response_cache
+from services.category_service import CategoryService
+from services.recurring_service import RecurringTaskService
+from services.tag_service import TagService
+from services.task_service import TaskService
+from test_query_counts import make_database
+
+
+def body(text: str):
+    """A build callback returning `text` and counting how often it ran"""
+    def build():
+        build.calls += 1
+        return text.encode()
+    build.calls = 0
+    return build
+
+
+def test_normalize_params_equivalence():
+    """Filter sets that select the same tasks share one key"""
+    due = datetime(2026, 1, 2, 3, 4, 5)
+    assert normalize_params({"tag_ids": [3, 1, 3], "limit": 10, "priority": None}) == \
+        normalize_params({"limit": 10, "tag_ids": (1, 3)})
+    assert normalize_params({"priority": PriorityEnum.high, "due_before": due}) == \
+        (("due_before", "2026-01-02T03:04:05"), ("priority", "high"))
+    assert normalize_params({"limit": 10}) != normalize_params({"limit": 20})
+    assert normalize_params({}) == normalize_params({"category_id": None}) == ()
+    print("✓ normalize_params")
+
+
+def test_hits_and_bump():
+    """Repeated requests are served from the cache until the user's data changes"""
+    cache = ResponseCache(max_bytes=10_000)
+    build = body("[1]")
+    assert cache.get_or_build(1, "tasks", {"limit": 10}, build) == b"[1]"
+    assert cache.get_or_build(1, "tasks", {"limit": 10, "category_id": None}, build) == b"[1]"
+    other = body("[2]")
+    cache.get_or_build(2, "tasks", {"limit": 10}, other)
+    assert build.calls == 1 and other.calls == 1
+
+    cache.bump(1)
+    cache.get_or_build(1, "tasks", {"limit": 10}, build)
+    cache.get_or_build(2, "tasks", {"limit": 10}, other)
+    assert build.calls == 2 and other.calls == 1, "a bump only drops the written user's entries"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"], stats["entries"]) == (2, 3, 1, 2)
+    print("✓ hits and version bump")
+
+
+def test_body_built_across_bump_is_not_stored():
+    """A body whose build overlapped a write is returned but never served again"""
+    cache = ResponseCache(max_bytes=10_000)
+
+    def build():
+        build.calls += 1
+        cache.bump(1)  # a write commits while the response is being built
+        return b"stale"
+    build.calls = 0
+
+    assert cache.get_or_build(1, "tasks", {}, build) == b"stale"
+    assert cache.stats()["entries"] == 0
+    fresh = body("fresh")
+    assert cache.get_or_build(1, "tasks", {}, fresh) == b"fresh"
+    assert cache.get_or_build(1, "tasks", {}, fresh) == b"fresh" and fresh.calls == 1
+    print("✓ no stale stores")
+
+
+def test_lru_eviction_by_bytes():
+    """Least recently used bodies are dropped once the byte budget is exceeded"""
+    size = 100 + ENTRY_OVERHEAD_BYTES
+    cache = ResponseCache(max_bytes=2 * size)
+    builds = {name: body(name * 100) for name in "abc"}
+    cache.get_or_build(1, "tasks", {"q": "a"}, builds["a"])
+    cache.get_or_build(1, "tasks", {"q": "b"}, builds["b"])
+    cache.get_or_build(1, "tasks", {"q": "a"}, builds["a"])  # "b" is now least recently used
+    cache.get_or_build(1, "tasks", {"q": "c"}, builds["c"])
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 2 * size, 1)
+
+    cache.get_or_build(1, "tasks", {"q": "a"}, builds["a"])
+    cache.get_or_build(1, "tasks", {"q": "b"}, builds["b"])
+    assert builds["a"].calls == 1 and builds["b"].calls == 2
+
+    huge = body("x" * (3 * size))
+    cache.get_or_build(1, "tasks", {"q": "huge"}, huge)
+    assert cache.stats()["bytes"] <= cache.max_bytes, "bodies larger than the budget are not stored"
+    print("✓ LRU eviction")
+
+
+def test_ttl_expiry():
+    """Entries older than the TTL are rebuilt"""
+    cache = ResponseCache(max_bytes=10_000, ttl_seconds=0.05)
+    build = body("[1]")
+    cache.get_or_build(1, "tasks", {}, build)
+    cache.get_or_build(1, "tasks", {}, build)
+    assert build.calls == 1
+    time.sleep(0.06)
+    cache.get_or_build(1, "tasks", {}, build)
+    assert build.calls == 2 and cache.stats()["expirations"] == 1
+    print("✓ TTL expiry")
+
+
+def test_disabled_cache_always_builds():
+    """max_bytes=0 turns the cache off"""
+    cache = ResponseCache(max_bytes=0)
+    build = body("[1]")
+    cache.get_or_build(1, "tasks", {}, build)
+    cache.get_or_build(1, "tasks", {}, build)
+    assert build.calls == 2 and not cache.stats()["enabled"]
+    print("✓ disabled cache")
+
+
+def test_every_service_write_bumps_version():
+    """Each task, tag, category and recurring-task write moves the user to a new data version"""
+    engine, user_id, spare_tag_id = make_database(task_count=2, tags_per_task=1)
+    with Session(engine) as session:
+        tasks, tags = TaskService(session), TagService(session)
+        categories, recurring = CategoryService(session), RecurringTaskService(session)
+        state = {}
+        writes = [
+            ("create_task", lambda: state.update(task=tasks.create_task(user_id, TaskCreate(title="New")).id)),
+            ("update_task", lambda: tasks.update_task(user_id, state["task"], TaskUpdate(title="Renamed"))),
+            ("toggle_task_completion", lambda: tasks.toggle_task_completion(user_id, state["task"])),
+            ("add_tags_to_task", lambda: tasks.add_tags_to_task(user_id, state["task"], [spare_tag_id])),
+            ("remove_tags_from_task", lambda: tasks.remove_tags_from_task(user_id, state["task"], [spare_tag_id])),
+            ("bulk_update_task_tags", lambda: tasks.bulk_update_task_tags(user_id, [1, 2], [spare_tag_id])),
+            ("create_tag", lambda: state.update(tag=tags.create_tag(user_id, TagCreate(name="fresh")).id)),
+            ("update_tag", lambda: tags.update_tag(user_id, state["tag"], TagUpdate(name="renamed"))),
+            ("delete_tag", lambda: tags.delete_tag(user_id, state["tag"])),
+            ("create_category", lambda: state.update(
+                category=categories.create_category(user_id, CategoryCreate(name="Fresh")).id)),
+            ("update_category", lambda: categories.update_category(user_id, state["category"],
+                                                                   CategoryUpdate(name="Renamed"))),
+            ("delete_category", lambda: categories.delete_category(user_id, state["category"])),
+            ("create_recurring_task", lambda: state.update(recurring=recurring.create_recurring_task(
+                RecurringTaskCreate(original_task_id=state["task"],
+                                    recurrence_pattern=RecurrencePatternEnum.daily)).id)),
+            ("update_recurring_task", lambda: recurring.update_recurring_task(
+                user_id, state["recurring"], RecurringTaskUpdate(interval=2))),
+            ("generate_future_instances", lambda: recurring.generate_future_instances(state["recurring"], 1)),
+            ("delete_recurring_task", lambda: recurring.delete_recurring_task(user_id, state["recurring"])),
+            ("delete_task", lambda: tasks.delete_task(user_id, state["task"])),
+        ]
+        for name, write in writes:
+            before = response_cache._versions[user_id]
+            write()
+            assert response_cache._versions[user_id] > before, f"{name} did not bump the response cache"
+    print(f"✓ {len(writes)} service writes bump the data version")
+
+
+if __name__ == "__main__":
+    test_normalize_params_equivalence()
+    test_hits_and_bump()
+    test_body_built_across_bump_is_not_stored()
+    test_lru_eviction_by_bytes()
+    test_ttl_expiry()
+    test_disabled_cache_always_builds()
+    test_every_service_write_bumps_version()
+    print("\nAll response cache tests passed!")
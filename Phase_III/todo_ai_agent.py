@@ -42,6 +42,22 @@ class TodoAIChatbot:
                     }
                 }
             },
+            {
+                "type": "function",
+                "function": {
+                    "name": "find_tasks",
+                    "description": "Find the user's tasks by approximate title (typos allowed). Returns the best matches with their database IDs and a score from 0 to 1",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "user_id": {"type": "string", "description": "The user ID"},
+                            "query": {"type": "string", "description": "The task name as the user wrote it, e.g. 'grocry'"},
+                            "limit": {"type": "integer", "description": "Maximum number of matches (default 5)"}
+                        },
+                        "required": ["user_id", "query"]
+                    }
+                }
+            },
             {
                 "type": "function",
                 "function": {
@@ -246,10 +262,12 @@ class TodoAIChatbot:
                 - Step 2: Identify that the first task in the list has database ID X
                 - Step 3: Call update_task with task_id: X and completed: true
                 This sequence is mandatory. Never skip step 1 or step 2.
+                When a user refers to a task by name (like "finish the grocery task"), call find_tasks with that name instead of list_tasks,
+                then use the database ID of the best match. If there is no match, or several matches score about the same, ask the user which task they mean.
                 If a user asks to list tasks, use the list_tasks function with the correct user ID.
                 If a user asks to create a task, use the create_task function with the correct user ID.
-                If a user asks to update a task, first call list_tasks to identify the correct database ID, then use the update_task function with the correct user ID and database ID.
-                If a user asks to delete a task, first call list_tasks to identify the correct database ID, then use the delete_task function with the correct user ID and database ID.
+                If a user asks to update a task, first call find_tasks (by name) or list_tasks (by position) to identify the correct database ID, then use the update_task function with the correct user ID and database ID.
+                If a user asks to delete a task, first call find_tasks (by name) or list_tasks (by position) to identify the correct database ID, then use the delete_task function with the correct user ID and database ID.
                 If a user asks about categories, use the appropriate category functions with the correct user ID.
                 If a user asks about tags, use the appropriate tag functions with the correct user ID."""
             }
@@ -316,6 +334,12 @@ class TodoAIChatbot:
                         if function_name == "list_tasks":
                             response = await client.get(f"{self.backend_url}/api/{function_args['user_id']}/tasks")
                             result = response.json() if response.status_code == 200 else {"error": f"HTTP {response.status_code}: {response.text}"}
+                        elif function_name == "find_tasks":
+                            response = await client.get(
+                                f"{self.backend_url}/api/{function_args['user_id']}/tasks/fuzzy",
+                                params={"q": function_args["query"], "limit": function_args.get("limit", 5)}
+                            )
+                            result = response.json() if response.status_code == 200 else {"error": f"HTTP {response.status_code}: {response.text}"}
                         elif function_name == "create_task":
                             response = await client.post(
                                 f"{self.backend_url}/api/{function_args['user_id']}/tasks",